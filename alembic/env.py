@@ -15,7 +15,7 @@ from sqlmodel import SQLModel
 # MUST import all models to register them in SQLModel.metadata before autogenerate
 from ingot.db.models import (  # noqa: F401
     UserProfile, Lead, LeadContact, IntelBrief, Match, Email, FollowUp,
-    Campaign, AgentLog, Venue, OutreachMetric, UnsubscribedEmail,
+    Campaign, AgentLog, Venue, OutreachMetric, UnsubscribedEmail, CompanyFeature,
 )
 
 config = context.config
@@ -0,0 +1,35 @@
+"""add CompanyFeature table
+
+Revision ID: c7d1e9f0a2b3
+Revises: a3f2e1d4b5c6
+Create Date: 2026-10-17
+
+Adds DB-12: CompanyFeature — cached profile-independent scoring features
+(stage score, tag bonus, tech terms, lowercased one_liner, isHiring) keyed by
+a sha256 content hash of the venue company record.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c7d1e9f0a2b3"
+down_revision = "a3f2e1d4b5c6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "companyfeature",
+        sa.Column("content_hash", sa.String(), nullable=False),
+        sa.Column("stage_score", sa.Float(), nullable=False),
+        sa.Column("tag_bonus", sa.Float(), nullable=False),
+        sa.Column("tech_terms", sa.JSON(), nullable=False),
+        sa.Column("one_liner", sa.String(), nullable=False),
+        sa.Column("is_hiring", sa.Boolean(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("companyfeature")
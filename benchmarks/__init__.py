@@ -0,0 +1,6 @@
+"""Throughput benchmarks for INGOT hot paths. Not part of the installed package.
+
+Run from the repository root, e.g.::
+
+    python -m benchmarks.bench_scoring --sizes 1000 10000
+"""
@@ -0,0 +1,128 @@
+"""
+Offline discovery benchmark: fetch + parse + score against a yc-oss stand-in.
+
+Serves synthetic (and, if present, recorded) feeds from benchmarks.ycoss with
+configurable latency and bandwidth, then times the discovery paths end to end:
+
+  - fetch_yc_companies + score_leads        (materialised resp.json())
+  - fetch_yc_companies, VenueCache warm     (conditional GET → 304, body from disk)
+  - iter_yc_companies + top_k_leads_async   (streaming parse, scoring overlaps download)
+  - fetch_yc_many over every batch feed     (bounded concurrent fan-out + dedupe)
+
+Usage::
+
+    python -m benchmarks.bench_discovery                          # 1k, 10k + fixture
+    python -m benchmarks.bench_discovery --latency 0.05 --bandwidth 20e6 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.bench_scoring import RESUME, SKILLS, BenchResult, _print_table, _run
+from benchmarks.corpus import DEFAULT_FIXTURE, load_fixture, scale_companies, synthetic_companies
+from benchmarks.ycoss import YCOSSStandIn
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.scorer import score_leads
+from ingot.scoring.topk import top_k_leads_async
+from ingot.venues.cache import VenueCache
+from ingot.venues.yc import fetch_yc_companies, fetch_yc_many, iter_yc_companies
+
+
+def _cases(
+    companies: Sequence[dict], latency: float, bandwidth: float | None, cache_dir: Path
+) -> list[tuple[str, int, Callable[[], object]]]:
+    """(case name, companies processed, zero-arg callable) for every discovery path."""
+    server = YCOSSStandIn(companies, latency=latency, bytes_per_sec=bandwidth)
+    batches = [path.rsplit("/", 1)[1][: -len(".json")] for path in server.feed_sizes if "/batches/" in path]
+    cache = VenueCache(cache_dir)
+    corpus = CorpusModel.fit(companies)  # stands in for the persisted model refresh_corpus() keeps
+
+    async def fetch_and_score() -> None:
+        async with server.client() as client:
+            score_leads(await fetch_yc_companies(client), SKILLS, RESUME)
+
+    async def cached_fetch() -> None:
+        async with server.client() as client:
+            await fetch_yc_companies(client, cache=cache)
+
+    async def stream_top_k() -> None:
+        async with server.client() as client:
+            await top_k_leads_async(iter_yc_companies(client), SKILLS, 50, RESUME, corpus=corpus)
+
+    async def fan_out() -> None:
+        async with server.client() as client:
+            async for _ in fetch_yc_many(client, batches=batches, max_concurrency=8):
+                pass
+
+    asyncio.run(cached_fetch())  # prime the cache so the timed runs revalidate
+    cases = [
+        ("fetch+score_leads", len(companies), lambda: asyncio.run(fetch_and_score())),
+        ("fetch[cache 304]", len(companies), lambda: asyncio.run(cached_fetch())),
+        ("stream+top_k_async[k=50]", len(companies), lambda: asyncio.run(stream_top_k())),
+    ]
+    if batches:
+        fanned = sum(server.feed_sizes[f"/api/batches/{b}.json"] for b in batches)
+        cases.append((f"fetch_yc_many[{len(batches)} batches]", fanned, lambda: asyncio.run(fan_out())))
+    return cases
+
+
+def run_benchmarks(
+    corpora: dict[str, Sequence[dict]],
+    latency: float = 0.0,
+    bandwidth: float | None = None,
+    memory: bool = True,
+) -> list[BenchResult]:
+    """Run every discovery case over every named corpus."""
+    results: list[BenchResult] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for corpus_name, companies in corpora.items():
+            for case, n, fn in _cases(companies, latency, bandwidth, Path(tmp) / corpus_name):
+                seconds, peak = _run(fn, memory)
+                results.append(
+                    BenchResult(
+                        case=case,
+                        corpus=corpus_name,
+                        companies=n,
+                        seconds=seconds,
+                        companies_per_sec=n / seconds if seconds > 0 else float("inf"),
+                        peak_mib=peak,
+                    )
+                )
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000])
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Recorded all.json to include")
+    parser.add_argument("--scale-fixture", type=int, default=0, help="Also serve the fixture scaled to N companies")
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-request latency in seconds")
+    parser.add_argument("--bandwidth", type=float, default=None, help="Response bytes/sec (default: unthrottled)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced peak-memory run")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    # fetch_yc_companies rejects feeds of <= 100 companies as suspicious
+    corpora: dict[str, Sequence[dict]] = {f"synthetic-{n}": synthetic_companies(max(n, 101)) for n in args.sizes}
+    recorded = load_fixture(args.fixture)
+    if recorded is not None:
+        corpora[f"recorded-{len(recorded)}"] = recorded
+        if args.scale_fixture:
+            corpora[f"recorded-x{args.scale_fixture}"] = scale_companies(recorded, args.scale_fixture)
+
+    results = run_benchmarks(corpora, args.latency, args.bandwidth, memory=not args.no_memory)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Scorer throughput benchmark.
+
+Times score_lead(), each component function, and the batch paths
+(score_leads, corpus-backed scoring, top_k_leads, score_leads_multi,
+score_leads_parallel) over synthetic 1k/10k/100k corpora and, if present,
+the recorded yc-oss fixture. Reports companies/sec and peak traced memory.
+
+Usage::
+
+    python -m benchmarks.bench_scoring                       # 1k, 10k, 100k + fixture
+    python -m benchmarks.bench_scoring --sizes 1000 --json   # machine-readable
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.corpus import DEFAULT_FIXTURE, load_fixture, synthetic_companies
+from ingot.models.schemas import UserProfile
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.parallel import score_leads_parallel
+from ingot.scoring.scorer import (
+    _job_keyword_score,
+    _semantic_score,
+    _stack_domain_score,
+    _stage_score,
+    score_lead,
+    score_leads,
+    score_leads_multi,
+)
+from ingot.scoring.topk import top_k_leads
+
+SKILLS = ["Python", "Rust", "Kubernetes", "PostgreSQL", "GraphQL", "React", "TypeScript", "AWS"]
+RESUME = (
+    "Backend engineer with eight years of Python and Rust, building data infrastructure, "
+    "GraphQL APIs and Kubernetes platforms on AWS for developer tools companies."
+)
+PROFILES = [
+    UserProfile(name="backend", skills=SKILLS, resume_raw_text=RESUME),
+    UserProfile(name="mobile", skills=["Swift", "iOS", "Android", "Kotlin"], resume_raw_text="Mobile engineer, iOS."),
+    UserProfile(name="ml", skills=["Python", "LLM", "GPU"], resume_raw_text="ML engineer training LLM models on GPU."),
+    UserProfile(name="fintech", skills=["Go", "Kafka"], resume_raw_text="Payments and billing systems in Go."),
+]
+
+
+@dataclass
+class BenchResult:
+    """Timing and memory for one benchmark case."""
+    case: str
+    corpus: str
+    companies: int
+    seconds: float
+    companies_per_sec: float
+    peak_mib: float | None
+
+
+def _run(fn: Callable[[], object], memory: bool) -> tuple[float, float | None]:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        # Separate traced run: tracemalloc slows allocation-heavy code noticeably
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def _cases(companies: Sequence[dict], single_limit: int) -> list[tuple[str, int, Callable[[], object]]]:
+    """(case name, companies processed, zero-arg callable) for every benchmarked path."""
+    sample = companies[:single_limit]
+    corpus = CorpusModel.fit(companies)
+
+    def per_company(fn: Callable[[dict], object]) -> Callable[[], object]:
+        return lambda: [fn(c) for c in sample]
+
+    return [
+        ("score_lead", len(sample), per_company(lambda c: score_lead(c, SKILLS, RESUME))),
+        ("_stack_domain_score", len(sample), per_company(lambda c: _stack_domain_score(c, SKILLS))),
+        ("_stage_score", len(sample), per_company(_stage_score)),
+        ("_job_keyword_score", len(sample), per_company(lambda c: _job_keyword_score(c, SKILLS))),
+        ("_semantic_score", len(sample), per_company(lambda c: _semantic_score(c, RESUME))),
+        ("score_leads", len(companies), lambda: score_leads(companies, SKILLS, RESUME)),
+        ("score_leads[corpus]", len(companies), lambda: score_leads(companies, SKILLS, RESUME, corpus=corpus)),
+        ("top_k_leads[k=50]", len(companies), lambda: top_k_leads(iter(companies), SKILLS, 50, RESUME, corpus=corpus)),
+        (f"score_leads_multi[P={len(PROFILES)}]", len(companies), lambda: score_leads_multi(companies, PROFILES)),
+        (
+            "score_leads_parallel",
+            len(companies),
+            lambda: asyncio.run(score_leads_parallel(companies, SKILLS, RESUME, corpus=corpus)),
+        ),
+    ]
+
+
+def run_benchmarks(
+    corpora: dict[str, Sequence[dict]], single_limit: int = 2_000, memory: bool = True
+) -> list[BenchResult]:
+    """Run every case over every named corpus."""
+    results: list[BenchResult] = []
+    for corpus_name, companies in corpora.items():
+        for case, n, fn in _cases(companies, single_limit):
+            seconds, peak = _run(fn, memory)
+            results.append(
+                BenchResult(
+                    case=case,
+                    corpus=corpus_name,
+                    companies=n,
+                    seconds=seconds,
+                    companies_per_sec=n / seconds if seconds > 0 else float("inf"),
+                    peak_mib=peak,
+                )
+            )
+    return results
+
+
+def _print_table(results: list[BenchResult]) -> None:
+    header = f"{'corpus':<20}{'case':<30}{'n':>9}{'seconds':>11}{'companies/s':>14}{'peak MiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        peak = f"{r.peak_mib:.1f}" if r.peak_mib is not None else "-"
+        print(f"{r.corpus:<20}{r.case:<30}{r.companies:>9}{r.seconds:>11.4f}{r.companies_per_sec:>14,.0f}{peak:>10}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Recorded all.json to include")
+    parser.add_argument("--single-limit", type=int, default=2_000, help="Cap for per-company (non-batch) cases")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced peak-memory run")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    corpora: dict[str, Sequence[dict]] = {f"synthetic-{n}": synthetic_companies(n) for n in args.sizes}
+    recorded = load_fixture(args.fixture)
+    if recorded is not None:
+        corpora[f"recorded-{len(recorded)}"] = recorded
+
+    results = run_benchmarks(corpora, single_limit=args.single_limit, memory=not args.no_memory)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
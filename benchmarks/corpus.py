@@ -0,0 +1,77 @@
+"""Benchmark corpora: synthetic yc-oss-shaped company dicts and recorded feed fixtures."""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+# Vocabulary loosely modelled on yc-oss one_liner / long_description text
+_TECH = [
+    "Python", "Rust", "Go", "TypeScript", "React", "Kubernetes", "PostgreSQL", "GraphQL",
+    "API", "SDK", "LLM", "AWS", "GPU", "Terraform", "Kafka", "Postgres", "iOS", "Android",
+]
+_WORDS = [
+    "platform", "developers", "teams", "data", "infrastructure", "payments", "automation",
+    "healthcare", "security", "analytics", "customers", "workflow", "open", "source", "cloud",
+    "models", "agents", "compliance", "billing", "logistics", "insurance", "marketplace",
+]
+_TAGS = ["B2B", "SaaS", "Developer Tools", "Fintech", "AI", "Consumer", "Healthcare", "Infrastructure"]
+_INDUSTRIES = ["B2B", "Consumer", "Fintech", "Healthcare", "Industrials", "Education"]
+_STAGES = ["Early", "Seed", "Series A", "Series B", "Growth", "Public", "Acquired", ""]
+_SEASONS = ["Winter", "Summer", "Fall", "Spring"]
+
+DEFAULT_FIXTURE = Path(__file__).parent / "fixtures" / "yc_all.json"
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    words = [rng.choice(_TECH) if rng.random() < 0.2 else rng.choice(_WORDS) for _ in range(length)]
+    return " ".join(words).capitalize() + "."
+
+
+def synthetic_company(i: int, rng: random.Random) -> dict:
+    """One company dict with the yc-oss field set used by Scout and the scorer."""
+    name = f"Company{i}"
+    return {
+        "id": i,
+        "name": name,
+        "slug": name.lower(),
+        "website": f"https://{name.lower()}.example.com",
+        "one_liner": _sentence(rng, rng.randint(5, 12)),
+        "long_description": " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(2, 8))),
+        "team_size": rng.randint(1, 500),
+        "industry": rng.choice(_INDUSTRIES),
+        "industries": rng.sample(_INDUSTRIES, 2),
+        "tags": rng.sample(_TAGS, rng.randint(0, 3)),
+        "batch": f"{rng.choice(_SEASONS)} {rng.randint(2010, 2025)}",
+        "stage": rng.choice(_STAGES),
+        "status": "Active",
+        "isHiring": rng.random() < 0.3,
+    }
+
+
+def synthetic_companies(n: int, seed: int = 0) -> list[dict]:
+    """``n`` deterministic synthetic company dicts."""
+    rng = random.Random(seed)
+    return [synthetic_company(i, rng) for i in range(n)]
+
+
+def scale_companies(companies: list[dict], n: int) -> list[dict]:
+    """Repeat a recorded feed up to ``n`` companies, giving each copy a fresh id and slug."""
+    if not companies:
+        return []
+    base_id = max(int(c.get("id") or 0) for c in companies) + 1
+    scaled = []
+    for i in range(n):
+        company = companies[i % len(companies)]
+        copy = i // len(companies)
+        if copy:
+            company = {**company, "id": base_id * copy + i, "slug": f"{company.get('slug', '')}-{copy}"}
+        scaled.append(company)
+    return scaled
+
+
+def load_fixture(path: Path = DEFAULT_FIXTURE) -> list[dict] | None:
+    """Load a recorded yc-oss ``companies/all.json`` fixture, or None if it is not present."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,107 @@
+"""
+Offline stand-in for the yc-oss API.
+
+YCOSSStandIn serves companies/all.json plus every batches/<slug>.json and
+industries/<slug>.json view of a company list through an httpx.MockTransport,
+so fetch_yc_companies(), iter_yc_companies() and Scout can be exercised and
+benchmarked with no network. Latency, bandwidth, per-path status codes and
+ETag / 304 behaviour are configurable; request and byte counters are kept.
+
+Usage::
+
+    server = YCOSSStandIn(synthetic_companies(10_000), latency=0.05, bytes_per_sec=20e6)
+    async with server.client() as client:
+        companies = await fetch_yc_companies(client)
+    server.requests, server.bytes_sent
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Sequence
+
+import httpx
+
+from ingot.venues.catalogue import slugify
+
+API_PREFIX = "/api"
+
+
+class YCOSSStandIn:
+    """In-process yc-oss API over httpx.MockTransport."""
+
+    def __init__(
+        self,
+        companies: Sequence[dict],
+        latency: float = 0.0,
+        bytes_per_sec: float | None = None,
+        chunk_size: int = 64 * 1024,
+        status_overrides: dict[str, int] | None = None,
+        etags: bool = True,
+    ) -> None:
+        self.latency = latency
+        self.bytes_per_sec = bytes_per_sec
+        self.chunk_size = chunk_size
+        self.status_overrides = dict(status_overrides or {})
+        self.etags = etags
+        self.requests = 0
+        self.bytes_sent = 0
+        self.statuses: Counter[int] = Counter()
+
+        views: dict[str, list[dict]] = defaultdict(list)
+        for company in companies:
+            if company.get("batch"):
+                views[f"{API_PREFIX}/batches/{slugify(company['batch'])}.json"].append(company)
+            for industry in {company.get("industry"), *(company.get("industries") or ())} - {None, ""}:
+                views[f"{API_PREFIX}/industries/{slugify(industry)}.json"].append(company)
+        views[f"{API_PREFIX}/companies/all.json"] = list(companies)
+        self.feeds = {path: json.dumps(feed).encode("utf-8") for path, feed in views.items()}
+        self.feed_sizes = {path: len(feed) for path, feed in views.items()}
+
+    def paths(self) -> list[str]:
+        """Every served feed path, e.g. /api/batches/winter-2025.json."""
+        return sorted(self.feeds)
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+    async def _body(self, body: bytes) -> AsyncIterator[bytes]:
+        for start in range(0, len(body), self.chunk_size):
+            chunk = body[start:start + self.chunk_size]
+            if self.bytes_per_sec:
+                await asyncio.sleep(len(chunk) / self.bytes_per_sec)
+            self.bytes_sent += len(chunk)
+            yield chunk
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path
+        status = self.status_overrides.get(path)
+        body = self.feeds.get(path)
+        if status is None:
+            status = 404 if body is None else 200
+        if status != 200 or body is None:
+            self.statuses[status] += 1
+            return httpx.Response(status)
+
+        headers = {"Content-Type": "application/json", "Content-Length": str(len(body))}
+        if self.etags:
+            etag = self._etag(body)
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                self.statuses[304] += 1
+                return httpx.Response(304, headers={"ETag": etag})
+        self.statuses[200] += 1
+        return httpx.Response(200, headers=headers, content=self._body(body))
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, **kwargs: object) -> httpx.AsyncClient:
+        """AsyncClient wired to this stand-in."""
+        return httpx.AsyncClient(transport=self.transport(), **kwargs)
@@ -1,4 +1,4 @@
-"""All 11 SQLModel table models for INGOT.
+"""All 12 SQLModel table models for INGOT.
 
 Import this module (or individual models) to register them in SQLModel.metadata
 before calling create_all() or running Alembic autogenerate.
@@ -257,3 +257,18 @@ class UnsubscribedEmail(SQLModel, table=True):
     email_address: str = Field(index=True)
     unsubscribe_reason: str = ""
     unsubscribed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class CompanyFeature(SQLModel, table=True):
+    """DB-12 — Cached profile-independent scoring features for a venue company.
+
+    Keyed by a content hash of the raw company record, so an edited record gets
+    a fresh row and stale rows are simply never looked up again.
+    """
+    content_hash: str = Field(primary_key=True)
+    stage_score: float
+    tag_bonus: float
+    tech_terms: list[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    one_liner: str = ""
+    is_hiring: bool = False
+    created_at: datetime = Field(default_factory=datetime.utcnow)
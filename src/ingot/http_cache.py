@@ -0,0 +1,280 @@
+"""
+Persistent HTTP response cache for the shared client.
+
+Research refetches the same homepages, About pages and blog posts for every
+lead and on every rerun. CacheTransport sits in front of the network transport
+and implements the private-cache subset of RFC 9111 that matters here:
+
+  - freshness from Cache-Control max-age, then Expires, then an optional forced
+    TTL for pages that send no caching headers, then the 10%-of-Last-Modified
+    heuristic (capped at one day); the Age header is subtracted
+  - no-store (request or response) bypasses the cache; no-cache responses are
+    stored but revalidated every time; Vary: * is never stored
+  - stale entries with an ETag / Last-Modified are revalidated with
+    If-None-Match / If-Modified-Since and a 304 refreshes them in place
+  - Vary'd request headers are recorded and must match on lookup
+
+Entries live in one SQLite file (default ~/.ingot/http_cache.db) with zlib-
+compressed raw bodies, and are evicted least-recently-used once the total body
+size exceeds ``max_bytes``. Only GET responses with cacheable status codes are
+stored; requests carrying Authorization, or their own If-None-Match /
+If-Modified-Since, pass straight through. Requests marked with the
+STREAMING_EXTENSION extension are answered from the cache when possible, but a
+miss is streamed to the caller unbuffered and not stored.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+# Request extension marking a body the caller will read incrementally and may
+# abandon early (e.g. http_text.fetch_text); such responses are never buffered.
+STREAMING_EXTENSION = "ingot.streaming"
+
+_CACHEABLE_STATUS = frozenset({200, 203, 300, 301, 308, 404, 410})
+_HEURISTIC_MAX = 86_400.0
+_DEFAULT_MAX_BYTES = 256 * 2**20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entry (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    vary TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entry_last_access ON entry (last_access);
+"""
+
+
+def default_http_cache_path(base_dir: Path | None = None) -> Path:
+    """Return the HTTP cache database path under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "http_cache.db"
+
+
+def parse_cache_control(value: str) -> dict[str, str | bool]:
+    """'max-age=60, no-cache' → {"max-age": "60", "no-cache": True}."""
+    directives: dict[str, str | bool] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') if arg else True
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value: str | bool | None) -> int | None:
+    try:
+        return int(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers, now: float, default_ttl: float | None = None) -> float:
+    """Seconds a response with ``headers`` stays fresh once received (may be <= 0)."""
+    cc = parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-cache" in cc:
+        return 0.0
+    age = _int(headers.get("Age")) or 0
+    max_age = _int(cc.get("max-age"))
+    if max_age is not None:
+        return max_age - age
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _http_date(expires)
+        date = _http_date(headers.get("Date")) or now
+        return (expires_at - date - age) if expires_at is not None else 0.0
+    if default_ttl is not None:
+        return default_ttl - age
+    last_modified = _http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        date = _http_date(headers.get("Date")) or now
+        return min(max(date - last_modified, 0.0) * 0.1, _HEURISTIC_MAX) - age
+    return 0.0
+
+
+class CacheTransport(httpx.AsyncBaseTransport):
+    """
+    Caching transport wrapper backed by a size-bounded SQLite store.
+
+    Counters: ``hits`` (served fresh from disk), ``revalidations`` (304 turned
+    into a cached response), ``misses`` (went to the network), ``evictions``.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        path: Path | str = ":memory:",
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        default_ttl: float | None = None,
+    ) -> None:
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._transport = transport
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(request: httpx.Request) -> str:
+        return f"{request.method} {request.url}"
+
+    def _lookup(self, request: httpx.Request) -> tuple | None:
+        row = self._conn.execute(
+            "SELECT status, headers, vary, body, fresh_until FROM entry WHERE key = ?", (self._key(request),)
+        ).fetchone()
+        if row is None:
+            return None
+        vary = json.loads(row[2])
+        if any(request.headers.get(name) != value for name, value in vary.items()):
+            return None
+        return row
+
+    def _store(self, request: httpx.Request, response: httpx.Response, raw: bytes, now: float) -> None:
+        vary_names = [v.strip().lower() for v in response.headers.get("Vary", "").split(",") if v.strip()]
+        vary = {name: request.headers.get(name) for name in vary_names}
+        body = zlib.compress(raw)
+        lifetime = freshness_lifetime(response.headers, now, self.default_ttl)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entry VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(request),
+                    response.status_code,
+                    json.dumps(response.headers.multi_items()),
+                    json.dumps(vary),
+                    body,
+                    len(body),
+                    now,
+                    now + lifetime,
+                    now,
+                ),
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT coalesce(sum(size), 0) FROM entry").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        with self._conn:
+            for key, size in self._conn.execute("SELECT key, size FROM entry ORDER BY last_access").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entry WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def size_bytes(self) -> int:
+        """Total compressed body bytes on disk."""
+        return self._conn.execute("SELECT coalesce(sum(size), 0) FROM entry").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM entry").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _cached_response(self, status: int, headers: list, body: bytes, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status, headers=headers, content=zlib.decompress(body), request=request, extensions={"from_cache": True}
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_cc = parse_cache_control(request.headers.get("Cache-Control", ""))
+        if (
+            request.method != "GET"
+            or "no-store" in request_cc
+            or "authorization" in request.headers
+            # Caller is revalidating its own copy (e.g. VenueCache); let the 304 through untouched
+            or "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return await self._transport.handle_async_request(request)
+
+        now = time.time()
+        cached = self._lookup(request)
+        if cached is not None:
+            status, headers_json, _, body, fresh_until = cached
+            headers = [tuple(h) for h in json.loads(headers_json)]
+            if now < fresh_until and "no-cache" not in request_cc:
+                self.hits += 1
+                with self._conn:
+                    self._conn.execute("UPDATE entry SET last_access = ? WHERE key = ?", (now, self._key(request)))
+                return self._cached_response(status, headers, body, request)
+            stored = httpx.Headers(headers)
+            if "ETag" in stored:
+                request.headers["If-None-Match"] = stored["ETag"]
+            if "Last-Modified" in stored:
+                request.headers["If-Modified-Since"] = stored["Last-Modified"]
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            self.revalidations += 1
+            status, headers_json, _, body, _ = cached
+            merged = httpx.Headers([tuple(h) for h in json.loads(headers_json)])
+            for name, value in response.headers.multi_items():
+                if name.lower() not in ("content-length", "content-encoding", "transfer-encoding"):
+                    merged[name] = value
+            lifetime = freshness_lifetime(merged, now, self.default_ttl)
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE entry SET headers = ?, fresh_until = ?, last_access = ? WHERE key = ?",
+                    (json.dumps(merged.multi_items()), now + lifetime, now, self._key(request)),
+                )
+            return self._cached_response(status, merged.multi_items(), body, request)
+
+        self.misses += 1
+        response_cc = parse_cache_control(response.headers.get("Cache-Control", ""))
+        if (
+            response.status_code not in _CACHEABLE_STATUS
+            or request.extensions.get(STREAMING_EXTENSION)
+            or "no-store" in response_cc
+            or response.headers.get("Vary", "").strip() == "*"
+        ):
+            return response
+        # Store the raw (still content-encoded) bytes; the client decodes them as usual
+        # (iterating .stream rather than aiter_raw() also works for pre-read mock responses)
+        raw = b"".join([chunk async for chunk in response.stream])
+        await response.aclose()
+        self._store(request, response, raw, now)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        self._conn.close()
+        await self._transport.aclose()
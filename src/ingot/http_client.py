@@ -3,13 +3,34 @@ Shared async HTTP client with connection pooling.
 
 All agents use this — never create httpx.AsyncClient() inline.
 One client per process; reused across requests to avoid TCP handshake overhead.
+
+Requests go through a per-host RateLimitTransport, so HttpClientConfig's
+request_delay_seconds is enforced per host: concurrent agents run at full speed
+across different hosts but never hit one host faster than the polite rate.
+With ``cache_path`` set, a persistent CacheTransport (ingot.http_cache) sits in
+front of the limiter, so cache hits are neither throttled nor sent. Outermost,
+CoalescingTransport collapses identical concurrent GETs into one request.
+AdaptiveConcurrencyTransport keeps a per-host AIMD concurrency window, so each
+site settles at the parallelism it tolerates instead of one global guess. It
+sits inside the limiter, so its latency samples time the network call only,
+never the polite-delay sleep.
+
+Transport stack (outer → inner):
+    CoalescingTransport → [CacheTransport] → RateLimitTransport
+        → AdaptiveConcurrencyTransport → AsyncHTTPTransport
 """
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 
 import httpx
 
+from ingot.http_cache import STREAMING_EXTENSION, CacheTransport
+
 _client: httpx.AsyncClient | None = None
 _config_snapshot: "HttpClientConfig | None" = None
 
@@ -24,7 +45,269 @@ class HttpClientConfig:
     max_keepalive_connections: int = 5
     max_connections: int = 10
     timeout_seconds: float = 30.0
-    request_delay_seconds: float = 1.0  # Polite scraping delay
+    request_delay_seconds: float = 1.0  # Polite scraping delay, enforced per host
+    rate_limit_burst: int = 1  # Requests a host may receive back-to-back before the delay applies
+    cache_path: Path | None = None  # Persistent response cache; see http_cache.default_http_cache_path()
+    cache_max_bytes: int = 256 * 2**20
+    cache_default_ttl_seconds: float | None = None  # Forced TTL for responses without caching headers
+    initial_host_concurrency: int = 2  # Starting AIMD window per host; grows up to max_connections
+
+
+class _HostBucket:
+    """Token bucket for one host: refills one token per ``delay`` seconds up to ``burst``."""
+
+    __slots__ = ("lock", "tokens", "updated_at")
+
+    def __init__(self, burst: int) -> None:
+        self.lock = asyncio.Lock()
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper enforcing a per-host request rate.
+
+    Each host gets a token bucket of ``burst`` tokens refilled every ``delay``
+    seconds; with burst=1 this is a plain minimum interval between requests to
+    the same host. Requests to different hosts never wait on each other.
+    ``waited_seconds`` accumulates the total time spent throttled.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, delay: float, burst: int = 1) -> None:
+        if delay < 0 or burst < 1:
+            raise ValueError(f"Invalid rate limit: delay={delay}, burst={burst}")
+        self._transport = transport
+        self.delay = delay
+        self.burst = burst
+        self._buckets: dict[str, _HostBucket] = {}
+        self.waited_seconds = 0.0
+
+    async def _acquire(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket(self.burst)
+        async with bucket.lock:
+            now = time.monotonic()
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) / self.delay)
+            bucket.updated_at = now
+            if bucket.tokens < 1.0:
+                wait = (1.0 - bucket.tokens) * self.delay
+                await asyncio.sleep(wait)
+                self.waited_seconds += wait
+                bucket.tokens = 1.0
+                bucket.updated_at = time.monotonic()
+            bucket.tokens -= 1.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.delay > 0:
+            await self._acquire(request.url.host)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Retry-After as seconds from now (delta-seconds or HTTP-date form)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostWindow:
+    """AIMD state for one host."""
+
+    __slots__ = ("cond", "window", "in_flight", "latency", "blocked_until")
+
+    def __init__(self, window: float) -> None:
+        self.cond = asyncio.Condition()
+        self.window = window
+        self.in_flight = 0
+        self.latency: float | None = None  # EWMA of successful response latency
+        self.blocked_until = 0.0
+
+
+class AdaptiveConcurrencyTransport(httpx.AsyncBaseTransport):
+    """
+    Per-host concurrency window with additive increase / multiplicative decrease.
+
+    Each host starts at ``initial`` concurrent requests. A fast success grows
+    the window by 1/window (about +1 per window's worth of successes); a 429 or
+    503, a transport error, or latency above ``latency_factor`` × the host's
+    running average multiplies it by ``decrease``. Retry-After on 429/503
+    holds back every further request to that host until it expires. The
+    429/503 response itself is returned to the caller, not retried here.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 10,
+        decrease: float = 0.5,
+        latency_factor: float = 2.0,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum or not 0 < decrease < 1:
+            raise ValueError(f"Invalid AIMD settings: {minimum=} {initial=} {maximum=} {decrease=}")
+        self._transport = transport
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self._hosts: dict[str, _HostWindow] = {}
+
+    def window(self, host: str) -> float:
+        """Current concurrency window for ``host``."""
+        state = self._hosts.get(host)
+        return state.window if state is not None else float(self.initial)
+
+    async def _acquire(self, state: _HostWindow) -> None:
+        while True:
+            delay = state.blocked_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            async with state.cond:
+                if state.in_flight < int(state.window):
+                    state.in_flight += 1
+                    return
+                await state.cond.wait()
+
+    async def _release(self, state: _HostWindow) -> None:
+        async with state.cond:
+            state.in_flight -= 1
+            state.cond.notify_all()
+
+    def _shrink(self, state: _HostWindow) -> None:
+        state.window = max(float(self.minimum), state.window * self.decrease)
+
+    def _observe(self, state: _HostWindow, response: httpx.Response, latency: float) -> None:
+        if response.status_code in (429, 503):
+            self._shrink(state)
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            if retry_after:
+                state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after)
+            return
+        if response.status_code >= 500:
+            return
+        if state.latency is not None and latency > self.latency_factor * state.latency:
+            self._shrink(state)
+        else:
+            state.window = min(float(self.maximum), state.window + 1.0 / state.window)
+        state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostWindow(float(self.initial))
+        await self._acquire(state)
+        start = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            if isinstance(exc, httpx.TransportError):
+                self._shrink(state)
+            await self._release(state)
+            raise
+        self._observe(state, response, time.monotonic() - start)
+        # The slot stays taken until the body has been consumed and closed
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, lambda: self._release(state)),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body wrapper that runs ``release`` once, when the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                await self._release()
+
+
+class CoalescingTransport(httpx.AsyncBaseTransport):
+    """
+    Single-flight transport wrapper: identical concurrent GETs share one request.
+
+    Requests are identical when method, URL and headers all match. The first
+    caller's request runs in its own task (so cancelling that caller does not
+    fail the others); its response body is buffered and every waiter gets an
+    independent Response built from it. Errors propagate to all waiters.
+    Requests marked with http_cache.STREAMING_EXTENSION are not coalesced, since
+    buffering would defeat reading only part of the body. ``coalesced`` counts
+    requests that were answered without a network call.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _key(request: httpx.Request) -> tuple:
+        return (request.method, str(request.url), tuple(sorted(request.headers.multi_items())))
+
+    async def _fetch(self, request: httpx.Request) -> tuple[int, list[tuple[str, str]], bytes, dict]:
+        response = await self._transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return response.status_code, response.headers.multi_items(), raw, dict(response.extensions)
+
+    def _finished(self, key: tuple, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved: every waiter may have been cancelled
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or request.extensions.get(STREAMING_EXTENSION):
+            return await self._transport.handle_async_request(request)
+        self.requests += 1
+        key = self._key(request)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(request))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        status, headers, raw, extensions = await asyncio.shield(task)
+        return httpx.Response(status, headers=headers, content=raw, request=request, extensions=extensions)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 def get_http_client(config: HttpClientConfig | None = None) -> httpx.AsyncClient:
@@ -42,11 +325,27 @@ def get_http_client(config: HttpClientConfig | None = None) -> httpx.AsyncClient
     effective = _config_snapshot or HttpClientConfig()
 
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(
+        transport = httpx.AsyncHTTPTransport(
             limits=httpx.Limits(
                 max_keepalive_connections=effective.max_keepalive_connections,
                 max_connections=effective.max_connections,
             ),
+        )
+        transport = AdaptiveConcurrencyTransport(
+            transport,
+            initial=min(effective.initial_host_concurrency, effective.max_connections),
+            maximum=effective.max_connections,
+        )
+        transport = RateLimitTransport(transport, effective.request_delay_seconds, effective.rate_limit_burst)
+        if effective.cache_path is not None:
+            transport = CacheTransport(
+                transport,
+                effective.cache_path,
+                max_bytes=effective.cache_max_bytes,
+                default_ttl=effective.cache_default_ttl_seconds,
+            )
+        _client = httpx.AsyncClient(
+            transport=CoalescingTransport(transport),
             timeout=httpx.Timeout(effective.timeout_seconds),
             headers={
                 "User-Agent": _DEFAULT_USER_AGENT,
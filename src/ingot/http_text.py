@@ -0,0 +1,175 @@
+"""
+Streaming page-to-text fetch for Research.
+
+Research needs a page's visible text and a handful of meta tags, not the full
+document. fetch_text() streams the body from the shared client into lxml's
+incremental HTML parser (feed interface with a callback target, so no tree is
+built), keeps only text outside script/style/template-like elements, and stops
+reading as soon as ``stop_after`` characters of text or ``max_bytes`` of body
+have been seen. The connection is closed at that point, so the rest of a
+multi-MB page is never downloaded.
+
+The request is marked with http_cache.STREAMING_EXTENSION so the coalescing
+and cache layers of the shared client do not buffer the whole body first.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+import httpx
+from lxml import etree
+
+from ingot.http_cache import STREAMING_EXTENSION
+from ingot.http_client import get_http_client
+
+_DEFAULT_MAX_BYTES = 2 * 2**20
+_DEFAULT_STOP_AFTER = 20_000
+
+# Elements whose content is never visible text
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "svg", "canvas", "iframe", "object", "head"})
+# Elements that start a new line of text
+_BLOCK_TAGS = frozenset({
+    "p", "div", "br", "li", "ul", "ol", "tr", "td", "th", "table", "section", "article", "header", "footer",
+    "nav", "aside", "main", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "hr", "dt", "dd", "figcaption",
+})
+# <meta name=... / property=...> values worth keeping for the LLM
+_META_KEYS = frozenset({
+    "description", "keywords", "author", "og:title", "og:description", "og:site_name", "og:type",
+    "twitter:title", "twitter:description",
+})
+_SPACES_RE = re.compile(r"[ \t\r\f\v ]+")
+
+
+@dataclass
+class PageText:
+    """Cleaned text and metadata extracted from one page."""
+    url: str
+    status_code: int
+    title: str = ""
+    meta: dict[str, str] = field(default_factory=dict)
+    text: str = ""
+    bytes_read: int = 0
+    truncated: bool = False  # stopped at max_bytes / stop_after before the end of the page
+
+
+class _TextCollector:
+    """lxml parser target: receives start/end/data events as the HTML is fed."""
+
+    def __init__(self) -> None:
+        self.title_parts: list[str] = []
+        self.meta: dict[str, str] = {}
+        self.parts: list[str] = []
+        self.chars = 0
+        self._skip_depth = 0
+        self._in_title = False
+
+    def start(self, tag: str, attrib: dict) -> None:
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag == "meta":
+            key = (attrib.get("name") or attrib.get("property") or "").lower()
+            if key in _META_KEYS and attrib.get("content"):
+                self.meta.setdefault(key, attrib["content"].strip())
+            return
+        if tag == "title":
+            self._in_title = True
+            return
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag == "title":
+            self._in_title = False
+        elif tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def data(self, text: str) -> None:
+        if self._in_title:
+            self.title_parts.append(text)
+        elif not self._skip_depth:
+            self.parts.append(text)
+            self.chars += len(text.strip())
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> None:
+        return None
+
+
+def clean_text(raw: str) -> str:
+    """Collapse runs of spaces, drop blank and immediately repeated lines."""
+    lines: list[str] = []
+    for line in raw.splitlines():
+        line = _SPACES_RE.sub(" ", line).strip()
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+async def fetch_text(
+    url: str,
+    max_bytes: int = _DEFAULT_MAX_BYTES,
+    stop_after: int = _DEFAULT_STOP_AFTER,
+    http_client: httpx.AsyncClient | None = None,
+) -> PageText:
+    """
+    GET ``url`` and return its visible text, title and selected meta tags.
+
+    Reading stops after ``max_bytes`` of (decoded) body or once ``stop_after``
+    characters of visible text are collected; ``text`` is then cut to
+    ``stop_after`` characters. text/plain bodies are returned as-is (cleaned);
+    other non-HTML content types yield empty text.
+
+    Raises:
+        httpx.HTTPStatusError for 4xx/5xx responses; httpx.HTTPError on network failure.
+    """
+    client = http_client or get_http_client()
+    async with client.stream("GET", url, extensions={STREAMING_EXTENSION: True}) as resp:
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "text/html").lower()
+        page = PageText(url=str(resp.url), status_code=resp.status_code)
+        is_html = "html" in content_type or "xml" in content_type
+        if not is_html and not content_type.startswith("text/"):
+            return page
+
+        collector = _TextCollector()
+        parser = etree.HTMLParser(target=collector, encoding=resp.charset_encoding) if is_html else None
+        plain: list[bytes] = []
+        full = False  # a limit was reached; truncated only if the body goes on
+        async for chunk in resp.aiter_bytes():
+            if not chunk:
+                continue
+            if full or len(chunk) > max_bytes - page.bytes_read:
+                page.truncated = True
+                chunk = b"" if full else chunk[: max_bytes - page.bytes_read]
+            page.bytes_read += len(chunk)
+            if parser is not None:
+                parser.feed(chunk)
+            else:
+                plain.append(chunk)
+                collector.chars += len(chunk)
+            if page.truncated:
+                break
+            full = page.bytes_read >= max_bytes or collector.chars >= stop_after
+        # Leaving the block closes the response: the rest of the body is never read
+
+    if parser is not None:
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass  # nothing parseable was fed (e.g. an empty body): there is no text
+        raw = "".join(collector.parts)
+    else:
+        raw = b"".join(plain).decode(resp.charset_encoding or "utf-8", errors="replace")
+    page.title = clean_text(" ".join(collector.title_parts)).replace("\n", " ")
+    page.meta = collector.meta
+    text = clean_text(raw)
+    page.truncated = page.truncated or len(text) > stop_after
+    page.text = text[:stop_after]
+    return page
@@ -0,0 +1,302 @@
+"""
+Persistent corpus-level TF-IDF model for the semantic_similarity component.
+
+The per-company scorer fits TF-IDF on a two-document corpus (company + resume),
+so IDF carries almost no information. CorpusModel instead keeps raw term counts
+for the whole venue catalogue plus document frequencies, and applies IDF at
+query time. That makes incremental updates cheap: new companies append rows and
+bump the document-frequency vector — nothing already stored is rewritten.
+
+Terms are hashed (HashingVectorizer), so there is no vocabulary to refit when
+new companies arrive.
+
+On-disk layout (default ~/.ingot/scoring/corpus/):
+    meta.json        — company keys in row order, n_features, nnz (checked on load)
+    df.npy           — document frequency per hashed term
+    tf_data.npy      — CSR term-count matrix (data / indices / indptr)
+    tf_indices.npy
+    tf_indptr.npy
+
+The .npy arrays are loaded with mmap so scoring a resume against every company
+is one sparse mat-vec without reading the whole matrix into memory first.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+_N_FEATURES = 2**18
+_ARRAYS = ("df", "tf_data", "tf_indices", "tf_indptr")
+
+
+def default_corpus_dir(base_dir: Path | None = None) -> Path:
+    """Return the corpus model directory under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "scoring" / "corpus"
+
+
+def company_key(company: dict) -> str:
+    """Stable row key for a company record: yc-oss id, falling back to slug, then name."""
+    key = company.get("id")
+    if key is None or key == "":
+        key = company.get("slug") or company.get("name", "")
+    return str(key)
+
+
+def company_document(company: dict) -> str:
+    """Text used for semantic matching — same field preference as the per-company scorer."""
+    return company.get("long_description", "") or company.get("one_liner", "")
+
+
+def _hashing_vectorizer(n_features: int) -> HashingVectorizer:
+    return HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None, stop_words="english")
+
+
+def term_counts(companies: Iterable[dict], n_features: int = _N_FEATURES) -> sp.csr_matrix:
+    """
+    Hashed term-count rows for each company's document, as stored by CorpusModel.
+
+    Stateless, so shards of a catalogue can be vectorized in separate processes
+    and merged with CorpusModel.from_counts().
+    """
+    docs = [company_document(company) for company in companies]
+    return _hashing_vectorizer(n_features).transform(docs).astype(np.float64).tocsr()
+
+
+class CorpusModel:
+    """
+    Hashed TF-IDF model over a venue catalogue.
+
+    Usage::
+
+        model = CorpusModel.load(path) if (path / "meta.json").exists() else CorpusModel()
+        added = model.update(companies)     # only unseen companies are vectorized
+        model.save(path)
+        sims = model.similarities("resume text ...")   # one score per stored row
+    """
+
+    def __init__(self, n_features: int = _N_FEATURES) -> None:
+        self.n_features = n_features
+        self.keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._tf: sp.csr_matrix = sp.csr_matrix((0, n_features), dtype=np.float64)
+        self._df: np.ndarray = np.zeros(n_features, dtype=np.float64)
+        self._row_norms: np.ndarray | None = None
+        self._vectorizer = _hashing_vectorizer(n_features)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @classmethod
+    def fit(cls, companies: Iterable[dict], n_features: int = _N_FEATURES) -> CorpusModel:
+        """Build a fresh model over ``companies``."""
+        model = cls(n_features=n_features)
+        model.update(companies)
+        return model
+
+    @classmethod
+    def from_counts(cls, keys: Sequence[str], counts: sp.csr_matrix) -> CorpusModel:
+        """
+        Build a model from precomputed term_counts() rows, one per key, in order.
+
+        Unlike update(), every row is kept (a repeated key maps to its first row),
+        so similarities() stays aligned with the list the counts came from.
+        """
+        if counts.shape[0] != len(keys):
+            raise ValueError(f"{counts.shape[0]} count rows for {len(keys)} keys")
+        model = cls(n_features=counts.shape[1])
+        model.keys = list(keys)
+        for row, key in enumerate(model.keys):
+            model._rows.setdefault(key, row)
+        model._tf = counts.tocsr()
+        model._df = np.bincount(model._tf.indices, minlength=model.n_features).astype(np.float64)
+        return model
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def update(self, companies: Iterable[dict]) -> int:
+        """
+        Append companies not yet in the model. Returns the number of rows added.
+
+        Companies already present (by company_key) are left untouched, so this is
+        safe to call with the full feed on every fetch.
+        """
+        new_keys: list[str] = []
+        new_docs: list[str] = []
+        seen: set[str] = set()
+        for company in companies:
+            key = company_key(company)
+            if key in self._rows or key in seen:
+                continue
+            seen.add(key)
+            new_keys.append(key)
+            new_docs.append(company_document(company))
+        if not new_keys:
+            return 0
+
+        counts = self._vectorizer.transform(new_docs).astype(np.float64).tocsr()
+        self._tf = sp.vstack([self._tf, counts], format="csr")
+        self._df = np.asarray(self._df) + np.bincount(counts.indices, minlength=self.n_features)
+        for key in new_keys:
+            self._rows[key] = len(self.keys)
+            self.keys.append(key)
+        self._row_norms = None
+        return len(new_keys)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def idf(self) -> np.ndarray:
+        """Smoothed IDF, identical in form to sklearn's TfidfTransformer(smooth_idf=True)."""
+        n_docs = len(self.keys)
+        return np.log((1.0 + n_docs) / (1.0 + np.asarray(self._df))) + 1.0
+
+    def row_of(self, key: str) -> int | None:
+        """Row index for a company key, or None if the company is not in the model."""
+        return self._rows.get(key)
+
+    def tfidf_matrix(self) -> sp.csr_matrix:
+        """L2-normalised TF-IDF rows for every stored company (rows with no terms stay zero)."""
+        weighted = self._tf.multiply(self.idf()).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0.0] = 1.0
+        return sp.diags(1.0 / norms) @ weighted
+
+    def similarities(self, resume_text: str) -> np.ndarray:
+        """
+        Cosine similarity between ``resume_text`` and every stored company, in row order.
+
+        Cost is one sparse mat-vec over the stored term-count matrix.
+        """
+        return self.similarities_many([resume_text])[:, 0]
+
+    def similarities_many(self, resume_texts: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity of every stored company against each resume, as (rows, P).
+
+        All resumes are scored with one sparse product against the shared company matrix.
+        """
+        n_docs = len(self.keys)
+        out = np.zeros((n_docs, len(resume_texts)), dtype=np.float64)
+        if not n_docs or not any(resume_texts):
+            return out
+        idf = self.idf()
+        queries = self._vectorizer.transform([text or "" for text in resume_texts]).tocsr()
+        # Query side carries idf twice: once for its own tf-idf, once for the company rows'
+        weighted = queries.multiply(idf).tocsr()
+        query_norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        if self._row_norms is None:
+            squared = self._tf.multiply(self._tf)
+            self._row_norms = np.sqrt(squared @ (idf * idf))
+        dots = (self._tf @ weighted.multiply(idf).T.tocsc()).toarray()
+        denom = np.outer(self._row_norms, query_norms)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = np.where(denom > 0, dots / denom, 0.0)
+        return np.minimum(1.0, sims, out=out)
+
+    def scores_for(self, companies: Sequence[dict], resume_text: str) -> np.ndarray:
+        """
+        Similarity scores aligned with ``companies``. Companies not in the model score 0.0.
+
+        Call update() first if the list may contain companies the model has not seen.
+        """
+        return self.scores_for_many(companies, [resume_text])[:, 0]
+
+    def scores_for_many(self, companies: Sequence[dict], resume_texts: Sequence[str]) -> np.ndarray:
+        """(len(companies), P) similarities aligned with ``companies``; unknown companies score 0.0."""
+        sims = self.similarities_many(resume_texts)
+        rows = np.fromiter(
+            (self._rows.get(company_key(c), -1) for c in companies), dtype=np.int64, count=len(companies)
+        )
+        out = np.zeros((len(companies), len(resume_texts)), dtype=np.float64)
+        known = rows >= 0
+        out[known] = sims[rows[known]]
+        return out
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the model to ``path`` (a directory). Each file is replaced atomically."""
+        path.mkdir(parents=True, exist_ok=True)
+        tf = self._tf.tocsr()
+        arrays = {
+            "df": np.asarray(self._df),
+            "tf_data": np.asarray(tf.data),
+            "tf_indices": np.asarray(tf.indices),
+            "tf_indptr": np.asarray(tf.indptr),
+        }
+        for name, arr in arrays.items():
+            tmp_path = path / f"{name}.npy.tmp"
+            with tmp_path.open("wb") as fh:
+                np.save(fh, arr)
+            tmp_path.replace(path / f"{name}.npy")
+        # meta.json last: load() checks the arrays against its row and nonzero counts,
+        # so a save interrupted before this point is detected rather than misread
+        tmp_meta = path / "meta.json.tmp"
+        tmp_meta.write_text(
+            json.dumps({"n_features": self.n_features, "nnz": int(tf.nnz), "keys": self.keys}), encoding="utf-8"
+        )
+        tmp_meta.replace(path / "meta.json")
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> CorpusModel:
+        """
+        Load a saved model. With ``mmap=True`` the arrays are memory-mapped read-only.
+
+        Raises:
+            ValueError if the arrays do not match meta.json (e.g. a save was interrupted).
+        """
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        model = cls(n_features=meta["n_features"])
+        mode = "r" if mmap else None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in _ARRAYS}
+        indptr, nnz = arrays["tf_indptr"], len(arrays["tf_data"])
+        if (
+            len(indptr) != len(meta["keys"]) + 1
+            or int(indptr[-1]) != nnz
+            or len(arrays["tf_indices"]) != nnz
+            or meta.get("nnz", nnz) != nnz
+            or len(arrays["df"]) != model.n_features
+        ):
+            raise ValueError(f"Corpus model at {path} does not match its metadata (interrupted save?)")
+        model.keys = list(meta["keys"])
+        model._rows = {key: i for i, key in enumerate(model.keys)}
+        model._df = arrays["df"]
+        model._tf = sp.csr_matrix(
+            (arrays["tf_data"], arrays["tf_indices"], arrays["tf_indptr"]),
+            shape=(len(model.keys), model.n_features),
+            copy=False,
+        )
+        return model
+
+
+def refresh_corpus(companies: Sequence[dict], base_dir: Path | None = None) -> CorpusModel:
+    """
+    Load the on-disk corpus model, fold in any new companies, and save it back.
+
+    Intended to run right after fetch_yc_companies(); a feed with no new
+    companies costs one mmap load and no writes. A model left inconsistent by an
+    interrupted save is refitted from ``companies``.
+    """
+    path = default_corpus_dir(base_dir)
+    model = CorpusModel()
+    if (path / "meta.json").exists():
+        try:
+            model = CorpusModel.load(path)
+        except ValueError:
+            model = CorpusModel()
+    if model.update(companies):
+        model.save(path)
+    return model
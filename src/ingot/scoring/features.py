@@ -0,0 +1,132 @@
+"""
+Content-hash keyed cache of profile-independent company scoring features.
+
+Stage score, tag bonus, extracted tech terms and the normalised one_liner depend
+only on the company record, so they are computed once per record content and
+stored in the CompanyFeature table. A rescoring pass after a profile change then
+only redoes the skill- and resume-dependent components.
+
+Usage::
+
+    cache = FeatureCache()
+    await cache.load(session, companies)          # warm from outreach.db
+    feats = cache.features_for(companies)         # computes misses in-process
+    scores = score_leads(companies, skills, resume, features=feats)
+    await cache.flush(session)                    # persist newly computed rows
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping, Sequence
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from ingot.db.models import CompanyFeature
+from ingot.scoring.scorer import CompanyFeatures, extract_features
+
+# SQLite's default bound-parameter limit is 999; stay well under it per IN (...) query
+_LOAD_CHUNK = 500
+
+
+def content_hash(company: Mapping) -> str:
+    """
+    sha256 of the company record's canonical JSON form (key order independent).
+
+    Any mapping is accepted (e.g. venues.compact.CompanyRecord); it is hashed as
+    the equivalent dict, so a record and its to_dict() share a hash.
+    """
+    canonical = json.dumps(dict(company), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _to_row(digest: str, features: CompanyFeatures) -> CompanyFeature:
+    return CompanyFeature(
+        content_hash=digest,
+        stage_score=features.stage_score,
+        tag_bonus=features.tag_bonus,
+        tech_terms=sorted(features.tech_terms),
+        one_liner=features.one_liner,
+        is_hiring=features.is_hiring,
+    )
+
+
+def _from_row(row: CompanyFeature) -> CompanyFeatures:
+    return CompanyFeatures(
+        stage_score=row.stage_score,
+        tag_bonus=row.tag_bonus,
+        tech_terms=frozenset(row.tech_terms),
+        one_liner=row.one_liner,
+        is_hiring=row.is_hiring,
+    )
+
+
+class FeatureCache:
+    """In-memory map of content hash → CompanyFeatures, backed by the CompanyFeature table."""
+
+    def __init__(self) -> None:
+        self._features: dict[str, CompanyFeatures] = {}
+        self._pending: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def features_for(self, companies: Sequence[dict]) -> list[CompanyFeatures]:
+        """Return features aligned with ``companies``, computing and remembering any misses."""
+        out: list[CompanyFeatures] = []
+        for company in companies:
+            digest = content_hash(company)
+            features = self._features.get(digest)
+            if features is None:
+                self.misses += 1
+                features = extract_features(company)
+                self._features[digest] = features
+                self._pending.add(digest)
+            else:
+                self.hits += 1
+            out.append(features)
+        return out
+
+    async def load(self, session: AsyncSession, companies: Iterable[dict] | None = None) -> int:
+        """
+        Warm the cache from the database. Returns the number of rows loaded.
+
+        With ``companies``, only rows matching their content hashes are fetched;
+        otherwise the whole table is read.
+        """
+        if companies is None:
+            result = await session.execute(select(CompanyFeature))
+            rows = list(result.scalars().all())
+        else:
+            wanted = [h for h in {content_hash(c) for c in companies} if h not in self._features]
+            rows = []
+            for start in range(0, len(wanted), _LOAD_CHUNK):
+                chunk = wanted[start:start + _LOAD_CHUNK]
+                result = await session.execute(
+                    select(CompanyFeature).where(CompanyFeature.content_hash.in_(chunk))
+                )
+                rows.extend(result.scalars().all())
+        for row in rows:
+            self._features[row.content_hash] = _from_row(row)
+            self._pending.discard(row.content_hash)
+        return len(rows)
+
+    async def flush(self, session: AsyncSession) -> int:
+        """
+        Persist features computed since the last load/flush. Returns the number of rows written.
+
+        Rows another cache (or process) already stored for the same hash are left
+        as they are, so flushing without a prior load() is safe.
+        """
+        if not self._pending:
+            return 0
+        rows = [_to_row(digest, self._features[digest]).model_dump() for digest in self._pending]
+        connection = await session.connection()
+        result = await connection.execute(sqlite_insert(CompanyFeature).on_conflict_do_nothing(), rows)
+        await session.commit()
+        self._pending.clear()
+        return result.rowcount
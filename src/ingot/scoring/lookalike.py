@@ -0,0 +1,193 @@
+"""
+Lookalike company index for fast "more like this" queries.
+
+Once a lead replies positively, Scout wants the companies most similar to it
+right away. A full pairwise scan over the catalogue is O(N) sparse dot products
+per query; LookalikeIndex instead keeps a 128-bit random-projection (SimHash)
+signature per company, built from the CorpusModel's TF-IDF rows, and buckets
+them with LSH banding. A query only looks at companies that share at least one
+band with the seed, then ranks those candidates by exact cosine (when the
+corpus is available) or by the Hamming-distance estimate of the angle.
+
+The hyperplanes are dense Gaussian, restricted to the hashed columns that occur
+in the corpus: a sparse projection over 2^18 columns leaves most hyperplanes
+disjoint from a short description, so most bits would be structural zeros and
+every company would land in the same buckets.
+
+On-disk layout (default ~/.ingot/scoring/lookalike/):
+    meta.json        — company keys in row order, n_bits, n_bands, seed
+    signatures.npy   — packed uint8 signatures, one row per company
+
+Buckets are rebuilt from the signatures on load (a single pass, no hashing of text).
+"""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+from ingot.scoring.corpus import CorpusModel
+
+_DEFAULT_BITS = 128
+_DEFAULT_BANDS = 16
+# Hyperplane coordinates are drawn in blocks of hashed columns, each from its own seeded stream
+_PLANE_BLOCK = 1024
+
+
+def default_lookalike_dir(base_dir: Path | None = None) -> Path:
+    """Return the lookalike index directory under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "scoring" / "lookalike"
+
+
+def _projection(columns: np.ndarray, n_bits: int, seed: int) -> np.ndarray:
+    """
+    Dense Gaussian hyperplanes restricted to ``columns`` (sorted hashed-term ids), as (len(columns), n_bits).
+
+    A column's coordinates depend only on ``seed`` and the column id, so only the
+    seed is persisted and columns that never occur are never materialised.
+    """
+    planes = np.empty((len(columns), n_bits), dtype=np.float64)
+    blocks = columns // _PLANE_BLOCK
+    for block in np.unique(blocks):
+        rng = np.random.default_rng([seed, int(block)])
+        coords = rng.standard_normal((_PLANE_BLOCK, n_bits))
+        mask = blocks == block
+        planes[mask] = coords[columns[mask] % _PLANE_BLOCK]
+    return planes
+
+
+class LookalikeIndex:
+    """
+    SimHash + LSH index over company TF-IDF vectors.
+
+    Usage::
+
+        index = LookalikeIndex.build(corpus)
+        index.save(default_lookalike_dir())
+        index.similar_to("12345", k=10)              # [(company_key, similarity), ...]
+        index.expand(["12345", "67890"], k=20)       # around several winning leads
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        signatures: np.ndarray,
+        n_bits: int = _DEFAULT_BITS,
+        n_bands: int = _DEFAULT_BANDS,
+        seed: int = 0,
+        corpus: CorpusModel | None = None,
+    ) -> None:
+        if n_bits % 8 or n_bits % n_bands or (n_bits // n_bands) % 8:
+            raise ValueError(f"n_bits={n_bits} must split into {n_bands} whole-byte bands")
+        self.keys = keys
+        self.signatures = signatures
+        self.n_bits = n_bits
+        self.n_bands = n_bands
+        self.seed = seed
+        self.corpus = corpus
+        self._rows = {key: i for i, key in enumerate(keys)}
+        self._tfidf: sp.csr_matrix | None = None
+        self._buckets = self._bucket(signatures, n_bands)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def _bucket(signatures: np.ndarray, n_bands: int) -> list[dict[bytes, list[int]]]:
+        band_bytes = signatures.shape[1] // n_bands if len(signatures) else 0
+        buckets: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(n_bands)]
+        for row, sig in enumerate(np.asarray(signatures)):
+            raw = sig.tobytes()
+            for band in range(n_bands):
+                buckets[band][raw[band * band_bytes:(band + 1) * band_bytes]].append(row)
+        return buckets
+
+    @classmethod
+    def build(
+        cls, corpus: CorpusModel, n_bits: int = _DEFAULT_BITS, n_bands: int = _DEFAULT_BANDS, seed: int = 0
+    ) -> LookalikeIndex:
+        """Compute signatures for every company in ``corpus``."""
+        tfidf = corpus.tfidf_matrix().tocsc()
+        columns = np.flatnonzero(np.diff(tfidf.indptr))
+        projected = tfidf[:, columns] @ _projection(columns, n_bits, seed)
+        signatures = np.packbits(projected > 0, axis=1)
+        return cls(list(corpus.keys), signatures, n_bits, n_bands, seed, corpus)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _candidates(self, row: int) -> set[int]:
+        raw = self.signatures[row].tobytes()
+        band_bytes = len(raw) // self.n_bands
+        found: set[int] = set()
+        for band in range(self.n_bands):
+            found.update(self._buckets[band].get(raw[band * band_bytes:(band + 1) * band_bytes], ()))
+        found.discard(row)
+        return found
+
+    def _rank(self, seed_rows: list[int], candidates: list[int]) -> np.ndarray:
+        """Best similarity of each candidate to any seed row."""
+        if self.corpus is not None and len(self.corpus) == len(self.keys):
+            if self._tfidf is None:
+                self._tfidf = self.corpus.tfidf_matrix()
+            sims = (self._tfidf[candidates] @ self._tfidf[seed_rows].T).toarray()
+        else:
+            # Hamming distance between signatures estimates the angle: cos(pi * h / bits)
+            xor = np.bitwise_xor(self.signatures[candidates][:, None, :], self.signatures[seed_rows][None, :, :])
+            hamming = np.unpackbits(xor, axis=2).sum(axis=2)
+            sims = np.cos(np.pi * hamming / self.n_bits)
+        return sims.max(axis=1)
+
+    def expand(self, keys: Iterable[str], k: int = 10) -> list[tuple[str, float]]:
+        """
+        Up to ``k`` companies most similar to any of ``keys``, best first, excluding the seeds.
+
+        Unknown keys are ignored.
+        """
+        seed_rows = [self._rows[key] for key in keys if key in self._rows]
+        candidates: set[int] = set()
+        for row in seed_rows:
+            candidates |= self._candidates(row)
+        candidates.difference_update(seed_rows)
+        if not candidates or k <= 0:
+            return []
+        ordered = sorted(candidates)
+        sims = self._rank(seed_rows, ordered)
+        top = np.argsort(-sims, kind="stable")[:k]
+        return [(self.keys[ordered[i]], float(sims[i])) for i in top]
+
+    def similar_to(self, key: str, k: int = 10) -> list[tuple[str, float]]:
+        """Up to ``k`` companies most similar to ``key``, best first."""
+        return self.expand([key], k)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write signatures and metadata to ``path`` (a directory), replacing files atomically."""
+        path.mkdir(parents=True, exist_ok=True)
+        tmp_sig = path / "signatures.npy.tmp"
+        with tmp_sig.open("wb") as fh:
+            np.save(fh, np.asarray(self.signatures))
+        tmp_sig.replace(path / "signatures.npy")
+        tmp_meta = path / "meta.json.tmp"
+        tmp_meta.write_text(
+            json.dumps(
+                {"keys": self.keys, "n_bits": self.n_bits, "n_bands": self.n_bands, "seed": self.seed}
+            ),
+            encoding="utf-8",
+        )
+        tmp_meta.replace(path / "meta.json")
+
+    @classmethod
+    def load(cls, path: Path, corpus: CorpusModel | None = None) -> LookalikeIndex:
+        """Load a saved index. Pass the matching ``corpus`` to rank candidates by exact cosine."""
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        signatures = np.load(path / "signatures.npy", mmap_mode="r")
+        return cls(meta["keys"], signatures, meta["n_bits"], meta["n_bands"], meta["seed"], corpus)
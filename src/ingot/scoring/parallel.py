@@ -0,0 +1,109 @@
+"""
+Process-pool scoring lane for very large merged catalogues.
+
+Scoring is CPU-bound Python (feature extraction, skill matching, tokenizing
+descriptions) and would otherwise run on one core inside the asyncio loop.
+score_leads_parallel() shards the company list across a ProcessPoolExecutor
+and awaits the shards via run_in_executor, so the event loop stays responsive
+while the shards run.
+
+Split of work:
+  - workers: company features + stack/stage/keyword columns per shard. The
+    compiled SkillMatcher is memoised per worker process (matcher_for), so it
+    is built once per process, not once per shard. Without a ``corpus``, each
+    worker also tokenizes its shard into hashed term counts (term_counts).
+  - parent:  merges the shards' counts into one CorpusModel (document
+    frequencies are a bincount) and scores the resume with one sparse mat-vec.
+    With a ``corpus`` the parent only does that mat-vec. Either way the serial
+    part is vectorised numpy/scipy work, small next to the per-company Python
+    in the shards, so adding workers keeps paying off.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+import scipy.sparse as sp
+
+from ingot.scoring.corpus import CorpusModel, company_key, term_counts
+from ingot.scoring.scorer import DEFAULT_WEIGHTS, ScoringWeights, _profile_columns, extract_features
+from ingot.scoring.skills import matcher_for
+
+# Below this many companies per worker, pickling overhead outweighs the parallelism
+_MIN_SHARD_SIZE = 2_000
+
+
+def _score_shard(
+    shard: Sequence[dict], user_skills: tuple[str, ...], with_counts: bool = False
+) -> tuple[np.ndarray, sp.csr_matrix | None]:
+    """
+    Worker entry point: (len(shard), 3) array of stack, stage, keyword components,
+    plus the shard's hashed term counts when ``with_counts`` is set.
+    """
+    features = [extract_features(c) for c in shard]
+    out = np.empty((len(shard), 3), dtype=np.float64)
+    out[:, 0], out[:, 2] = _profile_columns(features, matcher_for(user_skills))
+    out[:, 1] = np.fromiter((f.stage_score for f in features), np.float64, len(features))
+    return out, term_counts(shard) if with_counts else None
+
+
+def _shard_bounds(n: int, workers: int, shard_size: int | None) -> list[tuple[int, int]]:
+    size = shard_size or max(_MIN_SHARD_SIZE, -(-n // workers))
+    return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+
+async def score_leads_parallel(
+    companies: Sequence[dict],
+    user_skills: list[str],
+    resume_text: str = "",
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    corpus: CorpusModel | None = None,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    shard_size: int | None = None,
+) -> np.ndarray:
+    """
+    Parallel equivalent of score_leads(). Returns the same float array of 0.0-1.0 scores.
+
+    Pass a long-lived ``executor`` to reuse worker processes across calls; otherwise
+    a ProcessPoolExecutor with ``max_workers`` (default: CPU count) is created and
+    shut down for this call.
+
+    Without a ``corpus``, the semantic component uses the hashed corpus-IDF model
+    built from the shards, i.e. it equals score_leads(..., corpus=CorpusModel.fit(companies))
+    rather than score_leads()'s in-process TfidfVectorizer fit.
+    """
+    n = len(companies)
+    if not n:
+        return np.zeros(0, dtype=np.float64)
+
+    loop = asyncio.get_running_loop()
+    workers = max_workers or os.cpu_count() or 1
+    owned = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    skills = tuple(user_skills)
+    try:
+        bounds = _shard_bounds(n, workers, shard_size)
+        with_counts = corpus is None
+        shard_futures = [
+            loop.run_in_executor(pool, _score_shard, companies[start:end], skills, with_counts)
+            for start, end in bounds
+        ]
+        shards = await asyncio.gather(*shard_futures)
+    finally:
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    if corpus is None:
+        counts = sp.vstack([shard_counts for _, shard_counts in shards], format="csr")
+        corpus = CorpusModel.from_counts([company_key(c) for c in companies], counts)
+        semantic = await asyncio.to_thread(corpus.similarities, resume_text)
+    else:
+        semantic = await asyncio.to_thread(corpus.scores_for, companies, resume_text)
+
+    w = weights.as_array()
+    keyword_components = np.vstack([components for components, _ in shards])
+    return keyword_components @ w[:3] + w[3] * semantic
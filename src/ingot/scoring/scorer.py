@@ -14,10 +14,17 @@ Scoring formula (from 02-CONTEXT.md locked decisions):
 PITFALL: yc-oss `tags` field contains category tags (B2B, SaaS, Developer Tools),
 NOT technology names. Use one_liner + long_description free text for stack_domain_match.
 """
+from collections.abc import Sequence
 from dataclasses import dataclass
+import re
+
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-import re
+
+from ingot.models.schemas import UserProfile
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.skills import SkillMatcher, matcher_for
 
 
 @dataclass
@@ -37,6 +44,13 @@ class ScoringWeights:
         total = self.stack_domain_match + self.company_stage + self.job_keyword_match + self.semantic_similarity
         assert abs(total - 1.0) < 0.001, f"ScoringWeights must sum to 1.0, got {total}"
 
+    def as_array(self) -> np.ndarray:
+        """Weights as a length-4 vector, ordered like the columns of component_matrix()."""
+        return np.array(
+            [self.stack_domain_match, self.company_stage, self.job_keyword_match, self.semantic_similarity],
+            dtype=np.float64,
+        )
+
 
 DEFAULT_WEIGHTS = ScoringWeights()
 
@@ -54,39 +68,51 @@ _STAGE_SCORES: dict[str, float] = {
 }
 
 
+# Match tech-like tokens: 2+ char sequences, camelCase, all-caps acronyms, versioned terms
+_TECH_TERM_RE = re.compile(r'\b[A-Z][a-zA-Z0-9]+\b|\b[A-Z]{2,}\b|\b[a-z]+\d+\b')
+
+
 def _extract_tech_terms(text: str) -> set[str]:
     """
     Extract technology-like terms from free text.
     Matches: capitalized acronyms (API, SDK), CamelCase (TypeScript), version strings (Python3),
     and common technology terms. NOT soft skills.
     """
-    # Match tech-like tokens: 2+ char sequences, camelCase, all-caps acronyms, versioned terms
-    tokens = re.findall(r'\b[A-Z][a-zA-Z0-9]+\b|\b[A-Z]{2,}\b|\b[a-z]+\d+\b', text)
+    tokens = _TECH_TERM_RE.findall(text)
     return {t.lower() for t in tokens if len(t) >= 2}
 
 
-def _stack_domain_score(company: dict, user_skills: list[str]) -> float:
-    """
-    Score based on tech term overlap between company description and user skills.
-    Checks one_liner + long_description text (NOT tags — those are domain categories).
-    """
-    company_text = f"{company.get('one_liner', '')} {company.get('long_description', '')}"
-    company_terms = _extract_tech_terms(company_text)
+# Tag-based domain match (developer tools, infrastructure = +boost)
+_HIGH_VALUE_TAGS = frozenset({"developer tools", "infrastructure", "devtools", "dev tools", "b2b"})
+
 
-    # Also include tag-based domain match (developer tools, infrastructure = +boost)
-    high_value_tags = {"developer tools", "infrastructure", "devtools", "dev tools", "b2b"}
-    tag_bonus = 0.1 if any(t.lower() in high_value_tags for t in company.get("tags", [])) else 0.0
+def _tag_bonus(company: dict) -> float:
+    """Small boost for companies tagged with a high-value domain category."""
+    return 0.1 if any(t.lower() in _HIGH_VALUE_TAGS for t in company.get("tags", [])) else 0.0
 
-    if not user_skills or not company_terms:
+
+def _stack_overlap_score(company_terms: set[str] | frozenset[str], tag_bonus: float, matcher: SkillMatcher) -> float:
+    """Jaccard overlap of company tech terms and user skills, scaled, plus the tag bonus."""
+    if not matcher or not company_terms:
         return tag_bonus
 
-    skill_terms = {s.lower() for s in user_skills}
-    overlap = len(company_terms & skill_terms)
-    union = len(company_terms | skill_terms)
+    overlap = matcher.term_overlap(company_terms)
+    union = len(company_terms) + len(matcher.skill_terms) - overlap
     jaccard = overlap / union if union > 0 else 0.0
     return min(1.0, jaccard * 3.0 + tag_bonus)  # scale up; jaccard is typically small
 
 
+def _stack_domain_score(company: dict, user_skills: list[str]) -> float:
+    """
+    Score based on tech term overlap between company description and user skills.
+    Checks one_liner + long_description text (NOT tags — those are domain categories).
+    """
+    company_text = f"{company.get('one_liner', '')} {company.get('long_description', '')}"
+    return _stack_overlap_score(
+        _extract_tech_terms(company_text), _tag_bonus(company), matcher_for(tuple(user_skills))
+    )
+
+
 def _stage_score(company: dict) -> float:
     """Score based on company funding stage. Seed/Series A preferred."""
     stage = company.get("stage", "").lower().strip()
@@ -112,18 +138,23 @@ def _stage_score(company: dict) -> float:
     return 0.3
 
 
+def _keyword_overlap_score(is_hiring: bool, one_liner: str, matcher: SkillMatcher) -> float:
+    """Hiring base score plus a boost per user skill found in the (lowercased) one_liner."""
+    skill_hits = matcher.skill_hits(one_liner)
+
+    base = 0.5 if is_hiring else 0.0
+    skill_boost = min(0.5, skill_hits * 0.15)
+    return min(1.0, base + skill_boost)
+
+
 def _job_keyword_score(company: dict, user_skills: list[str]) -> float:
     """
     Score based on hiring signal + keyword match.
     isHiring=True with overlapping skills in one_liner = strong intent signal.
     """
-    is_hiring = company.get("isHiring", False)
-    one_liner = company.get("one_liner", "").lower()
-    skill_hits = sum(1 for s in user_skills if s.lower() in one_liner)
-
-    base = 0.5 if is_hiring else 0.0
-    skill_boost = min(0.5, skill_hits * 0.15)
-    return min(1.0, base + skill_boost)
+    return _keyword_overlap_score(
+        bool(company.get("isHiring", False)), company.get("one_liner", "").lower(), matcher_for(tuple(user_skills))
+    )
 
 
 def _semantic_score(company: dict, resume_text: str) -> float:
@@ -167,3 +198,177 @@ def score_lead(
         + weights.job_keyword_match * keyword
         + weights.semantic_similarity * semantic
     )
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+# ---------------------------------------------------------------------------
+
+# Column order of component_matrix(); matches ScoringWeights.as_array()
+COMPONENTS: tuple[str, ...] = (
+    "stack_domain_match",
+    "company_stage",
+    "job_keyword_match",
+    "semantic_similarity",
+)
+
+
+@dataclass(frozen=True)
+class CompanyFeatures:
+    """
+    Profile-independent inputs to the score, derived from the company record alone.
+
+    Computed once per company content (see ingot.scoring.features.FeatureCache) so a
+    rescoring pass for a new profile only redoes the skill- and resume-dependent work.
+    """
+    stage_score: float
+    tag_bonus: float
+    tech_terms: frozenset[str]
+    one_liner: str  # lowercased, as matched by _job_keyword_score
+    is_hiring: bool
+
+
+def extract_features(company: dict) -> CompanyFeatures:
+    """Compute the profile-independent CompanyFeatures for one company record."""
+    company_text = f"{company.get('one_liner', '')} {company.get('long_description', '')}"
+    return CompanyFeatures(
+        stage_score=_stage_score(company),
+        tag_bonus=_tag_bonus(company),
+        tech_terms=frozenset(_extract_tech_terms(company_text)),
+        one_liner=company.get("one_liner", "").lower(),
+        is_hiring=bool(company.get("isHiring", False)),
+    )
+
+
+def _semantic_matrix(companies: Sequence[dict], resume_texts: Sequence[str]) -> np.ndarray:
+    """
+    TF-IDF cosine similarity of every company description against each resume, as (N, P).
+
+    Fits ONE vectorizer over the whole corpus (all descriptions + resumes) instead
+    of one per company, so IDF reflects the real catalogue rather than a
+    two-document corpus. Companies without a description, and empty resumes, score 0.0.
+    """
+    scores = np.zeros((len(companies), len(resume_texts)), dtype=np.float64)
+    resumes = [j for j, text in enumerate(resume_texts) if text]
+    if not resumes:
+        return scores
+    descs = [c.get("long_description", "") or c.get("one_liner", "") for c in companies]
+    present = np.fromiter((bool(d) for d in descs), dtype=bool, count=len(descs))
+    if not present.any():
+        return scores
+    try:
+        vectorizer = TfidfVectorizer(stop_words="english", max_features=5000)
+        matrix = vectorizer.fit_transform([d for d in descs if d] + [resume_texts[j] for j in resumes])
+    except ValueError:
+        # Empty vocabulary (e.g. only stop words) — nothing to compare
+        return scores
+    # Rows are L2-normalised by TfidfVectorizer, so a dot product is the cosine.
+    # Company rows are shared: every extra resume costs one more sparse column.
+    n_docs = int(present.sum())
+    sims = (matrix[:n_docs] @ matrix[n_docs:].T).toarray()
+    scores[np.ix_(present, resumes)] = np.minimum(1.0, sims)
+    return scores
+
+
+def _semantic_scores(companies: Sequence[dict], resume_text: str) -> np.ndarray:
+    """Single-resume column of _semantic_matrix()."""
+    return _semantic_matrix(companies, [resume_text])[:, 0]
+
+
+def _profile_columns(features: Sequence[CompanyFeatures], matcher: SkillMatcher) -> tuple[np.ndarray, np.ndarray]:
+    """Skill-dependent components (stack_domain_match, job_keyword_match) for one profile."""
+    n = len(features)
+    stack = np.fromiter(
+        (_stack_overlap_score(f.tech_terms, f.tag_bonus, matcher) for f in features), np.float64, n
+    )
+    keyword = np.fromiter(
+        (_keyword_overlap_score(f.is_hiring, f.one_liner, matcher) for f in features), np.float64, n
+    )
+    return stack, keyword
+
+
+def component_matrix(
+    companies: Sequence[dict],
+    user_skills: list[str],
+    resume_text: str = "",
+    corpus: CorpusModel | None = None,
+    features: Sequence[CompanyFeatures] | None = None,
+) -> np.ndarray:
+    """
+    Compute all four score components for every company at once.
+
+    Returns an (N, 4) float array with columns ordered as COMPONENTS.
+    Weighting is left to the caller so the matrix can be reused across weightings.
+    If ``corpus`` is given, semantic similarity uses its catalogue-wide IDF instead
+    of fitting a vectorizer over ``companies``. ``features`` (aligned with
+    ``companies``) skips recomputing the profile-independent parts.
+    """
+    n = len(companies)
+    if features is None:
+        features = [extract_features(c) for c in companies]
+    matrix = np.empty((n, len(COMPONENTS)), dtype=np.float64)
+    matrix[:, 0], matrix[:, 2] = _profile_columns(features, matcher_for(tuple(user_skills)))
+    matrix[:, 1] = np.fromiter((f.stage_score for f in features), np.float64, n)
+    if corpus is not None:
+        matrix[:, 3] = corpus.scores_for(companies, resume_text)
+    else:
+        matrix[:, 3] = _semantic_scores(companies, resume_text)
+    return matrix
+
+
+def score_leads(
+    companies: Sequence[dict],
+    user_skills: list[str],
+    resume_text: str = "",
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    corpus: CorpusModel | None = None,
+    features: Sequence[CompanyFeatures] | None = None,
+) -> np.ndarray:
+    """
+    Score a whole list of companies in one pass. Returns a float array of 0.0-1.0 scores.
+
+    Equivalent to calling score_lead() per company, except that the semantic
+    component uses a single TF-IDF model fitted over the entire list. Use this
+    for full-catalogue scout passes; score_lead() remains for one-off scoring.
+    Pass a persisted ``corpus`` (see ingot.scoring.corpus) to skip the TF-IDF fit,
+    and cached ``features`` (see ingot.scoring.features) to skip company-only work.
+    """
+    if not companies:
+        return np.zeros(0, dtype=np.float64)
+    return component_matrix(companies, user_skills, resume_text, corpus, features) @ weights.as_array()
+
+
+def score_leads_multi(
+    companies: Sequence[dict],
+    profiles: Sequence[UserProfile],
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    corpus: CorpusModel | None = None,
+    features: Sequence[CompanyFeatures] | None = None,
+) -> np.ndarray:
+    """
+    Score every company against several profiles at once. Returns an (N, P) score matrix.
+
+    Column j equals score_leads(companies, profiles[j].skills, profiles[j].resume_raw_text, ...)
+    up to TF-IDF fitting (without a ``corpus`` the vectorizer is fitted once over
+    companies plus all resumes). Company features, the stage column and the
+    company TF-IDF rows are shared, so each extra profile costs one skill pass and
+    one sparse product rather than a full rescoring.
+    """
+    n, p = len(companies), len(profiles)
+    if not n or not p:
+        return np.zeros((n, p), dtype=np.float64)
+    if features is None:
+        features = [extract_features(c) for c in companies]
+    w = weights.as_array()
+    resumes = [profile.resume_raw_text for profile in profiles]
+    if corpus is not None:
+        semantic = corpus.scores_for_many(companies, resumes)
+    else:
+        semantic = _semantic_matrix(companies, resumes)
+    stage = np.fromiter((f.stage_score for f in features), np.float64, n)
+
+    scores = w[1] * stage[:, None] + w[3] * semantic
+    for j, profile in enumerate(profiles):
+        stack, keyword = _profile_columns(features, matcher_for(tuple(profile.skills)))
+        scores[:, j] += w[0] * stack + w[2] * keyword
+    return scores
@@ -0,0 +1,96 @@
+"""
+Compiled per-profile skill matcher for the keyword-based score components.
+
+The naive keyword check runs ``skill in one_liner`` once per skill, so its cost
+is text length × skill count. SkillMatcher compiles all skills into one
+Aho-Corasick automaton (flattened into a DFA: one dict lookup per character),
+so every skill hit in a text is found in a single left-to-right pass.
+
+Matching semantics are unchanged: a skill counts as a hit if it occurs as a
+case-insensitive substring, and duplicate skills in the profile count twice.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+class SkillMatcher:
+    """
+    Build once per profile; reuse across every company.
+
+    Usage::
+
+        matcher = SkillMatcher(profile.skills)
+        hits = matcher.skill_hits(company["one_liner"].lower())
+        overlap = matcher.term_overlap(company_tech_terms)
+    """
+
+    def __init__(self, skills: Iterable[str]) -> None:
+        patterns: dict[str, int] = {}
+        for skill in skills:
+            key = skill.lower()
+            patterns[key] = patterns.get(key, 0) + 1
+
+        self.skill_terms: frozenset[str] = frozenset(patterns)
+        # "" is a substring of every text; count it up front instead of in the automaton
+        self._always_hits = patterns.pop("", 0)
+        self._weights: list[int] = list(patterns.values())
+        self._delta, self._out = self._compile(list(patterns))
+
+    def __bool__(self) -> bool:
+        return bool(self.skill_terms)
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> tuple[list[dict[str, int]], list[frozenset[int]]]:
+        """Build the goto/fail trie and flatten it into a full transition table."""
+        goto: list[dict[str, int]] = [{}]
+        out: list[set[int]] = [set()]
+        for pid, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(pid)
+
+        # BFS: each state inherits its failure state's transitions and outputs,
+        # so scanning never has to follow failure links.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            out[state] |= out[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+        return delta, [frozenset(o) for o in out]
+
+    def skill_hits(self, text: str) -> int:
+        """Number of profile skills occurring in ``text`` (expected lowercased). One pass."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        found: set[int] = set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return self._always_hits + sum(self._weights[pid] for pid in found)
+
+    def term_overlap(self, terms: frozenset[str] | set[str]) -> int:
+        """Size of the intersection between lowercased tech terms and the profile's skills."""
+        return len(self.skill_terms & terms)
+
+
+@lru_cache(maxsize=32)
+def matcher_for(skills: tuple[str, ...]) -> SkillMatcher:
+    """Memoised SkillMatcher so repeated single-company scoring reuses the compiled automaton."""
+    return SkillMatcher(skills)
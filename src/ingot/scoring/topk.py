@@ -0,0 +1,128 @@
+"""
+Streaming top-K lead selection.
+
+Scout usually wants only the best N companies. top_k_leads() pulls companies
+lazily from any iterable (a generator over a venue feed, a DB cursor, ...),
+scores them in fixed-size chunks with the vectorized batch scorer, and keeps
+only the current best ``k`` in a min-heap. Memory is O(k + chunk_size)
+regardless of feed length.
+
+Semantic similarity needs a ``corpus`` (a persisted CorpusModel, see
+refresh_corpus) whenever ``resume_text`` is given: fitting TF-IDF per chunk
+would give each chunk its own IDF, and one heap cannot rank scores that are not
+comparable. With the catalogue-wide corpus every chunk is scored on the same
+scale, so the result matches sorting score_leads(..., corpus=corpus) over the
+whole feed.
+
+top_k_leads_async() does the same over an async iterable, e.g. companies
+streamed from a venue feed by ingot.venues.yc.iter_yc_companies(), so scoring
+overlaps the download.
+"""
+from __future__ import annotations
+
+import heapq
+from collections.abc import AsyncIterable, Iterable, Iterator
+from itertools import count, islice
+
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.scorer import DEFAULT_WEIGHTS, ScoringWeights, score_leads
+
+_DEFAULT_CHUNK_SIZE = 1024
+
+
+def _check_corpus(resume_text: str, corpus: CorpusModel | None) -> None:
+    if resume_text and corpus is None:
+        raise ValueError(
+            "top-K selection with resume_text needs a CorpusModel (e.g. refresh_corpus()), "
+            "so every chunk is scored with the same IDF"
+        )
+
+
+def _chunks(companies: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(companies)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+class TopK:
+    """Bounded min-heap of (score, company) keeping the ``k`` highest scores seen so far."""
+
+    def __init__(self, k: int) -> None:
+        if k < 0:
+            raise ValueError(f"k must be >= 0, got {k}")
+        self.k = k
+        self._heap: list[tuple[float, int, dict]] = []
+        self._seq = count()  # tie-breaker: dicts are not orderable; earlier wins on equal score
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, score: float, company: dict) -> None:
+        """Offer one scored company; it is kept only if it beats the current k-th best."""
+        if self.k == 0:
+            return
+        entry = (score, -next(self._seq), company)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> list[tuple[float, dict]]:
+        """Return kept (score, company) pairs, best first."""
+        return [(score, company) for score, _, company in sorted(self._heap, reverse=True)]
+
+
+def top_k_leads(
+    companies: Iterable[dict],
+    user_skills: list[str],
+    k: int,
+    resume_text: str = "",
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    corpus: CorpusModel | None = None,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> list[tuple[float, dict]]:
+    """
+    Return the ``k`` best-scoring companies as (score, company) pairs, best first.
+
+    ``companies`` is consumed lazily, ``chunk_size`` records at a time; only the
+    current chunk and the k best so far are held in memory.
+
+    Raises:
+        ValueError if ``resume_text`` is given without a ``corpus``.
+    """
+    _check_corpus(resume_text, corpus)
+    best = TopK(k)
+    for chunk in _chunks(companies, chunk_size):
+        scores = score_leads(chunk, user_skills, resume_text, weights, corpus)
+        for score, company in zip(scores.tolist(), chunk):
+            best.push(score, company)
+    return best.results()
+
+
+async def top_k_leads_async(
+    companies: AsyncIterable[dict],
+    user_skills: list[str],
+    k: int,
+    resume_text: str = "",
+    weights: ScoringWeights = DEFAULT_WEIGHTS,
+    corpus: CorpusModel | None = None,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> list[tuple[float, dict]]:
+    """top_k_leads() over an async iterable; each chunk is scored as soon as it fills."""
+    _check_corpus(resume_text, corpus)
+    best = TopK(k)
+    chunk: list[dict] = []
+
+    def flush() -> None:
+        scores = score_leads(chunk, user_skills, resume_text, weights, corpus)
+        for score, company in zip(scores.tolist(), chunk):
+            best.push(score, company)
+        chunk.clear()
+
+    async for company in companies:
+        chunk.append(company)
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    return best.results()
@@ -0,0 +1,141 @@
+"""
+Weight-sweep tuning for ScoringWeights against real outreach outcomes.
+
+The four score components do not depend on the weights, so the N×4 component
+matrix is computed once and every candidate weighting is evaluated with one
+matrix multiply (N×4 @ 4×M). Ranking metrics are then computed column-wise for
+all M weightings at once.
+
+Labels come from the outreach history: a contacted lead (Lead.status sent /
+replied, or an Email that was sent / opened) is positive if it replied.
+
+Usage::
+
+    sweep = await build_sweep(session, companies, profile.skills, profile.resume_raw_text)
+    results = sweep.evaluate(weight_grid(step=0.05))
+    best = results[0].weights            # sorted by average precision, best first
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
+from scipy.stats import rankdata
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from ingot.db.models import Email, EmailStatus, Lead, LeadStatus
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.scorer import COMPONENTS, ScoringWeights, component_matrix
+
+_CONTACTED_LEAD = (LeadStatus.sent, LeadStatus.replied)
+_CONTACTED_EMAIL = (EmailStatus.sent, EmailStatus.opened)
+
+
+@dataclass
+class SweepResult:
+    """Ranking quality of one candidate weighting."""
+    weights: ScoringWeights
+    average_precision: float
+    roc_auc: float
+    precision_at_k: float
+
+
+def weight_grid(step: float = 0.05) -> np.ndarray:
+    """All weight vectors on the 4-simplex at ``step`` resolution, as an (M, 4) array."""
+    n = round(1.0 / step)
+    if n < 1 or abs(n * step - 1.0) > 1e-9:
+        raise ValueError(f"step must divide 1.0 evenly, got {step}")
+    rows = [(a, b, c, n - a - b - c) for a, b, c in product(range(n + 1), repeat=3) if a + b + c <= n]
+    return np.array(rows, dtype=np.float64) / n
+
+
+class WeightSweep:
+    """Evaluate many weightings over a fixed component matrix and binary outcomes."""
+
+    def __init__(self, components: np.ndarray, labels: np.ndarray) -> None:
+        if components.ndim != 2 or components.shape[1] != len(COMPONENTS):
+            raise ValueError(f"components must be (N, {len(COMPONENTS)}), got {components.shape}")
+        if len(labels) != len(components):
+            raise ValueError(f"{len(labels)} labels for {len(components)} companies")
+        self.components = components
+        self.labels = np.asarray(labels, dtype=bool)
+
+    def evaluate(self, weight_vectors: np.ndarray, k: int = 10) -> list[SweepResult]:
+        """
+        Score every company under every weighting and rank the weightings.
+
+        Returns one SweepResult per row of ``weight_vectors``, sorted by average
+        precision (then ROC AUC), best first.
+        """
+        weight_vectors = np.atleast_2d(weight_vectors)
+        n = len(self.labels)
+        positives = int(self.labels.sum())
+        if n == 0 or positives == 0 or positives == n:
+            raise ValueError("Need both replied and non-replied outcomes to evaluate weightings")
+
+        scores = self.components @ weight_vectors.T  # (N, M) — the whole sweep in one product
+
+        # ROC AUC via the rank-sum (Mann-Whitney U) identity, ties averaged
+        ranks = rankdata(scores, axis=0)
+        negatives = n - positives
+        auc = (ranks[self.labels].sum(axis=0) - positives * (positives + 1) / 2) / (positives * negatives)
+
+        # Average precision and precision@k from each column's descending order
+        order = np.argsort(-scores, axis=0, kind="stable")
+        hits = self.labels[order]
+        cum_hits = np.cumsum(hits, axis=0)
+        precision = cum_hits / np.arange(1, n + 1)[:, None]
+        avg_precision = (precision * hits).sum(axis=0) / positives
+        k = max(1, min(k, n))
+        prec_at_k = cum_hits[k - 1] / k
+
+        results = [
+            SweepResult(
+                weights=ScoringWeights(*map(float, w)),
+                average_precision=float(ap),
+                roc_auc=float(a),
+                precision_at_k=float(p),
+            )
+            for w, ap, a, p in zip(weight_vectors, avg_precision, auc, prec_at_k)
+        ]
+        results.sort(key=lambda r: (r.average_precision, r.roc_auc), reverse=True)
+        return results
+
+
+async def load_outcomes(session: AsyncSession) -> dict[str, bool]:
+    """
+    Map lowercased company name → replied, for every lead that was actually contacted.
+
+    A company counts as replied if any of its contacted leads replied.
+    """
+    emailed = await session.execute(
+        select(Email.lead_id).where(Email.status.in_(_CONTACTED_EMAIL))
+    )
+    emailed_ids = {lead_id for lead_id in emailed.scalars().all() if lead_id is not None}
+
+    leads = await session.execute(select(Lead.id, Lead.company_name, Lead.status))
+    outcomes: dict[str, bool] = {}
+    for lead_id, company_name, status in leads.all():
+        if status not in _CONTACTED_LEAD and lead_id not in emailed_ids:
+            continue
+        key = company_name.strip().lower()
+        outcomes[key] = outcomes.get(key, False) or status == LeadStatus.replied
+    return outcomes
+
+
+async def build_sweep(
+    session: AsyncSession,
+    companies: Sequence[dict],
+    user_skills: list[str],
+    resume_text: str = "",
+    corpus: CorpusModel | None = None,
+) -> WeightSweep:
+    """Compute the component matrix for the companies that have an outcome and wrap it in a WeightSweep."""
+    outcomes = await load_outcomes(session)
+    labelled = [c for c in companies if c.get("name", "").strip().lower() in outcomes]
+    labels = np.array([outcomes[c["name"].strip().lower()] for c in labelled], dtype=bool)
+    matrix = component_matrix(labelled, user_skills, resume_text, corpus)
+    return WeightSweep(matrix, labels)
@@ -0,0 +1,241 @@
+"""
+Venue plugin interface.
+
+Every lead source (YC, job boards, ...) is a VenueBase subclass registered
+under its ``venue_type``, the same string stored in the Venue table. A plugin
+streams companies from discover(), an async generator, instead of returning a
+materialised list, so Scout can dedupe and score while sources are still
+downloading.
+
+Per-venue policy comes from Venue.config_json:
+
+    {"rate_limit_per_sec": 2, "max_concurrency": 4, "cache": true, ...}
+
+Keys that are not policy fields stay in ``plugin.options`` for the plugin
+itself (e.g. {"batches": ["winter-2025"]} for YC).
+
+Plugins are loaded lazily: built-in types import their module on first use,
+and unknown types are looked up in *.py files under ~/.ingot/venues/, which
+register themselves with @register_venue on import.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import json
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import ClassVar
+
+import httpx
+
+from ingot.agents.exceptions import ConfigError
+from ingot.db.models import Venue
+from ingot.venues.cache import VenueCache
+
+VENUE_REGISTRY: dict[str, type[VenueBase]] = {}
+
+# venue_type → module that registers it; imported on first lookup
+_BUILTIN_VENUES = {"yc": "ingot.venues.yc"}
+
+
+def default_plugin_dir(base_dir: Path | None = None) -> Path:
+    """Return the user venue plugin directory under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "venues"
+
+
+@dataclass(frozen=True)
+class VenuePolicy:
+    """Per-venue fetch policy parsed from Venue.config_json."""
+    rate_limit_per_sec: float = 0.0  # 0 = unlimited
+    max_concurrency: int = 4
+    cache: bool = True
+
+    @classmethod
+    def from_config(cls, config: dict) -> VenuePolicy:
+        """
+        Policy from a parsed config_json dict; keys that are not policy fields are ignored.
+
+        Raises:
+            ConfigError for a negative rate or a concurrency below 1.
+        """
+        known = {f.name for f in fields(cls)}
+        policy = cls(**{k: v for k, v in config.items() if k in known})
+        if policy.rate_limit_per_sec < 0 or policy.max_concurrency < 1:
+            raise ConfigError(f"Invalid venue policy: {policy}")
+        return policy
+
+
+class VenueLimiter:
+    """
+    Async context manager enforcing a venue's concurrency cap and request rate.
+
+    ``async with limiter:`` waits for a concurrency slot, then for the next
+    rate-limit tick (requests are spaced 1 / rate_limit_per_sec seconds apart).
+    """
+
+    def __init__(self, policy: VenuePolicy) -> None:
+        self._semaphore = asyncio.Semaphore(policy.max_concurrency)
+        self._interval = 1.0 / policy.rate_limit_per_sec if policy.rate_limit_per_sec else 0.0
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def __aenter__(self) -> VenueLimiter:
+        await self._semaphore.acquire()
+        if self._interval:
+            try:
+                async with self._lock:
+                    loop = asyncio.get_running_loop()
+                    delay = self._next_at - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    self._next_at = max(self._next_at, loop.time()) + self._interval
+            except BaseException:
+                # Cancelled while waiting for the tick: __aexit__ will not run, so give the slot back
+                self._semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._semaphore.release()
+
+
+class VenueBase(ABC):
+    """
+    Base class for venue plugins.
+
+    Usage::
+
+        @register_venue
+        class MyBoard(VenueBase):
+            venue_type = "myboard"
+
+            async def discover(self, http_client):
+                async with self.limiter:
+                    resp = await http_client.get(self.options["url"])
+                for company in resp.json():
+                    yield company
+    """
+
+    venue_type: ClassVar[str]
+
+    def __init__(self, venue: Venue | None = None, cache_dir: Path | None = None) -> None:
+        self.venue = venue
+        try:
+            config = json.loads(venue.config_json) if venue is not None else {}
+        except json.JSONDecodeError as exc:
+            raise ConfigError(f"Venue '{venue.venue_name}' has invalid config_json", cause=exc) from exc
+        self.policy = VenuePolicy.from_config(config)
+        policy_keys = {f.name for f in fields(VenuePolicy)}
+        self.options = {k: v for k, v in config.items() if k not in policy_keys}
+        self.limiter = VenueLimiter(self.policy)
+        self.cache = VenueCache(cache_dir) if self.policy.cache else None
+
+    @property
+    def name(self) -> str:
+        """Venue.venue_name of the configured row, or the venue_type for an unconfigured plugin."""
+        return self.venue.venue_name if self.venue is not None else self.venue_type
+
+    @abstractmethod
+    def discover(self, http_client: httpx.AsyncClient) -> AsyncIterator[dict]:
+        """Yield company dicts as they are fetched."""
+
+
+def register_venue(cls: type[VenueBase]) -> type[VenueBase]:
+    """Class decorator: register a VenueBase subclass under its venue_type."""
+    VENUE_REGISTRY[cls.venue_type] = cls
+    return cls
+
+
+def _load_plugin_file(path: Path) -> None:
+    spec = importlib.util.spec_from_file_location(f"ingot_venue_plugin_{path.stem}", path)
+    if spec is None or spec.loader is None:
+        raise ConfigError(f"Cannot load venue plugin {path}")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception as exc:
+        raise ConfigError(f"Venue plugin {path} failed to import", cause=exc) from exc
+
+
+def get_venue_class(venue_type: str, plugin_dir: Path | None = None) -> type[VenueBase]:
+    """
+    Resolve a venue_type to its plugin class, importing it on first use.
+
+    Raises:
+        ConfigError if no built-in or plugin-directory module registers the type.
+    """
+    if venue_type not in VENUE_REGISTRY and venue_type in _BUILTIN_VENUES:
+        importlib.import_module(_BUILTIN_VENUES[venue_type])
+    if venue_type not in VENUE_REGISTRY:
+        directory = plugin_dir or default_plugin_dir()
+        candidates = sorted(directory.glob("*.py")) if directory.is_dir() else []
+        # A file named after the type is the likely home; try it before the rest
+        candidates.sort(key=lambda p: p.stem != venue_type)
+        for path in candidates:
+            _load_plugin_file(path)
+            if venue_type in VENUE_REGISTRY:
+                break
+    if venue_type not in VENUE_REGISTRY:
+        raise ConfigError(f"Unknown venue type '{venue_type}'. Registered: {sorted(VENUE_REGISTRY)}")
+    return VENUE_REGISTRY[venue_type]
+
+
+def load_venue(venue: Venue, plugin_dir: Path | None = None, cache_dir: Path | None = None) -> VenueBase:
+    """Instantiate the plugin for a Venue row."""
+    return get_venue_class(venue.venue_type, plugin_dir)(venue, cache_dir=cache_dir)
+
+
+async def merge_streams(
+    streams: Iterable[tuple[str, AsyncIterator[dict]]], buffer: int = 256
+) -> AsyncIterator[tuple[str, dict]]:
+    """
+    Run several named async streams concurrently and yield (name, item) as items arrive.
+
+    ``buffer`` bounds how far producers may run ahead of the consumer. If any
+    stream raises, the others are cancelled and the error propagates.
+    """
+    queue: asyncio.Queue[tuple[str, dict] | BaseException | None] = asyncio.Queue(maxsize=buffer)
+
+    async def pump(name: str, stream: AsyncIterator[dict]) -> None:
+        try:
+            async for item in stream:
+                await queue.put((name, item))
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        await queue.put(None)
+
+    tasks = [asyncio.create_task(pump(name, stream)) for name, stream in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            entry = await queue.get()
+            if entry is None:
+                remaining -= 1
+            elif isinstance(entry, BaseException):
+                raise entry
+            else:
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def discover_all(
+    venues: Iterable[Venue],
+    http_client: httpx.AsyncClient,
+    plugin_dir: Path | None = None,
+    cache_dir: Path | None = None,
+) -> AsyncIterator[tuple[str, dict]]:
+    """
+    One merged stream of (venue_name, company) across all ``venues``, fetched concurrently.
+
+    Each venue runs under its own policy; plugins are resolved before any fetch
+    starts, so a misconfigured venue fails fast with ConfigError.
+    """
+    plugins = [load_venue(venue, plugin_dir, cache_dir) for venue in venues]
+    return merge_streams((plugin.name, plugin.discover(http_client)) for plugin in plugins)
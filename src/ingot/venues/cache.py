@@ -0,0 +1,137 @@
+"""
+Conditional-GET disk cache for venue JSON feeds.
+
+yc-oss feeds are regenerated daily but fetched far more often (hourly scout
+runs, batch 404 fallbacks). VenueCache stores each feed body on disk together
+with its ETag / Last-Modified validators and revalidates with If-None-Match /
+If-Modified-Since. A 304 is answered from disk, so an unchanged feed costs one
+empty round trip instead of a multi-MB download.
+
+Layout (default ~/.ingot/venues/cache/):
+    <sha256(url)[:32]>.body   — raw response bytes
+    <sha256(url)[:32]>.json   — {"url", "etag", "last_modified", "fetched_at"}
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+
+def default_venue_cache_dir(base_dir: Path | None = None) -> Path:
+    """Return the venue feed cache directory under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "venues" / "cache"
+
+
+@dataclass
+class CachedFeed:
+    """A cached feed body plus the validators needed to revalidate it."""
+    url: str
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+    fetched_at: str = ""
+
+
+class VenueCache:
+    """
+    On-disk feed cache with HTTP revalidation.
+
+    Usage::
+
+        cache = VenueCache()
+        body = await cache.fetch(http_client, url, headers=YC_HEADERS)
+        cache.hits, cache.misses     # 304s served from disk vs full downloads
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or default_venue_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        stem = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{stem}.body", self.cache_dir / f"{stem}.json"
+
+    def get(self, url: str) -> CachedFeed | None:
+        """Return the cached feed for ``url``, or None if nothing usable is on disk."""
+        body_path, meta_path = self._paths(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return CachedFeed(body=body_path.read_bytes(), **meta)
+
+    def put(self, url: str, body: bytes, etag: str = "", last_modified: str = "") -> CachedFeed:
+        """Store a feed body with its validators. Body and metadata are each replaced atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path = self._paths(url)[0]
+        feed = CachedFeed(
+            url=url,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+        )
+        tmp_body = body_path.with_suffix(".body.tmp")
+        tmp_body.write_bytes(body)
+        tmp_body.replace(body_path)
+        self._write_meta(feed)
+        return feed
+
+    def _write_meta(self, feed: CachedFeed) -> None:
+        meta_path = self._paths(feed.url)[1]
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        tmp_meta.write_text(
+            json.dumps(
+                {"url": feed.url, "etag": feed.etag, "last_modified": feed.last_modified, "fetched_at": feed.fetched_at}
+            ),
+            encoding="utf-8",
+        )
+        tmp_meta.replace(meta_path)
+
+    def conditional_headers(self, cached: CachedFeed | None) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating ``cached``."""
+        if cached is None:
+            return {}
+        headers: dict[str, str] = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    async def fetch(
+        self,
+        http_client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30.0,
+    ) -> bytes:
+        """
+        GET ``url`` with revalidation. Returns the feed body from the network or from disk.
+
+        Raises:
+            httpx.HTTPStatusError for 4xx/5xx responses (same as raise_for_status()).
+        """
+        cached = self.get(url)
+        request_headers = {**(headers or {}), **self.conditional_headers(cached)}
+        resp = await http_client.get(url, headers=request_headers, timeout=timeout)
+        if resp.status_code == 304 and cached is not None:
+            self.hits += 1
+            # Revalidated: the copy is as fresh as a new download
+            cached.fetched_at = datetime.now(timezone.utc).isoformat()
+            self._write_meta(cached)
+            return cached.body
+        resp.raise_for_status()
+        self.misses += 1
+        self.put(
+            url,
+            resp.content,
+            etag=resp.headers.get("ETag", ""),
+            last_modified=resp.headers.get("Last-Modified", ""),
+        )
+        return resp.content
@@ -0,0 +1,153 @@
+"""
+Locally indexed copy of the full yc-oss catalogue.
+
+Batch and industry feeds are just filtered views of companies/all.json, yet
+fetch_yc_companies() downloads a separate file per query (and all.json again
+whenever a batch slug 404s). YCCatalogue holds all.json once and keeps
+inverted indexes by batch, industry, tag, stage and isHiring, so filtered
+queries are set intersections in memory. load_yc_catalogue() reads the copy
+stored by VenueCache and only touches the network when it is missing or stale.
+
+Index keys are slugs: "Winter 2025" -> "winter-2025", "B2B" -> "b2b",
+"Developer Tools" -> "developer-tools" — the same form yc-oss uses in its URLs.
+"""
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from ingot.venues.cache import VenueCache
+from ingot.venues.yc import _feed_url, fetch_yc_companies
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DEFAULT_MAX_AGE = timedelta(days=1)  # yc-oss regenerates daily
+
+
+def slugify(value: object) -> str:
+    """yc-oss URL slug for a batch / industry / tag / stage value."""
+    return _SLUG_RE.sub("-", str(value).lower()).strip("-")
+
+
+def _values(company: dict, field: str) -> Iterable[str]:
+    raw = company.get(field)
+    if raw is None or raw == "":
+        return ()
+    if isinstance(raw, list):
+        return {slugify(v) for v in raw if v}
+    return (slugify(raw),)
+
+
+class YCCatalogue:
+    """
+    In-memory yc-oss catalogue with per-field inverted indexes.
+
+    Usage::
+
+        catalogue = await load_yc_catalogue(http_client)
+        catalogue.query(batch="winter-2025", is_hiring=True)
+        catalogue.query(industry="fintech", tag="payments")
+    """
+
+    def __init__(self, companies: list[dict]) -> None:
+        self.companies = companies
+        self._batch: dict[str, list[int]] = defaultdict(list)
+        self._industry: dict[str, list[int]] = defaultdict(list)
+        self._tag: dict[str, list[int]] = defaultdict(list)
+        self._stage: dict[str, list[int]] = defaultdict(list)
+        self._hiring: list[int] = []
+        for row, company in enumerate(companies):
+            for value in _values(company, "batch"):
+                self._batch[value].append(row)
+            # "industries" carries the parent industry plus sub-industries
+            for value in {*_values(company, "industry"), *_values(company, "industries")}:
+                self._industry[value].append(row)
+            for value in _values(company, "tags"):
+                self._tag[value].append(row)
+            for value in _values(company, "stage"):
+                self._stage[value].append(row)
+            if company.get("isHiring"):
+                self._hiring.append(row)
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    @classmethod
+    def from_json(cls, body: bytes | str) -> YCCatalogue:
+        """Build from a raw all.json body."""
+        companies = json.loads(body)
+        if not isinstance(companies, list):
+            raise ValueError(f"Expected list, got {type(companies)}")
+        return cls(companies)
+
+    def batches(self) -> list[str]:
+        """All batch slugs present in the catalogue."""
+        return sorted(self._batch)
+
+    def industries(self) -> list[str]:
+        """All industry slugs present in the catalogue."""
+        return sorted(self._industry)
+
+    def query(
+        self,
+        batch: str | None = None,
+        industry: str | None = None,
+        tag: str | None = None,
+        stage: str | None = None,
+        is_hiring: bool | None = None,
+    ) -> list[dict]:
+        """
+        Companies matching every given filter, in catalogue order.
+
+        Filters accept slugs or display names ("winter-2025" or "Winter 2025").
+        With no filters the whole catalogue is returned.
+        """
+        selected = [
+            index.get(slugify(value), ())
+            for index, value in (
+                (self._batch, batch), (self._industry, industry), (self._tag, tag), (self._stage, stage)
+            )
+            if value is not None
+        ]
+        if not selected and is_hiring is None:
+            return list(self.companies)
+
+        if selected:
+            selected.sort(key=len)
+            rows = set(selected[0])
+            for other in selected[1:]:
+                rows.intersection_update(other)
+        else:
+            rows = set(range(len(self.companies)))
+        if is_hiring is True:
+            rows.intersection_update(self._hiring)
+        elif is_hiring is False:
+            rows.difference_update(self._hiring)
+        return [self.companies[row] for row in sorted(rows)]
+
+
+async def load_yc_catalogue(
+    http_client: httpx.AsyncClient,
+    cache: VenueCache | None = None,
+    max_age: timedelta | None = _DEFAULT_MAX_AGE,
+    refresh: bool = False,
+) -> YCCatalogue:
+    """
+    Return the full catalogue, from the VenueCache copy of all.json when possible.
+
+    The network is used only if there is no cached copy, the copy is older than
+    ``max_age`` (None = never stale), or ``refresh`` is True. Refreshes go
+    through fetch_yc_companies(), so an unchanged feed costs one 304.
+    """
+    cache = cache or VenueCache()
+    url = _feed_url(None, None)
+    cached = cache.get(url)
+    if cached is not None and not refresh:
+        fetched_at = datetime.fromisoformat(cached.fetched_at) if cached.fetched_at else None
+        if max_age is None or (fetched_at and datetime.now(timezone.utc) - fetched_at < max_age):
+            return YCCatalogue.from_json(cached.body)
+    return YCCatalogue(await fetch_yc_companies(http_client, cache=cache))
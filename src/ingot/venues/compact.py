@@ -0,0 +1,203 @@
+"""
+Compact columnar storage for venue company records.
+
+A long-running process that keeps the yc-oss catalogue as ~5k dicts pays for a
+hash table per company plus a fresh copy of every repeated string (batch,
+stage, industry, each tag). CompactCatalogue stores the same data by column:
+
+  - text fields (name, slug, website, one_liner, long_description) as lists of str
+  - batch / industry / stage / status as uint16 codes into one interned value table
+  - tags / industries as a flat uint16 code array plus int32 row offsets
+  - id / team_size as int64 / int32 arrays (-1 = missing), isHiring as a bool array
+
+CompanyRecord is a two-slot view onto one row and a read-only
+collections.abc.Mapping (``get``, ``[]``, ``in``, ``dict(record)``), so
+score_leads(), top_k_leads(), company_key(), content_hash() and friends accept
+records without converting back to dicts. Fields outside the columns above are
+dropped.
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+from ingot.scoring.corpus import company_key
+
+_TEXT_FIELDS = ("name", "slug", "website", "one_liner", "long_description")
+_CATEGORICAL_FIELDS = ("batch", "industry", "stage", "status")
+_MULTI_FIELDS = ("tags", "industries")
+_INT_FIELDS = ("id", "team_size")
+FIELDS = (*_INT_FIELDS, *_TEXT_FIELDS, *_CATEGORICAL_FIELDS, *_MULTI_FIELDS, "isHiring")
+
+_MISSING = -1
+
+
+class CompanyRecord(Mapping[str, object]):
+    """Read-only mapping view of one catalogue row; equality and hashing are by row identity."""
+
+    __slots__ = ("_catalogue", "_row")
+
+    def __init__(self, catalogue: CompactCatalogue, row: int) -> None:
+        self._catalogue = catalogue
+        self._row = row
+
+    def get(self, key: str, default: object = None) -> object:
+        value = self._catalogue._value(key, self._row)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> object:
+        value = self._catalogue._value(key, self._row)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._catalogue._value(key, self._row) is not None
+
+    def keys(self) -> list[str]:  # type: ignore[override]
+        return [key for key in FIELDS if key in self]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def to_dict(self) -> dict:
+        """Materialise as a plain dict (e.g. for JSON or content_hash())."""
+        return {key: self[key] for key in self.keys()}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompanyRecord):
+            return self._catalogue is other._catalogue and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._catalogue), self._row))
+
+    def __repr__(self) -> str:
+        return f"CompanyRecord(id={self.get('id')!r}, name={self.get('name')!r})"
+
+
+class CompactCatalogue(Sequence[CompanyRecord]):
+    """
+    Column-oriented, string-interned company catalogue.
+
+    Usage::
+
+        catalogue = CompactCatalogue.from_dicts(await fetch_yc_companies(client))
+        scores = score_leads(catalogue, skills, resume)   # records, no dict conversion
+        "12345" in catalogue.key_index                    # Scout dedup by company_key
+    """
+
+    def __init__(self, companies: Iterable[dict] = ()) -> None:
+        self._values: list[str] = [""]  # code 0 = missing
+        self._codes: dict[str, int] = {}
+        ints: dict[str, list[int]] = {f: [] for f in _INT_FIELDS}
+        self._text: dict[str, list[str | None]] = {f: [] for f in _TEXT_FIELDS}
+        cats: dict[str, list[int]] = {f: [] for f in _CATEGORICAL_FIELDS}
+        multi: dict[str, tuple[list[int], list[int]]] = {f: ([], [0]) for f in _MULTI_FIELDS}
+        hiring: list[bool] = []
+
+        for company in companies:
+            for field in _INT_FIELDS:
+                value = company.get(field)
+                ints[field].append(_MISSING if value is None else int(value))
+            for field in _TEXT_FIELDS:
+                self._text[field].append(company.get(field))
+            for field in _CATEGORICAL_FIELDS:
+                value = company.get(field)
+                cats[field].append(0 if value is None else self._intern(value))
+            for field in _MULTI_FIELDS:
+                flat, offsets = multi[field]
+                flat.extend(self._intern(v) for v in company.get(field) or ())
+                offsets.append(len(flat))
+            hiring.append(bool(company.get("isHiring", False)))
+
+        if len(self._values) > np.iinfo(np.uint16).max:
+            raise ValueError(f"Too many distinct categorical values: {len(self._values)}")
+        self._ints = {f: np.asarray(v, dtype=np.int64 if f == "id" else np.int32) for f, v in ints.items()}
+        self._cats = {f: np.asarray(v, dtype=np.uint16) for f, v in cats.items()}
+        self._multi = {
+            f: (np.asarray(flat, dtype=np.uint16), np.asarray(offsets, dtype=np.int32))
+            for f, (flat, offsets) in multi.items()
+        }
+        self._hiring = np.asarray(hiring, dtype=bool)
+        self._key_index: dict[str, int] | None = None
+
+    @classmethod
+    def from_dicts(cls, companies: Iterable[dict]) -> CompactCatalogue:
+        """Build from yc-oss company dicts."""
+        return cls(companies)
+
+    def _intern(self, value: object) -> int:
+        text = sys.intern(str(value))
+        code = self._codes.get(text)
+        if code is None:
+            code = self._codes[text] = len(self._values)
+            self._values.append(text)
+        return code
+
+    def _value(self, key: str, row: int) -> object:
+        if key in self._text:
+            return self._text[key][row]
+        if key in self._cats:
+            code = self._cats[key][row]
+            return self._values[code] if code else None
+        if key in self._multi:
+            flat, offsets = self._multi[key]
+            return [self._values[c] for c in flat[offsets[row]:offsets[row + 1]]]
+        if key in self._ints:
+            value = int(self._ints[key][row])
+            return None if value == _MISSING else value
+        if key == "isHiring":
+            return bool(self._hiring[row])
+        return None
+
+    def __len__(self) -> int:
+        return len(self._hiring)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [CompanyRecord(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return CompanyRecord(self, index)
+
+    def __iter__(self) -> Iterator[CompanyRecord]:
+        return (CompanyRecord(self, row) for row in range(len(self)))
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    @property
+    def ids(self) -> np.ndarray:
+        """int64 yc-oss ids, -1 where missing."""
+        return self._ints["id"]
+
+    @property
+    def is_hiring(self) -> np.ndarray:
+        return self._hiring
+
+    def column(self, field: str) -> list[object]:
+        """All values of one field in row order (None where missing)."""
+        return [self._value(field, row) for row in range(len(self))]
+
+    @property
+    def key_index(self) -> dict[str, int]:
+        """company_key() → row, built on first use; for dedup against known leads."""
+        if self._key_index is None:
+            self._key_index = {}
+            for record in self:
+                self._key_index.setdefault(company_key(record), record._row)
+        return self._key_index
+
+    def dedupe_against(self, known_keys: Iterable[str]) -> list[CompanyRecord]:
+        """Records whose company_key() is not in ``known_keys``, in catalogue order."""
+        known = set(known_keys)
+        return [CompanyRecord(self, row) for key, row in self.key_index.items() if key not in known]
@@ -0,0 +1,185 @@
+"""
+SQLite FTS5 keyword search over the venue catalogue.
+
+Questions like "fintech companies mentioning Rust that are hiring" otherwise
+mean a Python scan over every company dict. CompanySearchIndex loads the
+catalogue into a sidecar SQLite database (default ~/.ingot/venues/search.db,
+kept out of outreach.db so rebuilding it never touches migrations or leads):
+
+    company       — one row per company: key, batch/industry/stage slugs,
+                    is_hiring, content hash and the full record as JSON;
+                    b-tree indexes on the filter columns
+    company_fts   — FTS5 table over name, one_liner, long_description, tags,
+                    sharing rowids with company
+
+Keyword queries are an indexed MATCH ranked by bm25; filter-only queries use
+the b-tree indexes. Upserts skip companies whose content hash is unchanged.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from ingot.scoring.corpus import company_key
+from ingot.scoring.features import content_hash
+from ingot.venues.catalogue import slugify
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS company (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    batch TEXT NOT NULL DEFAULT '',
+    industry TEXT NOT NULL DEFAULT '',
+    stage TEXT NOT NULL DEFAULT '',
+    is_hiring INTEGER NOT NULL DEFAULT 0,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_company_batch ON company (batch);
+CREATE INDEX IF NOT EXISTS ix_company_industry ON company (industry);
+CREATE INDEX IF NOT EXISTS ix_company_stage ON company (stage);
+CREATE INDEX IF NOT EXISTS ix_company_is_hiring ON company (is_hiring);
+CREATE VIRTUAL TABLE IF NOT EXISTS company_fts USING fts5(
+    name, one_liner, long_description, tags, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def default_search_db_path(base_dir: Path | None = None) -> Path:
+    """Return the venue search database path under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "venues" / "search.db"
+
+
+def _match_expression(text: str) -> str:
+    """Plain words → FTS5 query requiring every word (quoted, so no operator injection)."""
+    return " ".join(f'"{word}"' for word in _WORD_RE.findall(text))
+
+
+class CompanySearchIndex:
+    """
+    FTS5-backed company search.
+
+    Usage::
+
+        with CompanySearchIndex(default_search_db_path()) as index:
+            index.upsert(companies)
+            index.search("rust", industry="fintech", is_hiring=True, limit=20)
+    """
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> CompanySearchIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM company").fetchone()[0]
+
+    def upsert(self, companies: Iterable[dict]) -> int:
+        """Insert new companies and replace changed ones. Returns the number of rows written."""
+        known = dict(self._conn.execute("SELECT key, hash FROM company"))
+        written = 0
+        with self._conn:
+            for company in companies:
+                key = company_key(company)
+                digest = content_hash(company)
+                if known.get(key) == digest:
+                    continue
+                row = self._conn.execute(
+                    """
+                    INSERT INTO company (key, batch, industry, stage, is_hiring, hash, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        batch = excluded.batch, industry = excluded.industry, stage = excluded.stage,
+                        is_hiring = excluded.is_hiring, hash = excluded.hash, data = excluded.data
+                    RETURNING id
+                    """,
+                    (
+                        key,
+                        slugify(company.get("batch") or ""),
+                        slugify(company.get("industry") or ""),
+                        slugify(company.get("stage") or ""),
+                        int(bool(company.get("isHiring", False))),
+                        digest,
+                        json.dumps(dict(company), ensure_ascii=False),
+                    ),
+                ).fetchone()[0]
+                self._conn.execute("DELETE FROM company_fts WHERE rowid = ?", (row,))
+                self._conn.execute(
+                    "INSERT INTO company_fts (rowid, name, one_liner, long_description, tags) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        row,
+                        company.get("name") or "",
+                        company.get("one_liner") or "",
+                        company.get("long_description") or "",
+                        " ".join(company.get("tags") or ()),
+                    ),
+                )
+                known[key] = digest
+                written += 1
+        return written
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Remove companies by company_key() (e.g. YCDelta.removed). Returns the number removed."""
+        removed = 0
+        with self._conn:
+            for key in keys:
+                row = self._conn.execute("DELETE FROM company WHERE key = ? RETURNING id", (key,)).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM company_fts WHERE rowid = ?", row)
+                    removed += 1
+        return removed
+
+    def search(
+        self,
+        text: str = "",
+        batch: str | None = None,
+        industry: str | None = None,
+        stage: str | None = None,
+        is_hiring: bool | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """
+        Companies matching every word of ``text`` and every given filter.
+
+        With ``text`` results are ranked by bm25 relevance; without it they come
+        back in insertion order. Filters accept slugs or display names.
+        """
+        where: list[str] = []
+        params: list[object] = []
+        for column, value in (("batch", batch), ("industry", industry), ("stage", stage)):
+            if value is not None:
+                where.append(f"c.{column} = ?")
+                params.append(slugify(value))
+        if is_hiring is not None:
+            where.append("c.is_hiring = ?")
+            params.append(int(is_hiring))
+
+        expression = _match_expression(text)
+        if expression:
+            sql = "SELECT c.data FROM company_fts f JOIN company c ON c.id = f.rowid WHERE company_fts MATCH ?"
+            params.insert(0, expression)
+            order = "ORDER BY bm25(company_fts)"
+        else:
+            sql = "SELECT c.data FROM company c WHERE 1"
+            order = "ORDER BY c.id"
+        if where:
+            sql += " AND " + " AND ".join(where)
+        sql += f" {order} LIMIT ?"
+        params.append(limit)
+        return [json.loads(data) for (data,) in self._conn.execute(sql, params)]
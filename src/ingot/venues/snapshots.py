@@ -0,0 +1,223 @@
+"""
+Compressed, offset-indexed snapshot store for venue feeds.
+
+Keeping every daily all.json verbatim costs a few MB per snapshot, and reading
+one company back means parsing the whole file. SnapshotStore instead keeps:
+
+    pack.bin            — append-only zlib-compressed company records, each
+                          stored once per distinct content (content_hash), so
+                          unchanged companies are shared across snapshots
+    pack.idx.npy        — (digest, offset, length) for every record in pack.bin
+    <name>.rows.npy     — per snapshot: (offset, length) of each company, feed order
+    <name>.keys.npy     — per snapshot: (key hash, row) sorted by key hash, with
+                          one entry for the id and one for the slug of each company
+
+Snapshot.get() memory-maps pack.bin and the index arrays, binary-searches the
+key hash and decompresses a single record — no full-feed decompression or JSON
+parse. Records are compressed with a preset dictionary of yc-oss field names,
+which matters for records this small.
+
+Default location: ~/.ingot/venues/store/
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ingot.scoring.features import content_hash
+
+_FORMAT_VERSION = 1
+_PACK_IDX_DTYPE = np.dtype([("digest", "S16"), ("offset", "<u8"), ("length", "<u4")])
+_ROWS_DTYPE = np.dtype([("offset", "<u8"), ("length", "<u4")])
+_KEYS_DTYPE = np.dtype([("hash", "<u8"), ("row", "<u4")])
+
+# Preset compression dictionary: the field names and boilerplate every yc-oss
+# record repeats. Changing it invalidates existing packs (bump _FORMAT_VERSION).
+_ZDICT = (
+    b'{"id": , "name": "", "slug": "", "former_names": [], "small_logo_thumb_url": "https://bookface-images.s3.'
+    b'amazonaws.com/small_logos/", "website": "https://www.", "all_locations": "", "long_description": "", '
+    b'"one_liner": "", "team_size": , "industry": "B2B", "subindustry": "", "launched_at": , "tags": [], '
+    b'"tags_highlighted": [], "top_company": false, "isHiring": true, "nonprofit": false, "batch": "Winter 20", '
+    b'"Summer 20", "status": "Active", "industries": [], "regions": ["United States of America", "America / Canada"], '
+    b'"stage": "Early", "Growth", "app_video_public": false, "demo_day_video_public": false, '
+    b'"question_answers": false, "url": "https://www.ycombinator.com/companies/", "api": '
+    b'"https://yc-oss.github.io/api/batches/'
+)
+
+
+def default_store_dir(base_dir: Path | None = None) -> Path:
+    """Return the venue snapshot store directory under the INGOT base dir (~/.ingot/ by default)."""
+    return (base_dir or Path.home() / ".ingot") / "venues" / "store"
+
+
+def _key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _lookup_keys(company: dict) -> set[str]:
+    keys = set()
+    if company.get("id") is not None:
+        keys.add(str(company["id"]))
+    if company.get("slug"):
+        keys.add(str(company["slug"]))
+    return keys
+
+
+def _compress(record: bytes) -> bytes:
+    compressor = zlib.compressobj(level=9, zdict=_ZDICT)
+    return compressor.compress(record) + compressor.flush()
+
+
+def _decompress(blob: bytes) -> bytes:
+    decompressor = zlib.decompressobj(zdict=_ZDICT)
+    return decompressor.decompress(blob) + decompressor.flush()
+
+
+def _save_npy(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as fh:
+        np.save(fh, array)
+    tmp.replace(path)
+
+
+@dataclass
+class SnapshotStats:
+    """What one SnapshotStore.write() did."""
+    companies: int
+    new_records: int
+    reused_records: int
+    bytes_written: int
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of one stored snapshot."""
+
+    def __init__(self, pack: mmap.mmap | bytes, rows: np.ndarray, keys: np.ndarray) -> None:
+        self._pack = pack
+        self._rows = rows
+        self._keys = keys
+        self._hashes = keys["hash"]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _record(self, row: int) -> dict:
+        offset, length = int(self._rows[row]["offset"]), int(self._rows[row]["length"])
+        return json.loads(_decompress(self._pack[offset:offset + length]))
+
+    def get(self, key: str | int) -> dict | None:
+        """Company whose id or slug equals ``key``, or None."""
+        key = str(key)
+        target = np.uint64(_key_hash(key))
+        i = int(np.searchsorted(self._hashes, target))
+        while i < len(self._keys) and self._hashes[i] == target:
+            company = self._record(int(self._keys[i]["row"]))
+            if key in _lookup_keys(company):  # guard against 64-bit hash collisions
+                return company
+            i += 1
+        return None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, (str, int)) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[dict]:
+        """All companies in original feed order."""
+        return (self._record(row) for row in range(len(self._rows)))
+
+
+class SnapshotStore:
+    """
+    Content-addressed store of venue feed snapshots.
+
+    Usage::
+
+        store = SnapshotStore()
+        store.write("yc-all-2026-10-17", companies)
+        snap = store.open("yc-all-2026-10-17")
+        snap.get("12345"), snap.get("airbnb")
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = root or default_store_dir()
+        self._pack_path = self.root / "pack.bin"
+        self._idx_path = self.root / "pack.idx.npy"
+        self._meta_path = self.root / "meta.json"
+
+    def names(self) -> list[str]:
+        """Stored snapshot names, sorted."""
+        return sorted(p.name[: -len(".rows.npy")] for p in self.root.glob("*.rows.npy"))
+
+    def _load_pack_index(self) -> dict[bytes, tuple[int, int]]:
+        if not self._idx_path.exists():
+            return {}
+        idx = np.load(self._idx_path)
+        return {bytes(d): (int(o), int(n)) for d, o, n in zip(idx["digest"], idx["offset"], idx["length"])}
+
+    def write(self, name: str, companies: Iterable[dict]) -> SnapshotStats:
+        """
+        Store ``companies`` as snapshot ``name`` (replacing any snapshot of that name).
+
+        Records already in the pack are referenced, not rewritten.
+        """
+        if "/" in name or name.startswith("."):
+            raise ValueError(f"Invalid snapshot name: {name!r}")
+        self.root.mkdir(parents=True, exist_ok=True)
+        if self._meta_path.exists():
+            version = json.loads(self._meta_path.read_text(encoding="utf-8"))["version"]
+            if version != _FORMAT_VERSION:
+                raise ValueError(f"Snapshot store format {version} is not supported (expected {_FORMAT_VERSION})")
+        else:
+            self._meta_path.write_text(json.dumps({"version": _FORMAT_VERSION}), encoding="utf-8")
+
+        pack_index = self._load_pack_index()
+        rows: list[tuple[int, int]] = []
+        keys: list[tuple[int, int]] = []
+        new_records = written = 0
+        with self._pack_path.open("ab") as pack:
+            end = pack.tell()
+            for row, company in enumerate(companies):
+                digest = bytes.fromhex(content_hash(company)[:32])
+                location = pack_index.get(digest)
+                if location is None:
+                    record = json.dumps(dict(company), ensure_ascii=False, separators=(",", ":"))
+                    blob = _compress(record.encode("utf-8"))
+                    pack.write(blob)
+                    location = pack_index[digest] = (end, len(blob))
+                    end += len(blob)
+                    new_records += 1
+                    written += len(blob)
+                rows.append(location)
+                keys.extend((_key_hash(key), row) for key in _lookup_keys(company))
+
+        # Pack first, then its index, then the snapshot: a crash leaves at worst unreferenced pack bytes
+        _save_npy(
+            self._idx_path,
+            np.array([(d, o, n) for d, (o, n) in pack_index.items()], dtype=_PACK_IDX_DTYPE),
+        )
+        key_array = np.array(keys, dtype=_KEYS_DTYPE)
+        key_array.sort(order=["hash", "row"])
+        _save_npy(self.root / f"{name}.keys.npy", key_array)
+        _save_npy(self.root / f"{name}.rows.npy", np.array(rows, dtype=_ROWS_DTYPE))
+        return SnapshotStats(
+            companies=len(rows),
+            new_records=new_records,
+            reused_records=len(rows) - new_records,
+            bytes_written=written,
+        )
+
+    def open(self, name: str) -> Snapshot:
+        """Memory-map snapshot ``name``. Raises FileNotFoundError if it does not exist."""
+        rows = np.load(self.root / f"{name}.rows.npy", mmap_mode="r")
+        keys = np.load(self.root / f"{name}.keys.npy", mmap_mode="r")
+        if self._pack_path.stat().st_size == 0:
+            return Snapshot(b"", rows, keys)
+        with self._pack_path.open("rb") as fh:
+            pack = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return Snapshot(pack, rows, keys)
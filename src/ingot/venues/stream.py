@@ -0,0 +1,111 @@
+"""
+Incremental parsing of JSON-array venue feeds.
+
+resp.json() keeps the whole response body and the fully materialised list of
+company dicts alive at the same time. JSONArrayParser instead consumes the body
+chunk by chunk (e.g. from httpx's aiter_bytes()) and yields each array element
+as soon as its closing brace has arrived, so peak memory is one chunk plus one
+partially received record, and consumers can start scoring mid-download.
+
+Only the shape venue feeds actually use is supported: a single top-level array.
+Elements are decoded with the stdlib JSONDecoder, so string escapes and nested
+values behave exactly as in json.loads().
+"""
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayParser:
+    """
+    Push parser for one top-level JSON array.
+
+    Usage::
+
+        parser = JSONArrayParser()
+        async for chunk in resp.aiter_bytes():
+            for company in parser.feed(chunk):
+                ...
+        parser.close()   # raises ValueError if the array was truncated
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._started = False  # saw "["
+        self._finished = False  # saw "]"
+        self._expect_value = True  # False right after an element, until "," is consumed
+        self.count = 0
+
+    def _skip_whitespace(self) -> None:
+        while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+            self._pos += 1
+
+    def feed(self, chunk: bytes) -> Iterator[object]:
+        """Add ``chunk`` and yield every element completed by it."""
+        self._buf += self._utf8.decode(chunk)
+        yield from self._drain(final=False)
+        # Drop consumed text so the buffer never holds more than one partial element
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+
+    def close(self) -> None:
+        """Finish the stream. Raises ValueError if the document is incomplete or has trailing data."""
+        self._buf += self._utf8.decode(b"", final=True)
+        for _ in self._drain(final=True):
+            pass
+        self._skip_whitespace()
+        if not self._finished:
+            raise ValueError(f"Truncated JSON array after {self.count} elements")
+        if self._pos != len(self._buf):
+            raise ValueError("Unexpected data after JSON array")
+
+    def _drain(self, final: bool) -> Iterator[object]:
+        while not self._finished:
+            self._skip_whitespace()
+            if self._pos >= len(self._buf):
+                return
+            char = self._buf[self._pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                self._started = True
+                self._pos += 1
+                continue
+            if char == "]" and (self.count == 0 or not self._expect_value):
+                self._finished = True
+                self._pos += 1
+                return
+            if not self._expect_value:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at element {self.count}, got {char!r}")
+                self._expect_value = True
+                self._pos += 1
+                continue
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise ValueError(f"Truncated JSON array after {self.count} elements") from None
+                return  # element not fully received yet
+            if end == len(self._buf) and not final and not isinstance(value, (dict, list, str)):
+                return  # a bare number/literal at the buffer edge may continue in the next chunk
+            self._pos = end
+            self._expect_value = False
+            self.count += 1
+            yield value
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[object]:
+    """Yield the elements of a JSON array streamed as byte chunks."""
+    parser = JSONArrayParser()
+    async for chunk in chunks:
+        for value in parser.feed(chunk):
+            yield value
+    parser.close()
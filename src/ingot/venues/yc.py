@@ -10,27 +10,86 @@ DO NOT scrape ycombinator.com directly:
 - Their company directory uses Algolia + infinite scroll JS rendering
 - httpx GET returns <div id="__next"> with no company data (Pitfall 1 in 02-RESEARCH.md)
 """
+from __future__ import annotations
+
 import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AbstractAsyncContextManager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from ingot.db.models import Venue
+from ingot.http_cache import STREAMING_EXTENSION
+from ingot.scoring.corpus import company_key
+from ingot.scoring.features import content_hash
+from ingot.venues.base import VenueBase, register_venue
+from ingot.venues.cache import VenueCache
+from ingot.venues.stream import iter_json_array
+
+if TYPE_CHECKING:
+    from ingot.venues.catalogue import YCCatalogue
 
 YC_OSS_BASE_URL = "https://yc-oss.github.io/api"
 YC_HEADERS = {"User-Agent": "INGOT/0.1 (outreach tool; github.com/ingot-app/ingot)"}
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+async def _get_feed(http_client: httpx.AsyncClient, url: str, cache: VenueCache | None) -> list[dict]:
+    """GET one feed and parse it; revalidates against ``cache`` when one is given."""
+    if cache is not None:
+        return json.loads(await cache.fetch(http_client, url, headers=YC_HEADERS, timeout=30.0))
+    resp = await http_client.get(url, headers=YC_HEADERS, timeout=30.0)
+    resp.raise_for_status()
+    return resp.json()
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    retry=retry_if_exception_type(httpx.HTTPError),
+)
+async def _fetch_feed(
+    http_client: httpx.AsyncClient, batch: str | None, industry: str | None, cache: VenueCache | None
+) -> tuple[list[dict], bool]:
+    """GET one feed with the 404 fallback. Returns (companies, whether they are the full catalogue)."""
+    try:
+        return await _get_feed(http_client, _feed_url(batch, industry), cache), not (batch or industry)
+    except httpx.HTTPStatusError:
+        if batch or industry:
+            # Batch/industry not found — fall back to all companies
+            return await _get_feed(http_client, _feed_url(None, None), cache), True
+        raise
+
+
 async def fetch_yc_companies(
     http_client: httpx.AsyncClient,
     batch: str | None = None,
     industry: str | None = None,
+    cache: VenueCache | None = None,
+    catalogue: YCCatalogue | None = None,
 ) -> list[dict]:
     """
     Fetch YC company records from yc-oss GitHub Pages API.
 
+    The "more than 100 companies" sanity check applies only when the result is
+    the full catalogue (companies/all.json); batch and industry feeds are often
+    small. Only network/HTTP errors are retried.
+
     Args:
         http_client: Shared async httpx client (from ScoutDeps)
         batch: YC batch slug e.g. "winter-2025", "summer-2024". None = all companies.
         industry: Industry slug e.g. "b2b", "consumer". None = all industries.
+        cache: Optional on-disk VenueCache. Feeds are revalidated with conditional
+            GETs and unchanged feeds (304) are served from disk.
+        catalogue: Optional local YCCatalogue (see load_yc_catalogue). When given,
+            the query is answered from its indexes with no network access; an
+            unknown batch/industry falls back to the whole catalogue, like a 404.
 
     Returns:
         List of company dicts. Each has: id, name, slug, website, one_liner,
@@ -39,30 +98,247 @@ async def fetch_yc_companies(
     Raises:
         httpx.HTTPError on network failure (tenacity retries 3 times).
     """
+    if catalogue is not None:
+        companies = catalogue.query(batch=batch, industry=industry)
+        return companies if companies or not (batch or industry) else catalogue.query()
+
+    companies, full_catalogue = await _fetch_feed(http_client, batch, industry, cache)
+    assert isinstance(companies, list), f"Expected list, got {type(companies)}"
+    if full_catalogue:
+        assert len(companies) > 100, f"Suspiciously few companies: {len(companies)}"
+    return companies
+
+
+# Marks feed downloads as incremental reads so the shared client's coalescing and
+# cache layers pass the body through instead of buffering all of it first
+_STREAMING = {STREAMING_EXTENSION: True}
+
+
+def _feed_url(batch: str | None, industry: str | None) -> str:
     if batch:
-        url = f"{YC_OSS_BASE_URL}/batches/{batch}.json"
-    elif industry:
-        url = f"{YC_OSS_BASE_URL}/industries/{industry}.json"
-    else:
-        url = f"{YC_OSS_BASE_URL}/companies/all.json"
+        return f"{YC_OSS_BASE_URL}/batches/{batch}.json"
+    if industry:
+        return f"{YC_OSS_BASE_URL}/industries/{industry}.json"
+    return f"{YC_OSS_BASE_URL}/companies/all.json"
 
-    try:
-        resp = await http_client.get(url, headers=YC_HEADERS, timeout=30.0)
-        resp.raise_for_status()
-        companies = resp.json()
-    except httpx.HTTPStatusError:
-        if batch or industry:
+
+async def iter_yc_companies(
+    http_client: httpx.AsyncClient,
+    batch: str | None = None,
+    industry: str | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Stream YC company records one at a time while the feed downloads.
+
+    Same feeds and 404 fallback as fetch_yc_companies(), but the JSON array is
+    parsed incrementally from the response chunks, so memory stays bounded by
+    one chunk plus one record and callers can score before the download ends.
+    Unlike fetch_yc_companies() there is no retry: records already yielded
+    cannot be taken back, so a mid-stream failure propagates to the caller.
+
+    Raises:
+        httpx.HTTPError on network failure; ValueError if the body is not a
+        complete JSON array.
+    """
+    url = _feed_url(batch, industry)
+    async with http_client.stream("GET", url, headers=YC_HEADERS, timeout=30.0, extensions=_STREAMING) as resp:
+        if resp.status_code == 404 and (batch or industry):
             # Batch/industry not found — fall back to all companies
-            resp = await http_client.get(
-                f"{YC_OSS_BASE_URL}/companies/all.json",
-                headers=YC_HEADERS,
-                timeout=30.0
-            )
-            resp.raise_for_status()
-            companies = resp.json()
+            url = _feed_url(None, None)
         else:
-            raise
+            resp.raise_for_status()
+            async for company in iter_json_array(resp.aiter_bytes()):
+                yield company
+            return
+    async with http_client.stream("GET", url, headers=YC_HEADERS, timeout=30.0, extensions=_STREAMING) as resp:
+        resp.raise_for_status()
+        async for company in iter_json_array(resp.aiter_bytes()):
+            yield company
 
-    assert isinstance(companies, list), f"Expected list, got {type(companies)}"
-    assert len(companies) > 100, f"Suspiciously few companies: {len(companies)}"
-    return companies
+
+async def fetch_yc_many(
+    http_client: httpx.AsyncClient,
+    batches: Iterable[str] = (),
+    industries: Iterable[str] = (),
+    max_concurrency: int = 4,
+    cache: VenueCache | None = None,
+    limiter: AbstractAsyncContextManager | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Fetch several batch/industry feeds concurrently and stream the merged companies.
+
+    At most ``max_concurrency`` feeds are in flight on the shared client. Each
+    feed keeps fetch_yc_companies()'s retry and 404 fallback; feeds are merged
+    in completion order and companies are deduplicated by ``id``, so the first
+    feed to finish contributes first. If any feed fails after its retries the
+    error propagates and the remaining fetches are cancelled.
+
+    ``limiter`` replaces the built-in semaphore with any async context manager
+    entered around each feed fetch (e.g. a plugin's VenueLimiter, which also
+    enforces a request rate).
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+    gate = limiter or asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(batch: str | None, industry: str | None) -> list[dict]:
+        async with gate:
+            return await fetch_yc_companies(http_client, batch=batch, industry=industry, cache=cache)
+
+    feeds = [(b, None) for b in dict.fromkeys(batches)] + [(None, i) for i in dict.fromkeys(industries)]
+    tasks = [asyncio.create_task(fetch_one(b, i)) for b, i in feeds]
+    seen: set = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for company in await next_done:
+                company_id = company.get("id")
+                if company_id is not None:
+                    if company_id in seen:
+                        continue
+                    seen.add(company_id)
+                yield company
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@register_venue
+class YCVenue(VenueBase):
+    """
+    yc-oss venue plugin.
+
+    config_json options (besides the VenuePolicy keys):
+        batches:    list of batch slugs, e.g. ["winter-2025"]
+        industries: list of industry slugs, e.g. ["fintech"]
+    With neither, the full catalogue is streamed from companies/all.json.
+    """
+
+    venue_type = "yc"
+
+    async def discover(self, http_client: httpx.AsyncClient) -> AsyncIterator[dict]:
+        batches = self.options.get("batches") or []
+        industries = self.options.get("industries") or []
+        if not batches and not industries:
+            async with self.limiter:
+                async for company in iter_yc_companies(http_client):
+                    yield company
+            return
+        async for company in fetch_yc_many(
+            http_client,
+            batches,
+            industries,
+            max_concurrency=self.policy.max_concurrency,
+            cache=self.cache,
+            limiter=self.limiter,
+        ):
+            yield company
+
+
+# ---------------------------------------------------------------------------
+# Delta sync
+# ---------------------------------------------------------------------------
+
+@dataclass
+class YCDelta:
+    """
+    Companies added, changed and removed since the previous snapshot of a feed.
+
+    ``snapshot`` is the feed's new key → content-hash map. It is only persisted
+    by commit_snapshot() (record_venue_run() calls it), so a run that fails
+    while scoring or deduping the delta reports the same delta next time.
+    """
+    added: list[dict] = field(default_factory=list)
+    changed: list[dict] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)  # company keys (yc-oss id as str)
+    total: int = 0  # size of the current feed
+    snapshot: dict[str, str] = field(default_factory=dict, repr=False)
+    snapshot_path: Path | None = field(default=None, repr=False)
+
+    @property
+    def updated(self) -> list[dict]:
+        """Added + changed records — the set that needs scoring and dedup."""
+        return self.added + self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def commit_snapshot(self) -> None:
+        """Atomically write ``snapshot`` to ``snapshot_path``; a no-op for deltas built without one."""
+        if self.snapshot_path is None:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.snapshot, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.snapshot_path)
+
+
+def default_snapshot_path(
+    base_dir: Path | None = None, batch: str | None = None, industry: str | None = None
+) -> Path:
+    """Per-feed hash snapshot file under ~/.ingot/venues/snapshots/."""
+    name = f"batch-{batch}" if batch else f"industry-{industry}" if industry else "all"
+    return (base_dir or Path.home() / ".ingot") / "venues" / "snapshots" / f"yc-{name}.hashes.json"
+
+
+def diff_companies(companies: list[dict], previous: dict[str, str]) -> tuple[YCDelta, dict[str, str]]:
+    """
+    Compare a feed against the previous key → content-hash snapshot.
+
+    Returns the delta and the new snapshot to persist.
+    """
+    current: dict[str, str] = {}
+    delta = YCDelta(total=len(companies))
+    for company in companies:
+        key = company_key(company)
+        digest = content_hash(company)
+        current[key] = digest
+        old = previous.get(key)
+        if old is None:
+            delta.added.append(company)
+        elif old != digest:
+            delta.changed.append(company)
+    delta.removed = [key for key in previous if key not in current]
+    return delta, current
+
+
+async def fetch_yc_delta(
+    http_client: httpx.AsyncClient,
+    snapshot_path: Path,
+    batch: str | None = None,
+    industry: str | None = None,
+    cache: VenueCache | None = None,
+) -> YCDelta:
+    """
+    Fetch a feed and return only what changed since the last committed snapshot at snapshot_path.
+
+    The first run (no snapshot yet) reports every company as added. Nothing is
+    written here: once the delta has been scored and deduped, persist the new
+    snapshot with record_venue_run() or delta.commit_snapshot(). Until then,
+    every run keeps reporting the same changes.
+    """
+    companies = await fetch_yc_companies(http_client, batch=batch, industry=industry, cache=cache)
+    previous: dict[str, str] = {}
+    if snapshot_path.exists():
+        previous = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    delta, current = diff_companies(companies, previous)
+    delta.snapshot = current
+    delta.snapshot_path = snapshot_path
+    return delta
+
+
+async def record_venue_run(session: AsyncSession, venue: Venue, delta: YCDelta) -> Venue:
+    """
+    Record a processed delta: last_run_at and newly discovered count on the Venue row.
+
+    Call once the delta's companies have been scored and deduped. The Venue row
+    is committed first and the feed snapshot second, so a failure in between
+    re-reports the delta rather than losing it.
+    """
+    venue.last_run_at = datetime.utcnow()
+    venue.lead_count_discovered += len(delta.added)
+    venue.last_error = ""
+    session.add(venue)
+    await session.commit()
+    await session.refresh(venue)
+    delta.commit_snapshot()
+    return venue
@@ -0,0 +1,52 @@
+"""Smoke tests keeping the benchmark suite importable and runnable."""
+from __future__ import annotations
+
+from benchmarks.bench_discovery import run_benchmarks as run_discovery
+from benchmarks.bench_scoring import run_benchmarks
+from benchmarks.corpus import load_fixture, scale_companies, synthetic_companies
+from benchmarks.ycoss import YCOSSStandIn
+from ingot.venues.cache import VenueCache
+from ingot.venues.yc import fetch_yc_companies, iter_yc_companies
+
+
+def test_synthetic_companies_deterministic_and_shaped():
+    companies = synthetic_companies(5, seed=1)
+    assert companies == synthetic_companies(5, seed=1)
+    assert {"id", "name", "one_liner", "long_description", "tags", "batch", "stage", "isHiring"} <= companies[0].keys()
+
+
+def test_load_fixture_missing(tmp_path):
+    assert load_fixture(tmp_path / "missing.json") is None
+
+
+def test_run_benchmarks_small():
+    results = run_benchmarks({"tiny": synthetic_companies(20)}, single_limit=5, memory=False)
+    assert {r.case for r in results} >= {"score_lead", "score_leads", "top_k_leads[k=50]"}
+    assert all(r.companies_per_sec > 0 for r in results)
+
+
+def test_scale_companies_unique_ids():
+    base = synthetic_companies(3)
+    scaled = scale_companies(base, 10)
+    assert len(scaled) == 10 and scaled[:3] == base
+    assert len({c["id"] for c in scaled}) == len({c["slug"] for c in scaled}) == 10
+
+
+async def test_ycoss_stand_in_serves_views_etags_and_overrides(tmp_path):
+    companies = synthetic_companies(150)
+    batch_path = next(p for p in YCOSSStandIn(companies).paths() if "/batches/" in p)
+    server = YCOSSStandIn(companies, chunk_size=1024, status_overrides={batch_path: 404})
+    cache = VenueCache(tmp_path)
+    async with server.client() as client:
+        assert await fetch_yc_companies(client, cache=cache) == companies
+        assert await fetch_yc_companies(client, cache=cache) == companies
+        streamed = [c async for c in iter_yc_companies(client, batch=batch_path.rsplit("/", 1)[1][:-5])]
+    assert streamed == companies  # overridden 404 falls back to all.json
+    assert server.statuses == {200: 2, 304: 1, 404: 1}
+    assert server.bytes_sent == 2 * len(server.feeds["/api/companies/all.json"])
+
+
+def test_run_discovery_benchmarks_small():
+    results = run_discovery({"tiny": synthetic_companies(150)}, memory=False)
+    assert {r.case for r in results} >= {"fetch+score_leads", "fetch[cache 304]", "stream+top_k_async[k=50]"}
+    assert all(r.companies == 150 and r.companies_per_sec > 0 for r in results)
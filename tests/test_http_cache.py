@@ -0,0 +1,155 @@
+"""Tests for ingot.http_cache: persistent RFC 9111-style response cache transport."""
+from __future__ import annotations
+
+import gzip
+import os
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from ingot.http_cache import (
+    STREAMING_EXTENSION,
+    CacheTransport,
+    default_http_cache_path,
+    freshness_lifetime,
+    parse_cache_control,
+)
+
+
+class Origin:
+    """Mock origin server recording requests; responses are configured per path."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.routes: dict[str, dict] = {}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        route = self.routes.get(request.url.path, {})
+        headers = dict(route.get("headers", {}))
+        etag = headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag, "Cache-Control": headers.get("Cache-Control", "")})
+        return httpx.Response(route.get("status", 200), headers=headers, content=route.get("body", b"page"))
+
+
+def _client(origin: Origin, **kwargs) -> tuple[httpx.AsyncClient, CacheTransport]:
+    transport = CacheTransport(httpx.MockTransport(origin.handler), **kwargs)
+    return httpx.AsyncClient(transport=transport), transport
+
+
+def test_parse_cache_control_and_freshness():
+    assert parse_cache_control('max-age=60, No-Cache, private="x"') == {
+        "max-age": "60",
+        "no-cache": True,
+        "private": "x",
+    }
+    now = 1_000_000.0
+    assert freshness_lifetime(httpx.Headers({"Cache-Control": "max-age=60", "Age": "10"}), now) == 50
+    assert freshness_lifetime(httpx.Headers({}), now) == 0
+    assert freshness_lifetime(httpx.Headers({}), now, default_ttl=300) == 300
+    expires = {"Date": formatdate(now, usegmt=True), "Expires": formatdate(now + 120, usegmt=True)}
+    assert freshness_lifetime(httpx.Headers(expires), now) == 120
+    heuristic = {"Date": formatdate(now, usegmt=True), "Last-Modified": formatdate(now - 1000, usegmt=True)}
+    assert freshness_lifetime(httpx.Headers(heuristic), now) == pytest.approx(100)
+
+
+async def test_fresh_response_served_from_cache(tmp_path):
+    origin = Origin()
+    origin.routes["/about"] = {"headers": {"Cache-Control": "max-age=600"}, "body": b"about us"}
+    client, transport = _client(origin, path=default_http_cache_path(tmp_path))
+    async with client:
+        first = await client.get("https://acme.test/about")
+        second = await client.get("https://acme.test/about")
+    assert first.text == second.text == "about us"
+    assert second.extensions.get("from_cache") is True
+    assert len(origin.requests) == 1
+    assert (transport.hits, transport.misses) == (1, 1)
+
+
+async def test_stale_entry_revalidated_with_etag():
+    origin = Origin()
+    origin.routes["/blog"] = {"headers": {"Cache-Control": "no-cache", "ETag": '"v1"'}, "body": b"post"}
+    client, transport = _client(origin)
+    async with client:
+        await client.get("https://acme.test/blog")
+        again = await client.get("https://acme.test/blog")
+    assert again.status_code == 200 and again.text == "post"
+    assert origin.requests[1].headers["If-None-Match"] == '"v1"'
+    assert transport.revalidations == 1
+
+
+async def test_forced_ttl_for_headerless_pages_and_no_store():
+    origin = Origin()
+    origin.routes["/plain"] = {}
+    origin.routes["/secret"] = {"headers": {"Cache-Control": "no-store, max-age=600"}}
+    client, transport = _client(origin, default_ttl=3600)
+    async with client:
+        for _ in range(2):
+            await client.get("https://acme.test/plain")
+            await client.get("https://acme.test/secret")
+        await client.post("https://acme.test/plain")
+        await client.get("https://acme.test/plain", headers={"Cache-Control": "no-store"})
+        assert len(transport) == 1
+    assert [r.url.path for r in origin.requests] == ["/plain", "/secret", "/secret", "/plain", "/plain"]
+
+
+async def test_vary_and_gzip_bodies_round_trip():
+    origin = Origin()
+    origin.routes["/"] = {
+        "headers": {"Cache-Control": "max-age=600", "Vary": "Accept-Language", "Content-Encoding": "gzip"},
+        "body": gzip.compress(b"hello"),
+    }
+    client, _ = _client(origin)
+    async with client:
+        en = await client.get("https://acme.test/", headers={"Accept-Language": "en"})
+        en_cached = await client.get("https://acme.test/", headers={"Accept-Language": "en"})
+        await client.get("https://acme.test/", headers={"Accept-Language": "fr"})
+    assert en.text == en_cached.text == "hello"
+    assert len(origin.requests) == 2
+
+
+async def test_lru_eviction_bounds_size():
+    origin = Origin()
+    for i in range(3):
+        origin.routes[f"/{i}"] = {"headers": {"Cache-Control": "max-age=600"}, "body": os.urandom(1000)}
+    client, transport = _client(origin, max_bytes=2500)  # room for two incompressible bodies
+    async with client:
+        for path in ("/0", "/1", "/0", "/2", "/0", "/1"):
+            await client.get(f"https://acme.test{path}")
+        assert transport.size_bytes() <= 2500
+    assert [r.url.path for r in origin.requests] == ["/0", "/1", "/2", "/1"]
+    assert transport.hits == 2 and transport.evictions == 2
+
+
+async def test_caller_conditional_requests_pass_through():
+    origin = Origin()
+    origin.routes["/feed"] = {"headers": {"Cache-Control": "max-age=600", "ETag": '"f"'}}
+    client, transport = _client(origin)
+    async with client:
+        await client.get("https://acme.test/feed")
+        resp = await client.get("https://acme.test/feed", headers={"If-None-Match": '"f"'})
+    assert resp.status_code == 304
+    assert transport.hits == 0
+
+
+async def test_streamed_miss_is_passed_through_unbuffered():
+    pulled = []
+
+    class Chunks(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for i in range(100):
+                pulled.append(i)
+                yield b"x" * 1024
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Cache-Control": "max-age=600"}, stream=Chunks())
+
+    transport = CacheTransport(httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        extensions = {STREAMING_EXTENSION: True}
+        async with client.stream("GET", "https://acme.test/feed", extensions=extensions) as resp:
+            await anext(resp.aiter_raw())
+        assert len(pulled) == 1
+        assert len(transport) == 0 and transport.misses == 1
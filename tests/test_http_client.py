@@ -1,7 +1,21 @@
 """Tests for ingot.http_client singleton."""
+import asyncio
+import time
+from email.utils import formatdate
+
 import httpx
+import pytest
 
-from ingot.http_client import HttpClientConfig, close_http_client, get_http_client
+from ingot.http_cache import CacheTransport
+from ingot.http_client import (
+    AdaptiveConcurrencyTransport,
+    CoalescingTransport,
+    HttpClientConfig,
+    RateLimitTransport,
+    _retry_after_seconds,
+    close_http_client,
+    get_http_client,
+)
 
 
 async def test_singleton_returns_same_instance():
@@ -36,3 +50,201 @@ async def test_close_resets_config_snapshot():
     await close_http_client()
     from ingot.http_client import _config_snapshot as snap_after
     assert snap_after is None
+
+
+def _recording_transport(times: dict[str, list[float]]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        times.setdefault(request.url.host, []).append(time.monotonic())
+        return httpx.Response(200)
+    return httpx.MockTransport(handler)
+
+
+async def test_rate_limit_spaces_same_host_only():
+    times: dict[str, list[float]] = {}
+    transport = RateLimitTransport(_recording_transport(times), delay=0.05)
+    async with httpx.AsyncClient(transport=transport) as client:
+        start = time.monotonic()
+        await asyncio.gather(*(client.get(f"https://{h}/") for h in ["a.test"] * 3 + ["b.test"] * 3 + ["c.test"]))
+        elapsed = time.monotonic() - start
+    for host in ("a.test", "b.test"):
+        gaps = [b - a for a, b in zip(times[host], times[host][1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+    assert elapsed < 0.25  # hosts throttled in parallel, not serially (would be >= 0.2 + overhead)
+    assert transport.waited_seconds > 0
+
+
+async def test_rate_limit_burst_allows_back_to_back():
+    times: dict[str, list[float]] = {}
+    transport = RateLimitTransport(_recording_transport(times), delay=0.2, burst=3)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(3):
+            await client.get("https://a.test/")
+    assert times["a.test"][-1] - times["a.test"][0] < 0.1
+    assert transport.waited_seconds == 0
+
+
+def test_rate_limit_rejects_bad_config():
+    with pytest.raises(ValueError):
+        RateLimitTransport(httpx.MockTransport(lambda r: httpx.Response(200)), delay=-1)
+
+
+async def test_shared_client_enforces_request_delay():
+    await close_http_client()
+    client = get_http_client(HttpClientConfig(request_delay_seconds=0.5))
+    limiter = client._transport._transport
+    assert isinstance(limiter, RateLimitTransport)
+    assert limiter.delay == 0.5
+    await close_http_client()
+
+
+async def test_shared_client_with_cache_path(tmp_path):
+    await close_http_client()
+    client = get_http_client(HttpClientConfig(cache_path=tmp_path / "http_cache.db", cache_default_ttl_seconds=60))
+    cache = client._transport._transport
+    assert isinstance(cache, CacheTransport)
+    assert cache.default_ttl == 60
+    await close_http_client()
+
+
+async def test_coalescing_shares_one_request():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, content=f"body {request.url.path}".encode())
+
+    transport = CoalescingTransport(httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(*(client.get("https://acme.test/about") for _ in range(5)))
+        other = await client.get("https://acme.test/about", headers={"Accept-Language": "fr"})
+        later = await client.get("https://acme.test/about")
+    assert {r.text for r in responses} == {"body /about"}
+    assert calls == 3  # one coalesced burst, one distinct header set, one after the burst finished
+    assert transport.coalesced == 4 and transport.requests == 7
+    assert other.text == later.text == "body /about"
+
+
+async def test_coalescing_propagates_errors_and_survives_leader_cancel():
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(0.02)
+        if request.url.path == "/down":
+            raise httpx.ConnectError("down", request=request)
+        return httpx.Response(200, content=b"ok")
+
+    transport = CoalescingTransport(httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        results = await asyncio.gather(
+            *(client.get("https://acme.test/down") for _ in range(2)), return_exceptions=True
+        )
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+        leader = asyncio.create_task(client.get("https://acme.test/ok"))
+        await started.wait()
+        follower = asyncio.create_task(client.get("https://acme.test/ok"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert (await follower).text == "ok"
+
+
+async def test_shared_client_coalesces():
+    await close_http_client()
+    assert isinstance(get_http_client()._transport, CoalescingTransport)
+    await close_http_client()
+
+
+async def test_shared_client_adaptive_latency_excludes_rate_limit_wait():
+    await close_http_client()
+    client = get_http_client(HttpClientConfig(request_delay_seconds=0.2))
+    adaptive = client._transport._transport._transport
+    assert isinstance(adaptive, AdaptiveConcurrencyTransport)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200)
+
+    adaptive._transport = httpx.MockTransport(handler)
+    try:
+        for _ in range(3):
+            await client.get("https://acme.test/")
+        # A fast host is never mistaken for a latency spike because of the polite delay
+        assert adaptive.window("acme.test") > 2
+    finally:
+        await close_http_client()
+
+
+async def test_adaptive_window_grows_on_fast_successes():
+    transport = AdaptiveConcurrencyTransport(
+        httpx.MockTransport(lambda r: httpx.Response(200)), initial=2, maximum=6
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(40):
+            await client.get("https://fast.test/")
+    assert transport.window("fast.test") == 6
+    assert transport.window("other.test") == 2
+
+
+async def test_adaptive_window_caps_in_flight_per_host():
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=b"x" * 10)
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(handler), initial=3, maximum=3)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(*(client.get("https://a.test/") for _ in range(12)))
+    assert peak == 3
+
+
+async def test_adaptive_shrinks_on_429_and_honours_retry_after():
+    times: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        times.append(time.monotonic())
+        if len(times) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.1"})
+        return httpx.Response(200)
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(handler), initial=4, maximum=8)
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await client.get("https://busy.test/")
+        assert first.status_code == 429
+        assert transport.window("busy.test") == 2
+        await client.get("https://busy.test/")
+    assert times[1] - times[0] >= 0.09
+
+
+async def test_adaptive_shrinks_on_latency_spike_and_errors():
+    delays = [0.0] * 5 + [0.05]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delays.pop(0) if delays else 0)
+        if request.url.path == "/down":
+            raise httpx.ConnectError("down", request=request)
+        return httpx.Response(200)
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(handler), initial=4, maximum=10)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(5):
+            await client.get("https://slow.test/")
+        grown = transport.window("slow.test")
+        await client.get("https://slow.test/")
+        assert transport.window("slow.test") == pytest.approx(grown / 2)
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://slow.test/down")
+        assert transport.window("slow.test") == pytest.approx(max(1.0, grown / 4))
+
+
+def test_retry_after_parsing():
+    assert _retry_after_seconds("3") == 3.0
+    assert _retry_after_seconds(None) is None and _retry_after_seconds("soon") is None
+    assert 0 < _retry_after_seconds(formatdate(time.time() + 30, usegmt=True)) <= 30
@@ -0,0 +1,117 @@
+"""Tests for ingot.http_text: streaming, early-terminating page text extraction."""
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from ingot.http_client import HttpClientConfig, close_http_client, get_http_client
+from ingot.http_text import clean_text, fetch_text
+
+PAGE = b"""<!doctype html>
+<html><head>
+  <title> Acme  | Developer tools </title>
+  <meta name="description" content="Acme builds APIs.">
+  <meta property="og:site_name" content="Acme">
+  <meta name="viewport" content="width=device-width">
+  <style>body { color: red }</style>
+  <script>var tracking = "do not include";</script>
+</head>
+<body>
+  <nav>Home</nav><nav>Home</nav>
+  <h1>About   Acme</h1>
+  <p>We build <b>Python</b> and Rust infrastructure.</p>
+  <noscript>Enable JS</noscript>
+  <ul><li>Hiring engineers</li><li>Remote</li></ul>
+</body></html>"""
+
+
+class CountingStream(httpx.AsyncByteStream):
+    """Response body served in chunks, recording how many were pulled."""
+
+    def __init__(self, body: bytes, chunk: int) -> None:
+        self.body, self.chunk, self.sent = body, chunk, 0
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk):
+            self.sent += 1
+            yield self.body[start:start + self.chunk]
+
+
+def _client(body: bytes, content_type: str = "text/html; charset=utf-8", chunk: int = 64, status: int = 200):
+    stream = CountingStream(body, chunk)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, headers={"Content-Type": content_type}, stream=stream)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), stream
+
+
+def test_clean_text():
+    assert clean_text("  a   b \n\n a   b\n c\t\n") == "a b\nc"
+
+
+async def test_extracts_visible_text_title_and_meta():
+    client, _ = _client(PAGE)
+    async with client:
+        page = await fetch_text("https://acme.test/about", http_client=client)
+    assert page.title == "Acme | Developer tools"
+    assert page.meta == {"description": "Acme builds APIs.", "og:site_name": "Acme"}
+    assert page.text == "Home\nAbout Acme\nWe build Python and Rust infrastructure.\nHiring engineers\nRemote"
+    assert not page.truncated and page.bytes_read == len(PAGE)
+
+
+async def test_stops_early_on_text_budget_and_byte_cap():
+    paragraphs = "".join(f"<p>paragraph {i}: lorem ipsum dolor sit amet</p>" for i in range(10_000))
+    body = b"<html><body>" + paragraphs.encode() + b"</body></html>"
+    client, stream = _client(body, chunk=1024)
+    async with client:
+        page = await fetch_text("https://acme.test/", stop_after=500, http_client=client)
+        assert page.truncated and len(page.text) == 500
+        assert stream.sent < 5
+        capped = await fetch_text("https://acme.test/", max_bytes=4096, http_client=client)
+    assert capped.truncated and capped.bytes_read == 4096
+
+
+async def test_empty_body_and_body_exactly_at_byte_cap():
+    client, _ = _client(b"")
+    async with client:
+        empty = await fetch_text("https://acme.test/empty", http_client=client)
+    assert empty.text == "" and empty.title == "" and not empty.truncated
+
+    client, _ = _client(PAGE, chunk=64)
+    async with client:
+        exact = await fetch_text("https://acme.test/", max_bytes=len(PAGE), http_client=client)
+        over = await fetch_text("https://acme.test/", max_bytes=len(PAGE) - 1, http_client=client)
+    assert not exact.truncated and exact.bytes_read == len(PAGE)
+    assert over.truncated and over.bytes_read == len(PAGE) - 1
+
+
+async def test_plain_text_and_binary_content_types():
+    client, _ = _client(b"line one\n\nline   two\n", content_type="text/plain")
+    async with client:
+        assert (await fetch_text("https://acme.test/robots.txt", http_client=client)).text == "line one\nline two"
+    client, stream = _client(b"%PDF-1.7 ...", content_type="application/pdf")
+    async with client:
+        page = await fetch_text("https://acme.test/deck.pdf", http_client=client)
+    assert page.text == "" and stream.sent == 0
+
+
+async def test_http_errors_raise():
+    client, _ = _client(b"gone", status=404)
+    async with client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetch_text("https://acme.test/missing", http_client=client)
+
+
+async def test_shared_client_stack_does_not_buffer_stream(tmp_path):
+    await close_http_client()
+    shared = get_http_client(HttpClientConfig(request_delay_seconds=0, cache_path=tmp_path / "http_cache.db"))
+    body = ("<html><body>" + "".join(f"<p>text {i}</p>" for i in range(50_000)) + "</body></html>").encode()
+    stream = CountingStream(body, 1024)
+    network = shared._transport._transport._transport._transport  # AdaptiveConcurrencyTransport
+    network._transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": "text/html"}, stream=stream)
+    )
+    page = await fetch_text("https://acme.test/", stop_after=200)
+    await close_http_client()
+    assert page.truncated and stream.sent < 5
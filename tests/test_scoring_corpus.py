@@ -0,0 +1,96 @@
+"""Tests for ingot.scoring.corpus.CorpusModel: fit, incremental update, persistence."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ingot.scoring.corpus import CorpusModel, company_key, default_corpus_dir, refresh_corpus
+from ingot.scoring.scorer import component_matrix
+
+COMPANIES = [
+    {"id": 1, "long_description": "Python and Rust infrastructure for developer tools."},
+    {"id": 2, "long_description": "Consumer social app for sharing photos with friends."},
+    {"id": 3, "one_liner": "Payments API for online marketplaces."},
+]
+RESUME = "Backend engineer: Python, Rust, developer infrastructure."
+
+
+def test_company_key_fallbacks():
+    assert company_key({"id": 7}) == "7"
+    assert company_key({"slug": "acme"}) == "acme"
+    assert company_key({"name": "Acme"}) == "Acme"
+
+
+def test_similarities_rank_relevant_company_first():
+    model = CorpusModel.fit(COMPANIES)
+    sims = model.similarities(RESUME)
+    assert sims.shape == (3,)
+    assert sims.argmax() == 0
+    assert ((sims >= 0.0) & (sims <= 1.0)).all()
+
+
+def test_empty_resume_scores_zero():
+    model = CorpusModel.fit(COMPANIES)
+    assert (model.similarities("") == 0.0).all()
+
+
+def test_update_only_adds_new_companies():
+    model = CorpusModel.fit(COMPANIES[:2])
+    assert model.update(COMPANIES) == 1
+    assert model.update(COMPANIES) == 0
+    assert len(model) == 3
+
+
+def test_incremental_matches_full_fit():
+    incremental = CorpusModel.fit(COMPANIES[:1])
+    incremental.update(COMPANIES[1:])
+    full = CorpusModel.fit(COMPANIES)
+    np.testing.assert_allclose(incremental.similarities(RESUME), full.similarities(RESUME))
+
+
+def test_save_load_roundtrip_mmap(tmp_path):
+    model = CorpusModel.fit(COMPANIES)
+    model.save(tmp_path)
+    loaded = CorpusModel.load(tmp_path)
+    assert loaded.keys == model.keys
+    np.testing.assert_allclose(loaded.similarities(RESUME), model.similarities(RESUME))
+    # A loaded (mmapped) model can still be updated
+    assert loaded.update([{"id": 4, "long_description": "Rust compilers"}]) == 1
+
+
+def test_scores_for_aligns_and_zeroes_unknown():
+    model = CorpusModel.fit(COMPANIES)
+    scores = model.scores_for([COMPANIES[2], {"id": 99, "long_description": "x"}, COMPANIES[0]], RESUME)
+    sims = model.similarities(RESUME)
+    assert scores[0] == pytest.approx(sims[2])
+    assert scores[1] == 0.0
+    assert scores[2] == pytest.approx(sims[0])
+
+
+def test_refresh_corpus_persists_under_base_dir(tmp_config_dir):
+    refresh_corpus(COMPANIES[:2], base_dir=tmp_config_dir)
+    path = default_corpus_dir(tmp_config_dir)
+    assert (path / "meta.json").exists()
+    model = refresh_corpus(COMPANIES, base_dir=tmp_config_dir)
+    assert len(model) == 3
+    assert len(CorpusModel.load(path)) == 3
+
+
+def test_interrupted_save_is_detected_and_refitted(tmp_config_dir):
+    path = default_corpus_dir(tmp_config_dir)
+    refresh_corpus(COMPANIES[:2], base_dir=tmp_config_dir)
+    stale_meta = (path / "meta.json").read_text(encoding="utf-8")
+    CorpusModel.fit(COMPANIES).save(path)
+    # Crash after the arrays were replaced but before meta.json
+    (path / "meta.json").write_text(stale_meta, encoding="utf-8")
+    with pytest.raises(ValueError):
+        CorpusModel.load(path)
+    model = refresh_corpus(COMPANIES, base_dir=tmp_config_dir)
+    assert model.keys == ["1", "2", "3"]
+    assert CorpusModel.load(path).keys == ["1", "2", "3"]
+
+
+def test_component_matrix_uses_corpus():
+    model = CorpusModel.fit(COMPANIES)
+    matrix = component_matrix(COMPANIES, ["Python"], RESUME, corpus=model)
+    np.testing.assert_allclose(matrix[:, 3], model.similarities(RESUME))
@@ -0,0 +1,73 @@
+"""Tests for ingot.scoring.features: content hashing and the DB-backed FeatureCache."""
+from __future__ import annotations
+
+import numpy as np
+
+from ingot.scoring.features import FeatureCache, content_hash
+from ingot.scoring.scorer import component_matrix, extract_features
+
+COMPANIES = [
+    {"id": 1, "one_liner": "Python APIs", "long_description": "Rust and GraphQL infra.",
+     "tags": ["B2B"], "stage": "Seed", "isHiring": True},
+    {"id": 2, "one_liner": "Social app", "long_description": "Photos for friends.",
+     "tags": ["Consumer"], "batch": "Summer 2019"},
+]
+
+
+def test_content_hash_key_order_independent():
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_extract_features():
+    feats = extract_features(COMPANIES[0])
+    assert feats.stage_score == 1.0
+    assert feats.tag_bonus == 0.1
+    assert {"python", "rust", "graphql"} <= feats.tech_terms
+    assert feats.one_liner == "python apis"
+    assert feats.is_hiring
+
+
+def test_features_for_counts_hits_and_misses():
+    cache = FeatureCache()
+    cache.features_for(COMPANIES)
+    cache.features_for(COMPANIES)
+    assert (cache.misses, cache.hits) == (2, 2)
+    assert len(cache) == 2
+
+
+def test_cached_features_give_same_components():
+    cache = FeatureCache()
+    feats = cache.features_for(COMPANIES)
+    np.testing.assert_allclose(
+        component_matrix(COMPANIES, ["Python"], "", features=feats),
+        component_matrix(COMPANIES, ["Python"], ""),
+    )
+
+
+async def test_flush_and_load_roundtrip(async_session):
+    cache = FeatureCache()
+    expected = cache.features_for(COMPANIES)
+    assert await cache.flush(async_session) == 2
+    assert await cache.flush(async_session) == 0
+
+    fresh = FeatureCache()
+    assert await fresh.load(async_session, COMPANIES) == 2
+    assert fresh.features_for(COMPANIES) == expected
+    assert fresh.misses == 0
+
+
+async def test_load_all_rows(async_session):
+    cache = FeatureCache()
+    cache.features_for(COMPANIES)
+    await cache.flush(async_session)
+    assert await FeatureCache().load(async_session) == 2
+
+
+async def test_flush_from_two_caches_without_load(async_session):
+    first, second = FeatureCache(), FeatureCache()
+    first.features_for(COMPANIES)
+    second.features_for(COMPANIES + [{"id": 99, "stage": "Seed"}])
+    assert await first.flush(async_session) == 2
+    assert await second.flush(async_session) == 1
+    assert await FeatureCache().load(async_session) == 3
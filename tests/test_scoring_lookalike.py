@@ -0,0 +1,76 @@
+"""Tests for ingot.scoring.lookalike.LookalikeIndex (SimHash + LSH)."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.lookalike import LookalikeIndex, default_lookalike_dir
+
+COMPANIES = [
+    {"id": 1, "long_description": "Payments API for online marketplaces and merchants billing"},
+    {"id": 2, "long_description": "Payments API for online marketplaces and merchant billing"},
+    {"id": 3, "long_description": "Payments platform for marketplaces merchants billing invoices"},
+    {"id": 4, "long_description": "Robotic lawn mowers for suburban homeowners"},
+    {"id": 5, "long_description": "Genomics lab automation for biotech research"},
+]
+
+
+@pytest.fixture
+def corpus():
+    return CorpusModel.fit(COMPANIES)
+
+
+def test_similar_to_finds_near_duplicate(corpus):
+    index = LookalikeIndex.build(corpus)
+    results = index.similar_to("1", k=2)
+    assert results[0][0] == "2"
+    assert results[0][1] > 0.5
+    assert "1" not in [key for key, _ in results]
+
+
+def test_expand_excludes_seeds_and_unknown(corpus):
+    index = LookalikeIndex.build(corpus)
+    results = index.expand(["1", "2", "missing"], k=5)
+    keys = [key for key, _ in results]
+    assert "1" not in keys and "2" not in keys
+    assert keys[0] == "3"
+    assert index.expand(["missing"]) == []
+
+
+def test_save_load_roundtrip_with_and_without_corpus(tmp_config_dir, corpus):
+    index = LookalikeIndex.build(corpus)
+    path = default_lookalike_dir(tmp_config_dir)
+    index.save(path)
+
+    exact = LookalikeIndex.load(path, corpus)
+    assert exact.similar_to("1") == index.similar_to("1")
+
+    estimated = LookalikeIndex.load(path)
+    assert len(estimated) == 5
+    assert estimated.similar_to("1", k=1)[0][0] == "2"
+
+
+def test_candidates_stay_sparse_on_large_corpus():
+    rng = random.Random(0)
+    vocab = [f"term{i}" for i in range(5000)]
+    companies = [
+        {"id": i, "long_description": " ".join(rng.choice(vocab) for _ in range(40))} for i in range(3000)
+    ]
+    # Plant a near-duplicate of company 0
+    words = companies[0]["long_description"].split()
+    companies.append({"id": "dup", "long_description": " ".join(words[:-2] + ["term1", "term2"])})
+    index = LookalikeIndex.build(CorpusModel.fit(companies))
+
+    bits = np.unpackbits(np.asarray(index.signatures), axis=1)
+    assert 0.4 < bits.mean() < 0.6  # real signs, not structural zeros
+    sizes = [len(index._candidates(row)) for row in range(0, len(companies), 30)]
+    assert max(sizes) < len(companies) // 4
+    assert index.similar_to("0", k=1)[0][0] == "dup"
+
+
+def test_invalid_banding():
+    with pytest.raises(ValueError):
+        LookalikeIndex([], None, n_bits=128, n_bands=5)
@@ -0,0 +1,55 @@
+"""Tests for ingot.scoring.parallel.score_leads_parallel."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse as sp
+
+from ingot.scoring.corpus import CorpusModel, term_counts
+from ingot.scoring.parallel import _shard_bounds, score_leads_parallel
+from ingot.scoring.scorer import score_leads
+
+COMPANIES = [
+    {
+        "id": i,
+        "one_liner": "Python APIs" if i % 2 else "Consumer app",
+        "long_description": "Python and Rust infrastructure" if i % 2 else "Photos for friends",
+        "stage": ["Seed", "Series B", "Public"][i % 3],
+        "tags": ["B2B"] if i % 4 == 0 else [],
+        "isHiring": i % 5 == 0,
+    }
+    for i in range(40)
+]
+SKILLS = ["Python", "Rust"]
+RESUME = "Python and Rust backend engineer"
+
+
+def test_shard_bounds_cover_range():
+    bounds = _shard_bounds(10, 4, 3)
+    assert bounds == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    assert _shard_bounds(10, 4, None) == [(0, 10)]
+
+
+async def test_parallel_matches_serial_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        result = await score_leads_parallel(COMPANIES, SKILLS, RESUME, executor=pool, shard_size=7)
+    # Without a corpus the shards' hashed counts form one, as if fitted over the whole list
+    np.testing.assert_allclose(result, score_leads(COMPANIES, SKILLS, RESUME, corpus=CorpusModel.fit(COMPANIES)))
+
+
+async def test_parallel_with_corpus_and_owned_pool():
+    corpus = CorpusModel.fit(COMPANIES)
+    result = await score_leads_parallel(COMPANIES, SKILLS, RESUME, corpus=corpus, max_workers=2, shard_size=10)
+    np.testing.assert_allclose(result, score_leads(COMPANIES, SKILLS, RESUME, corpus=corpus))
+
+
+async def test_parallel_empty():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert (await score_leads_parallel([], SKILLS, executor=pool)).shape == (0,)
+
+
+def test_corpus_from_shard_counts_matches_fit():
+    counts = term_counts(COMPANIES[:15]), term_counts(COMPANIES[15:])
+    merged = CorpusModel.from_counts([str(c["id"]) for c in COMPANIES], sp.vstack(counts, format="csr"))
+    np.testing.assert_allclose(merged.similarities(RESUME), CorpusModel.fit(COMPANIES).similarities(RESUME))
@@ -0,0 +1,111 @@
+"""Tests for ingot.scoring.scorer: per-company and batch lead scoring."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ingot.models.schemas import UserProfile
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.scorer import (
+    COMPONENTS,
+    DEFAULT_WEIGHTS,
+    ScoringWeights,
+    component_matrix,
+    score_lead,
+    score_leads,
+    score_leads_multi,
+)
+
+
+def _company(**overrides) -> dict:
+    base = {
+        "id": 1,
+        "name": "Acme",
+        "one_liner": "Python APIs for developers",
+        "long_description": "Acme builds Python and Rust infrastructure with a GraphQL API for developer tools.",
+        "tags": ["Developer Tools"],
+        "batch": "Winter 2024",
+        "stage": "Seed",
+        "isHiring": True,
+    }
+    base.update(overrides)
+    return base
+
+
+COMPANIES = [
+    _company(),
+    _company(id=2, name="Beta", one_liner="Consumer social app", long_description="A social app for friends.",
+             tags=["Consumer"], stage="Series C", isHiring=False),
+    _company(id=3, name="Gamma", one_liner="", long_description="", tags=[], stage="", batch=""),
+]
+SKILLS = ["Python", "Rust", "GraphQL"]
+RESUME = "Backend engineer with Python, Rust and GraphQL API experience building developer infrastructure."
+
+
+def test_weights_must_sum_to_one():
+    with pytest.raises(AssertionError):
+        ScoringWeights(stack_domain_match=0.9)
+
+
+def test_weights_as_array_matches_components():
+    arr = DEFAULT_WEIGHTS.as_array()
+    assert arr.shape == (len(COMPONENTS),)
+    assert arr.sum() == pytest.approx(1.0)
+
+
+def test_score_lead_in_range():
+    score = score_lead(COMPANIES[0], SKILLS, RESUME)
+    assert 0.0 <= score <= 1.0
+
+
+def test_score_leads_empty():
+    assert score_leads([], SKILLS, RESUME).shape == (0,)
+
+
+def test_component_matrix_shape():
+    matrix = component_matrix(COMPANIES, SKILLS, RESUME)
+    assert matrix.shape == (3, 4)
+    assert ((matrix >= 0.0) & (matrix <= 1.0)).all()
+
+
+def test_non_semantic_components_match_score_lead():
+    """Batch path must reproduce the per-company formula for the three keyword components."""
+    no_semantic = ScoringWeights(
+        stack_domain_match=0.5, company_stage=0.3, job_keyword_match=0.2, semantic_similarity=0.0
+    )
+    batch = score_leads(COMPANIES, SKILLS, RESUME, no_semantic)
+    single = [score_lead(c, SKILLS, RESUME, no_semantic) for c in COMPANIES]
+    np.testing.assert_allclose(batch, single)
+
+
+def test_semantic_ranks_relevant_company_first():
+    matrix = component_matrix(COMPANIES, SKILLS, RESUME)
+    assert matrix[0, 3] > matrix[1, 3]
+    assert matrix[2, 3] == 0.0
+
+
+def test_semantic_zero_without_resume():
+    matrix = component_matrix(COMPANIES, SKILLS, "")
+    assert (matrix[:, 3] == 0.0).all()
+
+
+def test_score_leads_multi_matches_per_profile_scoring():
+    profiles = [
+        UserProfile(name="A", skills=SKILLS, resume_raw_text=RESUME),
+        UserProfile(name="B", skills=["Swift"], resume_raw_text="iOS social apps for friends"),
+        UserProfile(name="C", skills=[], resume_raw_text=""),
+    ]
+    corpus = CorpusModel.fit(COMPANIES)
+    matrix = score_leads_multi(COMPANIES, profiles, corpus=corpus)
+    assert matrix.shape == (3, 3)
+    for j, profile in enumerate(profiles):
+        expected = score_leads(COMPANIES, profile.skills, profile.resume_raw_text, corpus=corpus)
+        np.testing.assert_allclose(matrix[:, j], expected)
+
+
+def test_score_leads_multi_without_corpus_and_empty():
+    profiles = [UserProfile(name="A", skills=SKILLS, resume_raw_text=RESUME)]
+    matrix = score_leads_multi(COMPANIES, profiles)
+    assert matrix.shape == (3, 1)
+    assert matrix[0, 0] > matrix[1, 0]
+    assert score_leads_multi([], profiles).shape == (0, 1)
@@ -0,0 +1,48 @@
+"""Tests for ingot.scoring.skills.SkillMatcher (Aho-Corasick skill matching)."""
+from __future__ import annotations
+
+import random
+
+from ingot.scoring.skills import SkillMatcher, matcher_for
+
+
+def _naive_hits(skills: list[str], text: str) -> int:
+    return sum(1 for s in skills if s.lower() in text)
+
+
+def test_overlapping_patterns_all_found():
+    matcher = SkillMatcher(["Java", "JavaScript", "Script", "C"])
+    assert matcher.skill_hits("we write javascript") == 4
+
+
+def test_case_insensitive_skills_and_duplicates_count():
+    matcher = SkillMatcher(["Python", "python", "Go"])
+    assert matcher.skill_hits("python tools") == 2
+
+
+def test_empty_skill_always_hits():
+    assert SkillMatcher([""]).skill_hits("anything") == 1
+
+
+def test_no_skills_is_falsy():
+    matcher = SkillMatcher([])
+    assert not matcher
+    assert matcher.skill_hits("python") == 0
+
+
+def test_term_overlap():
+    matcher = SkillMatcher(["Python", "Rust"])
+    assert matcher.term_overlap(frozenset({"python", "graphql"})) == 1
+
+
+def test_matches_naive_substring_semantics():
+    rng = random.Random(7)
+    alphabet = "abcde "
+    for _ in range(200):
+        skills = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert SkillMatcher(skills).skill_hits(text) == _naive_hits(skills, text)
+
+
+def test_matcher_for_is_memoised():
+    assert matcher_for(("Python",)) is matcher_for(("Python",))
@@ -0,0 +1,79 @@
+"""Tests for ingot.scoring.topk: streaming bounded-heap lead selection."""
+from __future__ import annotations
+
+import pytest
+
+from ingot.scoring.corpus import CorpusModel
+from ingot.scoring.scorer import score_leads
+from ingot.scoring.topk import TopK, top_k_leads, top_k_leads_async
+
+
+def _companies(n: int):
+    for i in range(n):
+        yield {
+            "id": i,
+            "one_liner": "Python tools" if i % 3 == 0 else "Consumer app",
+            "long_description": "Python and Rust infra" if i % 3 == 0 else "Photos for friends",
+            "stage": ["Seed", "Series C", "Public"][i % 3],
+            "isHiring": i % 2 == 0,
+        }
+
+
+def test_topk_heap_keeps_best_and_breaks_ties_by_arrival():
+    best = TopK(2)
+    for score, name in [(0.1, "a"), (0.9, "b"), (0.5, "c"), (0.9, "d")]:
+        best.push(score, {"name": name})
+    assert [(s, c["name"]) for s, c in best.results()] == [(0.9, "b"), (0.9, "d")]
+
+
+def test_topk_zero_and_negative():
+    best = TopK(0)
+    best.push(1.0, {})
+    assert best.results() == []
+    with pytest.raises(ValueError):
+        TopK(-1)
+
+
+def test_top_k_matches_full_sort():
+    companies = list(_companies(50))
+    corpus = CorpusModel.fit(companies)
+    scores = score_leads(companies, ["Python"], "Python engineer", corpus=corpus)
+    expected = sorted(scores.tolist(), reverse=True)[:5]
+
+    result = top_k_leads(_companies(50), ["Python"], 5, "Python engineer", corpus=corpus, chunk_size=7)
+    assert [s for s, _ in result] == pytest.approx(expected)
+
+
+async def test_resume_without_corpus_is_rejected():
+    with pytest.raises(ValueError):
+        top_k_leads(_companies(10), ["Python"], 3, "Python engineer")
+
+    async def stream():
+        yield {"id": 1}
+
+    with pytest.raises(ValueError):
+        await top_k_leads_async(stream(), ["Python"], 3, "Python engineer")
+
+
+def test_top_k_drains_generator_feed():
+    consumed = []
+
+    def feed():
+        for c in _companies(10):
+            consumed.append(c["id"])
+            yield c
+
+    gen = feed()
+    top_k_leads(gen, ["Python"], 3, chunk_size=4)
+    assert consumed == list(range(10))
+    assert next(gen, None) is None
+
+
+async def test_top_k_leads_async_matches_sync():
+    async def stream():
+        for company in _companies(50):
+            yield company
+    corpus = CorpusModel.fit(list(_companies(50)))
+    expected = top_k_leads(_companies(50), ["Python"], 5, "Python infra", corpus=corpus, chunk_size=8)
+    got = await top_k_leads_async(stream(), ["Python"], 5, "Python infra", corpus=corpus, chunk_size=8)
+    assert got == expected
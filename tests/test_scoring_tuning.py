@@ -0,0 +1,77 @@
+"""Tests for ingot.scoring.tuning: weight grid, sweep metrics, DB outcomes."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ingot.db.models import Email, EmailStatus, Lead, LeadStatus
+from ingot.scoring.tuning import WeightSweep, build_sweep, load_outcomes, weight_grid
+
+
+def test_weight_grid_on_simplex():
+    grid = weight_grid(0.25)
+    assert grid.shape == (35, 4)  # C(4 + 3, 3)
+    np.testing.assert_allclose(grid.sum(axis=1), 1.0)
+
+
+def test_weight_grid_rejects_uneven_step():
+    with pytest.raises(ValueError):
+        weight_grid(0.3)
+
+
+def test_sweep_prefers_informative_component():
+    # Column 0 separates outcomes perfectly; column 1 is anti-correlated
+    components = np.array([
+        [0.9, 0.1, 0.0, 0.0],
+        [0.8, 0.2, 0.0, 0.0],
+        [0.1, 0.9, 0.0, 0.0],
+        [0.2, 0.8, 0.0, 0.0],
+    ])
+    labels = np.array([True, True, False, False])
+    weights = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+    results = WeightSweep(components, labels).evaluate(weights, k=2)
+    assert results[0].weights.stack_domain_match == 1.0
+    assert results[0].roc_auc == pytest.approx(1.0)
+    assert results[0].average_precision == pytest.approx(1.0)
+    assert results[0].precision_at_k == pytest.approx(1.0)
+    assert results[1].roc_auc == pytest.approx(0.0)
+
+
+def test_sweep_requires_both_outcomes():
+    sweep = WeightSweep(np.zeros((2, 4)), np.array([True, True]))
+    with pytest.raises(ValueError):
+        sweep.evaluate(weight_grid(0.5))
+
+
+def test_sweep_shape_validation():
+    with pytest.raises(ValueError):
+        WeightSweep(np.zeros((2, 3)), np.array([True, False]))
+
+
+async def _seed(session):
+    replied = Lead(company_name="Acme", status=LeadStatus.replied)
+    silent = Lead(company_name="Beta", status=LeadStatus.matched)
+    untouched = Lead(company_name="Gamma", status=LeadStatus.discovered)
+    session.add_all([replied, silent, untouched])
+    await session.commit()
+    session.add(Email(subject_a="hi", body="x" * 120, status=EmailStatus.sent, lead_id=silent.id))
+    await session.commit()
+
+
+async def test_load_outcomes(async_session):
+    await _seed(async_session)
+    assert await load_outcomes(async_session) == {"acme": True, "beta": False}
+
+
+async def test_build_sweep_aligns_companies(async_session):
+    await _seed(async_session)
+    companies = [
+        {"name": "Acme", "one_liner": "Python APIs", "stage": "Seed", "isHiring": True},
+        {"name": "Beta", "one_liner": "Social app", "stage": "Public"},
+        {"name": "Unknown", "one_liner": "n/a"},
+    ]
+    sweep = await build_sweep(async_session, companies, ["Python"])
+    assert sweep.components.shape == (2, 4)
+    assert sweep.labels.tolist() == [True, False]
+    best = sweep.evaluate(weight_grid(0.5))[0]
+    assert best.roc_auc == pytest.approx(1.0)
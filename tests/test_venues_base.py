@@ -0,0 +1,118 @@
+"""Tests for ingot.venues.base: venue plugin interface, registry and merged streams."""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from ingot.agents.exceptions import ConfigError
+from ingot.db.models import Venue
+from ingot.venues.base import (
+    VENUE_REGISTRY,
+    VenueLimiter,
+    VenuePolicy,
+    discover_all,
+    get_venue_class,
+    load_venue,
+    merge_streams,
+)
+
+PLUGIN_SOURCE = '''
+from ingot.venues.base import VenueBase, register_venue
+
+
+@register_venue
+class ListVenue(VenueBase):
+    venue_type = "listvenue"
+
+    async def discover(self, http_client):
+        for i in range(self.options.get("n", 3)):
+            async with self.limiter:
+                yield {"id": i, "name": f"{self.name}-{i}"}
+'''
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    (tmp_path / "listvenue.py").write_text(PLUGIN_SOURCE)
+    (tmp_path / "cache").mkdir()  # non-plugin entries in ~/.ingot/venues are ignored
+    yield tmp_path
+    VENUE_REGISTRY.pop("listvenue", None)
+
+
+def test_policy_from_config_json():
+    venue = Venue(venue_name="YC", venue_type="yc", config_json=json.dumps(
+        {"rate_limit_per_sec": 2, "max_concurrency": 1, "cache": False, "batches": ["w25"]}
+    ))
+    plugin = load_venue(venue)
+    assert plugin.policy == VenuePolicy(rate_limit_per_sec=2, max_concurrency=1, cache=False)
+    assert plugin.options == {"batches": ["w25"]}
+    assert plugin.cache is None
+
+
+def test_invalid_config_raises_config_error():
+    with pytest.raises(ConfigError):
+        load_venue(Venue(venue_name="YC", venue_type="yc", config_json="{not json"))
+    with pytest.raises(ConfigError):
+        load_venue(Venue(venue_name="YC", venue_type="yc", config_json='{"max_concurrency": 0}'))
+
+
+def test_plugin_loaded_lazily_from_directory(plugin_dir):
+    assert "listvenue" not in VENUE_REGISTRY
+    assert get_venue_class("listvenue", plugin_dir).venue_type == "listvenue"
+    with pytest.raises(ConfigError):
+        get_venue_class("nope", plugin_dir)
+
+
+async def test_limiter_spaces_requests():
+    limiter = VenueLimiter(VenuePolicy(rate_limit_per_sec=50))
+    start = time.perf_counter()
+    for _ in range(4):
+        async with limiter:
+            pass
+    assert time.perf_counter() - start >= 0.05
+
+
+async def test_limiter_releases_slot_when_cancelled_waiting_for_tick():
+    limiter = VenueLimiter(VenuePolicy(rate_limit_per_sec=1, max_concurrency=1))
+    async with limiter:
+        pass
+    waiter = asyncio.create_task(limiter.__aenter__())  # waits ~1s for the next tick
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    async with asyncio.timeout(3):
+        async with limiter:
+            pass
+
+
+async def test_merge_streams_interleaves_and_propagates_errors():
+    async def slow(tag, n):
+        for i in range(n):
+            await asyncio.sleep(0.001)
+            yield {"v": f"{tag}{i}"}
+
+    async def broken():
+        yield {"v": "ok"}
+        raise RuntimeError("boom")
+
+    merged = [(name, item["v"]) async for name, item in merge_streams([("a", slow("a", 3)), ("b", slow("b", 2))])]
+    assert sorted(merged) == [("a", "a0"), ("a", "a1"), ("a", "a2"), ("b", "b0"), ("b", "b1")]
+    with pytest.raises(RuntimeError):
+        async for _ in merge_streams([("a", slow("a", 100)), ("x", broken())]):
+            pass
+
+
+async def test_discover_all_merges_venues(plugin_dir, tmp_path):
+    venues = [
+        Venue(venue_name="one", venue_type="listvenue", config_json='{"n": 2}'),
+        Venue(venue_name="two", venue_type="listvenue", config_json='{"n": 3, "rate_limit_per_sec": 1000}'),
+    ]
+    async with httpx.AsyncClient() as client:
+        results = [pair async for pair in discover_all(venues, client, plugin_dir, tmp_path / "cache")]
+    assert sorted(item["name"] for _, item in results) == ["one-0", "one-1", "two-0", "two-1", "two-2"]
+    assert {name for name, _ in results} == {"one", "two"}
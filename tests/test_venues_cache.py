@@ -0,0 +1,54 @@
+"""Tests for ingot.venues.cache.VenueCache conditional-GET feed caching."""
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from ingot.venues.cache import VenueCache, default_venue_cache_dir
+
+URL = "https://yc-oss.github.io/api/companies/all.json"
+
+
+def _transport(seen: list[httpx.Request], etag: str = '"v1"', body: bytes = b"[1, 2]") -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=body, headers={"ETag": etag, "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"}
+        )
+    return httpx.MockTransport(handler)
+
+
+async def test_first_fetch_stores_then_304_served_from_disk(tmp_config_dir):
+    seen: list[httpx.Request] = []
+    cache = VenueCache(default_venue_cache_dir(tmp_config_dir))
+    async with httpx.AsyncClient(transport=_transport(seen)) as client:
+        assert await cache.fetch(client, URL) == b"[1, 2]"
+        assert await cache.fetch(client, URL) == b"[1, 2]"
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+    assert seen[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2026 00:00:00 GMT"
+
+
+async def test_changed_feed_replaces_cached_body(tmp_path):
+    cache = VenueCache(tmp_path)
+    cache.put(URL, b"old", etag='"v0"')
+    async with httpx.AsyncClient(transport=_transport([], etag='"v1"', body=b"new")) as client:
+        assert await cache.fetch(client, URL) == b"new"
+    assert cache.get(URL).etag == '"v1"'
+
+
+async def test_error_status_raises(tmp_path):
+    cache = VenueCache(tmp_path)
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.fetch(client, URL)
+
+
+def test_get_missing_and_conditional_headers(tmp_path):
+    cache = VenueCache(tmp_path)
+    assert cache.get(URL) is None
+    assert cache.conditional_headers(None) == {}
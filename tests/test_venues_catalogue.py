@@ -0,0 +1,82 @@
+"""Tests for ingot.venues.catalogue: indexed local yc-oss catalogue."""
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import httpx
+
+from ingot.venues.cache import VenueCache
+from ingot.venues.catalogue import YCCatalogue, load_yc_catalogue, slugify
+from ingot.venues.yc import fetch_yc_companies
+
+COMPANIES = [
+    {
+        "id": i,
+        "name": f"Co{i}",
+        "batch": ["Winter 2025", "Summer 2024"][i % 2],
+        "industry": ["B2B", "Fintech"][i % 3 == 0],
+        "industries": ["B2B", "Engineering, Product and Design"] if i % 3 else ["Fintech"],
+        "tags": ["Developer Tools"] if i % 5 == 0 else ["AI"],
+        "stage": "Early" if i < 100 else "Growth",
+        "isHiring": i % 4 == 0,
+    }
+    for i in range(150)
+]
+
+
+def test_slugify():
+    assert slugify("Winter 2025") == "winter-2025"
+    assert slugify("Engineering, Product and Design") == "engineering-product-and-design"
+
+
+def test_query_matches_linear_filter():
+    catalogue = YCCatalogue(COMPANIES)
+    got = catalogue.query(batch="winter-2025", industry="B2B", is_hiring=True)
+    expected = [
+        c for c in COMPANIES
+        if c["batch"] == "Winter 2025" and "B2B" in c["industries"] and c["isHiring"]
+    ]
+    assert got == expected and got
+
+
+def test_query_sub_industry_tag_stage_and_not_hiring():
+    catalogue = YCCatalogue(COMPANIES)
+    assert all("B2B" in c["industries"] for c in catalogue.query(industry="engineering-product-and-design"))
+    assert [c["id"] for c in catalogue.query(tag="developer-tools", stage="Growth", is_hiring=False)] == [
+        c["id"] for c in COMPANIES if c["id"] % 5 == 0 and c["id"] >= 100 and c["id"] % 4
+    ]
+    assert catalogue.query(batch="winter-2099") == []
+    assert len(catalogue.query()) == 150
+    assert catalogue.batches() == ["summer-2024", "winter-2025"]
+
+
+async def test_load_catalogue_uses_cached_copy(tmp_path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=json.dumps(COMPANIES).encode(), headers={"ETag": '"v1"'})
+
+    cache = VenueCache(tmp_path)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await load_yc_catalogue(client, cache)
+        second = await load_yc_catalogue(client, cache)
+        assert len(requests) == 1
+        stale = await load_yc_catalogue(client, cache, max_age=timedelta(0))
+    assert len(first) == len(second) == len(stale) == 150
+    assert len(requests) == 2 and cache.hits == 1
+
+
+async def test_fetch_yc_companies_answers_from_catalogue_offline():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("network used")
+
+    catalogue = YCCatalogue(COMPANIES)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        batch = await fetch_yc_companies(client, batch="winter-2025", catalogue=catalogue)
+        missing = await fetch_yc_companies(client, batch="winter-2099", catalogue=catalogue)
+    assert len(batch) == 75
+    assert len(missing) == 150
@@ -0,0 +1,91 @@
+"""Tests for ingot.venues.compact: columnar company catalogue and record views."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ingot.scoring.corpus import CorpusModel, company_key
+from ingot.scoring.features import content_hash
+from ingot.scoring.scorer import component_matrix, score_leads
+from ingot.scoring.topk import top_k_leads
+from ingot.venues.compact import CompactCatalogue, CompanyRecord
+from ingot.venues.search import CompanySearchIndex
+from ingot.venues.snapshots import SnapshotStore
+
+COMPANIES = [
+    {
+        "id": i,
+        "name": f"Co{i}",
+        "slug": f"co{i}",
+        "one_liner": "Python APIs for developers" if i % 2 else "Consumer photo app",
+        "long_description": "Builds Python and Rust infrastructure with GraphQL." if i % 2 else "",
+        "team_size": 10 + i,
+        "batch": "Winter 2025",
+        "industry": "B2B",
+        "industries": ["B2B", "Infrastructure"],
+        "tags": ["Developer Tools", "API"] if i % 2 else [],
+        "stage": ["Seed", "Series A", "Growth"][i % 3],
+        "isHiring": i % 2 == 0,
+        "small_logo_thumb_url": "dropped",
+    }
+    for i in range(20)
+] + [{"name": "No Id", "one_liner": "Rust tooling"}]
+
+
+def test_record_mapping_protocol():
+    catalogue = CompactCatalogue.from_dicts(COMPANIES)
+    record = catalogue[1]
+    assert isinstance(record, CompanyRecord)
+    assert record["tags"] == ["Developer Tools", "API"]
+    assert record.get("team_size") == 11 and record.get("isHiring") is False
+    assert "small_logo_thumb_url" not in record
+    last = catalogue[-1]
+    assert last.get("id") is None and last.get("stage", "") == "" and last.get("tags", []) == []
+    with pytest.raises(KeyError):
+        last["batch"]
+    assert record.to_dict() == {k: v for k, v in COMPANIES[1].items() if k != "small_logo_thumb_url"}
+
+
+def test_records_hash_and_serialise_by_content(tmp_path):
+    catalogue = CompactCatalogue.from_dicts(COMPANIES)
+    edited = CompactCatalogue.from_dicts([{**COMPANIES[1], "one_liner": "Now a fintech"}])
+    assert dict(catalogue[1]) == catalogue[1].to_dict()
+    assert content_hash(catalogue[1]) == content_hash(catalogue[1].to_dict())
+    assert content_hash(catalogue[1]) != content_hash(edited[0])
+
+    with CompanySearchIndex() as index:
+        index.upsert(catalogue)
+        assert index.upsert(edited) == 1
+        assert index.search("fintech") == [edited[0].to_dict()]
+    store = SnapshotStore(tmp_path)
+    store.write("compact", catalogue)
+    assert store.open("compact").get("1") == catalogue[1].to_dict()
+
+
+def test_repeated_strings_are_shared():
+    catalogue = CompactCatalogue.from_dicts(COMPANIES)
+    assert catalogue[0]["batch"] is catalogue[5]["batch"]
+    assert catalogue.ids.dtype == np.int64 and catalogue.ids[-1] == -1
+    assert catalogue.is_hiring.sum() == 10
+
+
+def test_scorer_consumes_records_directly():
+    catalogue = CompactCatalogue.from_dicts(COMPANIES)
+    skills, resume = ["Python", "Rust"], "Python and Rust infrastructure engineer"
+    np.testing.assert_allclose(
+        component_matrix(catalogue, skills, resume), component_matrix(COMPANIES, skills, resume)
+    )
+    corpus = CorpusModel.fit(catalogue)
+    np.testing.assert_allclose(
+        score_leads(catalogue, skills, resume, corpus=corpus), score_leads(COMPANIES, skills, resume, corpus=corpus)
+    )
+    best = top_k_leads(iter(catalogue), skills, 3, resume, corpus=corpus)
+    expected = top_k_leads(COMPANIES, skills, 3, resume, corpus=corpus)
+    assert [c["name"] for _, c in best] == [c["name"] for _, c in expected]
+
+
+def test_dedupe_against_known_keys():
+    catalogue = CompactCatalogue.from_dicts(COMPANIES)
+    assert catalogue.key_index[company_key(COMPANIES[3])] == 3
+    fresh = catalogue.dedupe_against(["0", "1", "No Id"])
+    assert [r["name"] for r in fresh] == [f"Co{i}" for i in range(2, 20)]
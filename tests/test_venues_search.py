@@ -0,0 +1,53 @@
+"""Tests for ingot.venues.search: FTS5 company search index."""
+from __future__ import annotations
+
+from ingot.venues.search import CompanySearchIndex, default_search_db_path
+
+COMPANIES = [
+    {"id": 1, "name": "Ledger", "one_liner": "Payments infra", "long_description": "Written in Rust.",
+     "tags": ["Fintech"], "industry": "Fintech", "batch": "Winter 2025", "stage": "Seed", "isHiring": True},
+    {"id": 2, "name": "Ledgerly", "one_liner": "Accounting for SMBs", "long_description": "A Python monolith.",
+     "tags": ["Fintech"], "industry": "Fintech", "batch": "Summer 2024", "stage": "Seed", "isHiring": False},
+    {"id": 3, "name": "Oxide Tools", "one_liner": "Rust developer tools", "long_description": "Rust, rust, Rust.",
+     "tags": ["Developer Tools"], "industry": "B2B", "batch": "Winter 2025", "stage": "Early", "isHiring": True},
+    {"id": 4, "name": "Café Rust", "one_liner": "Coffee", "long_description": "", "tags": [],
+     "industry": "Consumer", "batch": "Winter 2025", "stage": "Growth", "isHiring": False},
+]
+
+
+def test_keyword_and_filters():
+    with CompanySearchIndex() as index:
+        assert index.upsert(COMPANIES) == 4
+        assert {c["id"] for c in index.search("rust")} == {1, 3, 4}
+        assert [c["id"] for c in index.search("rust", industry="fintech", is_hiring=True)] == [1]
+        assert [c["id"] for c in index.search("developer tools")] == [3]
+        assert [c["id"] for c in index.search(batch="winter-2025", is_hiring=False)] == [4]
+        assert index.search("cafe")[0]["name"] == "Café Rust"
+
+
+def test_bm25_ranks_denser_match_first_and_limit():
+    with CompanySearchIndex() as index:
+        index.upsert(COMPANIES)
+        assert index.search("rust")[0]["id"] == 3
+        assert len(index.search("rust", limit=1)) == 1
+
+
+def test_operator_text_is_treated_as_words():
+    with CompanySearchIndex() as index:
+        index.upsert(COMPANIES)
+        assert index.search('rust OR "') == []
+        assert index.search("   ") == index.search()
+
+
+def test_upsert_skips_unchanged_and_replaces_changed(tmp_path):
+    path = default_search_db_path(tmp_path)
+    with CompanySearchIndex(path) as index:
+        index.upsert(COMPANIES)
+    with CompanySearchIndex(path) as index:
+        changed = [{**COMPANIES[1], "long_description": "Now rewritten in Rust."}, *COMPANIES[2:]]
+        assert index.upsert(changed) == 1
+        assert len(index) == 4
+        assert {c["id"] for c in index.search("rust")} == {1, 2, 3, 4}
+        assert index.search("python") == []
+        assert index.delete(["3", "99"]) == 1
+        assert {c["id"] for c in index.search("rust")} == {1, 2, 4}
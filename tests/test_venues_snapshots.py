@@ -0,0 +1,60 @@
+"""Tests for ingot.venues.snapshots: compressed content-addressed snapshot store."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ingot.venues.snapshots import SnapshotStore, default_store_dir
+
+
+def _companies(n: int, changed: int = -1) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "name": f"Company {i}",
+            "slug": f"company-{i}",
+            "one_liner": "Developer tools for Python teams" + (" (updated)" if i == changed else ""),
+            "long_description": "We build infrastructure for developers. " * 5,
+            "tags": ["Developer Tools", "B2B"],
+            "batch": "Winter 2025",
+            "isHiring": i % 2 == 0,
+        }
+        for i in range(n)
+    ]
+
+
+def test_lookup_by_id_and_slug(tmp_path):
+    store = SnapshotStore(default_store_dir(tmp_path))
+    companies = _companies(200)
+    stats = store.write("yc-all-day1", companies)
+    assert stats.companies == stats.new_records == 200
+    snap = store.open("yc-all-day1")
+    assert len(snap) == 200
+    assert snap.get(17) == companies[17]
+    assert snap.get("company-42") == companies[42]
+    assert snap.get("missing") is None and "company-1" in snap
+    assert list(snap) == companies
+
+
+def test_history_shares_unchanged_records(tmp_path):
+    store = SnapshotStore(tmp_path)
+    day1 = store.write("day1", _companies(200))
+    day2 = store.write("day2", _companies(200, changed=5))
+    assert day2.new_records == 1 and day2.reused_records == 199
+    assert store.names() == ["day1", "day2"]
+    assert store.open("day1").get(5)["one_liner"].endswith("teams")
+    assert store.open("day2").get(5)["one_liner"].endswith("(updated)")
+    raw_json = 2 * len(json.dumps(_companies(200)).encode())
+    assert (tmp_path / "pack.bin").stat().st_size < raw_json / 5
+    assert day1.bytes_written < len(json.dumps(_companies(200)).encode()) / 2
+
+
+def test_empty_snapshot_and_bad_name(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.write("empty", [])
+    assert len(store.open("empty")) == 0 and store.open("empty").get("1") is None
+    with pytest.raises(ValueError):
+        store.write("../escape", [])
+    with pytest.raises(FileNotFoundError):
+        store.open("nope")
@@ -0,0 +1,54 @@
+"""Tests for ingot.venues.stream: incremental JSON-array parsing."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ingot.venues.stream import JSONArrayParser, iter_json_array
+
+DOC = [{"id": 1, "name": "Café \"Ünïcode\"", "tags": ["a", "b"]}, {"id": 2, "nested": {"x": [1, 2]}}, 3, "s", None]
+
+
+def _parse_in_chunks(raw: bytes, size: int) -> list:
+    parser = JSONArrayParser()
+    out = []
+    for i in range(0, len(raw), size):
+        out.extend(parser.feed(raw[i:i + size]))
+    parser.close()
+    return out
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+def test_chunking_is_transparent(size):
+    raw = json.dumps(DOC, indent=1, ensure_ascii=False).encode("utf-8")
+    assert _parse_in_chunks(raw, size) == DOC
+
+
+def test_number_split_across_chunks():
+    parser = JSONArrayParser()
+    assert list(parser.feed(b"[12")) == []
+    assert list(parser.feed(b"34, 5]")) == [1234, 5]
+    parser.close()
+
+
+def test_elements_yielded_before_document_ends():
+    parser = JSONArrayParser()
+    assert list(parser.feed(b'[{"id": 1}, {"id"')) == [{"id": 1}]
+
+
+def test_empty_array():
+    assert _parse_in_chunks(b"  [ ]  ", 1) == []
+
+
+@pytest.mark.parametrize("raw", [b'[{"id": 1}', b'{"id": 1}', b"[1 2]", b"[1,]", b"[1] x"])
+def test_malformed_documents_raise(raw):
+    with pytest.raises(ValueError):
+        _parse_in_chunks(raw, 3)
+
+
+async def test_iter_json_array():
+    async def chunks():
+        for part in (b"[1,", b' {"a"', b": 2}]"):
+            yield part
+    assert [v async for v in iter_json_array(chunks())] == [1, {"a": 2}]
@@ -0,0 +1,214 @@
+"""Tests for ingot.venues.yc.fetch_yc_companies against a mocked yc-oss API."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ingot.db.models import Venue
+from ingot.http_client import (
+    AdaptiveConcurrencyTransport,
+    HttpClientConfig,
+    close_http_client,
+    get_http_client,
+)
+from ingot.scoring.features import content_hash
+from ingot.venues.base import load_venue
+from ingot.venues.cache import VenueCache
+from ingot.venues.yc import (
+    YC_OSS_BASE_URL,
+    YCDelta,
+    default_snapshot_path,
+    diff_companies,
+    fetch_yc_companies,
+    fetch_yc_delta,
+    fetch_yc_many,
+    iter_yc_companies,
+    record_venue_run,
+)
+
+COMPANIES = [{"id": i, "name": f"Co{i}", "batch": "Winter 2025", "industry": "B2B"} for i in range(150)]
+
+
+def _client(requests: list[httpx.Request], missing: set[str] = frozenset()) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path in missing:
+            return httpx.Response(404)
+        if request.headers.get("If-None-Match") == '"all"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=json.dumps(COMPANIES).encode(), headers={"ETag": '"all"'})
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def test_fetch_all():
+    requests: list[httpx.Request] = []
+    async with _client(requests) as client:
+        companies = await fetch_yc_companies(client)
+    assert len(companies) == 150
+    assert str(requests[0].url) == f"{YC_OSS_BASE_URL}/companies/all.json"
+
+
+async def test_missing_batch_falls_back_to_all():
+    requests: list[httpx.Request] = []
+    async with _client(requests, missing={"/api/batches/winter-2099.json"}) as client:
+        companies = await fetch_yc_companies(client, batch="winter-2099")
+    assert len(companies) == 150
+    assert [r.url.path for r in requests] == ["/api/batches/winter-2099.json", "/api/companies/all.json"]
+
+
+async def test_iter_yc_companies_streams_with_fallback():
+    requests: list[httpx.Request] = []
+    async with _client(requests, missing={"/api/batches/winter-2099.json"}) as client:
+        companies = [c async for c in iter_yc_companies(client, batch="winter-2099")]
+    assert companies == COMPANIES
+    assert [r.url.path for r in requests] == ["/api/batches/winter-2099.json", "/api/companies/all.json"]
+
+
+class SlowFeed(httpx.AsyncByteStream):
+    """COMPANIES as a JSON array, one record per chunk with a pause between chunks."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def __aiter__(self):
+        body = json.dumps(COMPANIES).encode()
+        for start in range(0, len(body), 64):
+            self.sent += 1
+            await asyncio.sleep(0)
+            yield body[start:start + 64]
+
+
+def _mock_network(client: httpx.AsyncClient, stream: httpx.AsyncByteStream) -> None:
+    layer = client._transport
+    while not isinstance(layer, AdaptiveConcurrencyTransport):
+        layer = layer._transport
+    layer._transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=stream))
+
+
+@pytest.mark.parametrize("cached", [False, True])
+async def test_iter_yc_companies_streams_through_shared_client(tmp_path, cached):
+    await close_http_client()
+    stream = SlowFeed()
+    _mock_network(get_http_client(HttpClientConfig(cache_path=tmp_path / "http_cache.db" if cached else None)), stream)
+    try:
+        companies = iter_yc_companies(get_http_client())
+        await anext(companies)
+        # The first record arrives while the feed is still downloading
+        assert stream.sent < 5
+        assert len([c async for c in companies]) == len(COMPANIES) - 1
+    finally:
+        await close_http_client()
+
+
+async def test_cached_fetch_revalidates(tmp_path):
+    requests: list[httpx.Request] = []
+    cache = VenueCache(tmp_path)
+    async with _client(requests) as client:
+        first = await fetch_yc_companies(client, cache=cache)
+        second = await fetch_yc_companies(client, cache=cache)
+    assert first == second
+    assert cache.hits == 1
+
+
+def test_diff_companies():
+    previous = {"1": content_hash({"id": 1}), "2": "stale", "9": "gone"}
+    companies = [{"id": 1}, {"id": 2}, {"id": 3}]
+    delta, current = diff_companies(companies, previous)
+    assert [c["id"] for c in delta.added] == [3]
+    assert [c["id"] for c in delta.changed] == [2]
+    assert delta.removed == ["9"]
+    assert set(current) == {"1", "2", "3"}
+
+
+async def test_fetch_yc_delta_second_run_is_empty(tmp_config_dir):
+    path = default_snapshot_path(tmp_config_dir)
+    async with _client([]) as client:
+        first = await fetch_yc_delta(client, path)
+        first.commit_snapshot()
+        second = await fetch_yc_delta(client, path)
+    assert len(first.added) == 150 and first.total == 150
+    assert not second
+    assert second.updated == []
+
+
+async def test_fetch_yc_delta_uncommitted_run_is_reported_again(tmp_config_dir, async_session):
+    path = default_snapshot_path(tmp_config_dir)
+    venue = Venue(venue_name="YC", venue_type="yc")
+    async_session.add(venue)
+    await async_session.commit()
+    async with _client([]) as client:
+        failed = await fetch_yc_delta(client, path)  # scoring fails: the run is never recorded
+        retried = await fetch_yc_delta(client, path)
+        assert not path.exists()
+        assert [c["id"] for c in retried.added] == [c["id"] for c in failed.added]
+        await record_venue_run(async_session, venue, retried)
+        assert not await fetch_yc_delta(client, path)
+
+
+async def test_record_venue_run(async_session):
+    venue = Venue(venue_name="YC", venue_type="yc")
+    async_session.add(venue)
+    await async_session.commit()
+    delta = YCDelta(added=[{"id": 1}, {"id": 2}], changed=[{"id": 3}])
+    await record_venue_run(async_session, venue, delta)
+    assert venue.lead_count_discovered == 2
+    assert venue.last_run_at is not None
+
+
+def test_default_snapshot_path_per_feed(tmp_path):
+    assert default_snapshot_path(tmp_path, batch="winter-2025").name == "yc-batch-winter-2025.hashes.json"
+    assert default_snapshot_path(tmp_path, industry="b2b").name == "yc-industry-b2b.hashes.json"
+
+
+async def test_fetch_yc_many_bounds_concurrency_and_dedupes():
+    in_flight = peak = 0
+    offsets: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        # Every feed overlaps: half its companies are shared with all other feeds
+        offset = 1000 * (1 + offsets.setdefault(request.url.path, len(offsets)))
+        body = COMPANIES[:75] + [{**c, "id": c["id"] + offset} for c in COMPANIES[75:]]
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        companies = [
+            c async for c in fetch_yc_many(
+                client, batches=["w24", "s24", "w25", "w24"], industries=["b2b"], max_concurrency=2
+            )
+        ]
+    ids = [c["id"] for c in companies]
+    assert len(ids) == len(set(ids)) == 75 + 4 * 75
+    assert peak == 2
+
+
+async def test_small_feeds_are_not_rejected_but_small_catalogue_is():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=json.dumps(COMPANIES[:5]).encode())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        companies = [c async for c in fetch_yc_many(client, batches=["w25"], industries=["b2b"])]
+        assert len(companies) == 5 and len(requests) == 2
+        with pytest.raises(AssertionError):
+            await fetch_yc_companies(client)
+    assert len(requests) == 3  # the failed sanity check is not retried
+
+
+async def test_yc_venue_plugin_streams_configured_batches(tmp_path):
+    requests: list[httpx.Request] = []
+    venue = Venue(venue_name="YC", venue_type="yc", config_json=json.dumps({"batches": ["w25", "s24"]}))
+    plugin = load_venue(venue, cache_dir=tmp_path)
+    async with _client(requests) as client:
+        companies = [c async for c in plugin.discover(client)]
+    assert len(companies) == 150
+    assert sorted(r.url.path for r in requests) == ["/api/batches/s24.json", "/api/batches/w25.json"]